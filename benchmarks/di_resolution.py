@@ -0,0 +1,103 @@
+"""Стоимость резолва сервисов из AuthContainer на один запрос.
+
+Сравнивает текущую проводку (stateless-граф - Singleton) с прежней, где
+каждый запрос заново собирал CryptContext, TokenSpecification,
+ClaimsFactory и JwtService.
+
+Запуск:
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.di_resolution
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from dependency_injector import providers
+
+from src.infra.config import settings
+from src.infra.crypto.bcrypt import BcryptPasswordHasherImpl
+
+from src.bootstrap.wiring import AuthContainer
+
+
+STATELESS_PROVIDERS = (
+    'key_provider',
+    'token_specification',
+    'claims_factory',
+    'jwt_service',
+)
+
+
+def make_container() -> AuthContainer:
+    container = AuthContainer()
+    container.config.from_pydantic(settings)
+    return container
+
+
+def as_factory(
+    provider: providers.Singleton,  # type: ignore[type-arg]
+    shared: set[providers.Provider],  # type: ignore[type-arg]
+) -> providers.Factory:  # type: ignore[type-arg]
+    """Factory с теми же аргументами.
+
+    Вложенные анонимные Singleton (TokenRealm, TokenLifetime) тоже становятся
+    Factory, как в прежней проводке; провайдеры контейнера из shared остаются
+    ссылками и переопределяются сами.
+    """
+
+    def convert(value: object) -> object:
+        if isinstance(value, providers.Singleton) and value not in shared:
+            return as_factory(value, shared)
+        return value
+
+    return providers.Factory(
+        provider.cls,
+        *map(convert, provider.args),
+        **{name: convert(value) for name, value in provider.kwargs.items()},
+    )
+
+
+def make_per_request_container() -> AuthContainer:
+    """Контейнер с прежней проводкой: всё через providers.Factory."""
+    container = make_container()
+    shared = set(container.providers.values())
+
+    for name in STATELESS_PROVIDERS:
+        provider: providers.Singleton = getattr(container, name)  # type: ignore[type-arg]
+        provider.override(as_factory(provider, shared))
+
+    container.password_hasher.override(providers.Factory(BcryptPasswordHasherImpl))
+    return container
+
+
+def measure(resolve: Callable[[], object], iterations: int) -> float:
+    """Среднее время одного резолва в микросекундах."""
+    resolve()  # прогрев: singletons, импорт ленивых зависимостей
+
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        resolve()
+    elapsed = time.perf_counter_ns() - started
+
+    return elapsed / iterations / 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--iterations', type=int, default=2_000)
+    args = parser.parse_args()
+
+    containers = {
+        'per-request (before)': make_per_request_container(),
+        'singleton (after)': make_container(),
+    }
+
+    for label, container in containers.items():
+        for service in ('login_service', 'register_service'):
+            provider = getattr(container, service)
+            us = measure(provider, args.iterations)
+            print(f'{label:<22} {service:<18} {us:>10.1f} us/request')
+
+
+if __name__ == '__main__':
+    main()
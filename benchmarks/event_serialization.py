@@ -0,0 +1,109 @@
+"""Событий в секунду и байт на событие: model_dump + json против сериализаторов.
+
+Прежний путь: event.as_dict() (model_dump) и json.dumps при отправке,
+на приёме json.loads и model_validate. Новый - тот, что в сервисе: payload
+outbox от сериализатора, собранного на тип события (`EventSerializers`),
+и кодек relay поверх него; на приёме декодер по заголовкам type/v. orjson и
+msgpack участвуют, только если установлены.
+
+Запуск:
+    python -m benchmarks.event_serialization
+"""
+
+import argparse
+import json
+import time
+from functools import partial
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from src.domain.events import AccountRegistered
+from src.domain.value_objects import Email
+
+from src.infra.messaging.outbox_publisher import UserRegisteredPublisher, event_decoders
+from src.infra.messaging.serialization import (
+    Codec,
+    EventSerializer,
+    EventSerializers,
+    JsonCodecImpl,
+    MsgpackCodecImpl,
+    msgpack,
+    orjson,
+)
+from src.infra.messaging.transport import encode_headers
+
+
+def per_second(n: int, call: Callable[[], Any]) -> float:
+    call()  # прогрев
+    started = time.perf_counter()
+    for _ in range(n):
+        call()
+    return n / (time.perf_counter() - started)
+
+
+def headers_size(headers: dict[str, str]) -> int:
+    return sum(len(name) + len(value.encode()) for name, value in headers.items())
+
+
+def encode(
+    serializer: EventSerializer[AccountRegistered], event: AccountRegistered, codec: Codec
+) -> bytes:
+    """Путь сервиса: payload в outbox, байты для брокера кодеком relay."""
+    return codec.encode(serializer.payload(event))
+
+
+def report(
+    label: str, encoded: float, decoded: float, value: bytes, headers: int
+) -> None:
+    print(
+        f'{label:<24} {encoded:>12,.0f} enc/s {decoded:>12,.0f} dec/s '
+        f'{len(value):>5} B payload {headers:>4} B headers'
+    )
+
+
+def run(n: int) -> None:
+    event = AccountRegistered(email=Email('bench@example.com'), account_id=uuid4())
+    publisher = UserRegisteredPublisher()
+
+    # Прежний путь: заголовки без content-type
+    value = json.dumps(event.as_dict(), separators=(',', ':')).encode()
+    report(
+        'model_dump + json',
+        per_second(
+            n, lambda: json.dumps(event.as_dict(), separators=(',', ':')).encode()
+        ),
+        per_second(n, lambda: AccountRegistered.model_validate(json.loads(value))),
+        value,
+        headers_size({name: str(header) for name, header in publisher.headers.items()}),
+    )
+
+    serializer = EventSerializers().get(AccountRegistered)
+    codecs: list[tuple[str, Codec]] = [
+        ('serializer orjson' if orjson else 'serializer json', JsonCodecImpl())
+    ]
+    if msgpack is not None:
+        codecs.append(('serializer msgpack', MsgpackCodecImpl()))
+
+    for label, codec in codecs:
+        headers = encode_headers(publisher.headers, codec)
+        encoded = encode(serializer, event, codec)
+        report(
+            label,
+            per_second(n, partial(encode, serializer, event, codec)),
+            per_second(n, partial(event_decoders.decode, headers, encoded)),
+            encoded,
+            headers_size(headers),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--events', type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(args.events)
+
+
+if __name__ == '__main__':
+    main()
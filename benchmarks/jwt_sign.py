@@ -0,0 +1,68 @@
+"""Выпуск токенов в секунду: python-jose против HS256Signer, поштучно и парой.
+
+Запуск:
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.jwt_sign
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from src.domain.entities import Account
+from src.domain.ports import JwtService
+from src.domain.value_objects import Email, PasswordHash
+
+from src.infra.jwt_service.compact import CompactJwtServiceImpl
+from src.infra.jwt_service.jose import JoseJwtServiceImpl
+
+from src.bootstrap.wiring import AuthContainer
+
+
+async def tokens_per_second(service: JwtService, account: Account, n: int) -> float:
+    await service.issue_access(account, scopes=[])  # прогрев
+
+    started = time.perf_counter()
+    for _ in range(n):
+        await service.issue_access(account, scopes=[])
+    return n / (time.perf_counter() - started)
+
+
+async def pairs_per_second(service: JwtService, account: Account, n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        await service.issue_pair(account, scopes=[])
+    return n / (time.perf_counter() - started)
+
+
+async def run(n: int) -> None:
+    container = AuthContainer()
+    claims_factory = container.claims_factory()
+    key_provider = container.key_provider()
+    spec = container.token_specification()
+    services: dict[str, JwtService] = {
+        'jose': JoseJwtServiceImpl(claims_factory, key_provider, spec),
+        'compact (HS256Signer)': CompactJwtServiceImpl(
+            claims_factory, key_provider, spec
+        ),
+    }
+    account = Account(uuid4(), Email('bench@example.com'), PasswordHash(''))
+
+    for label, service in services.items():
+        rate = await tokens_per_second(service, account, n)
+        print(f'{label:<24} {rate:>12,.0f} tokens/s')
+
+        rate = await pairs_per_second(service, account, n)
+        print(f'{label:<24} {rate:>12,.0f} pairs/s (issue_pair)')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--tokens', type=int, default=20_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.tokens))
+
+
+if __name__ == '__main__':
+    main()
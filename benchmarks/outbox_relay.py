@@ -0,0 +1,133 @@
+"""Сообщений outbox в секунду от строки в Postgres до ответа брокера.
+
+Relay публикует через продюсер в брокер-заглушку с задержкой ответа, как у
+сетевого брокера: видно, сколько дают linger (пачки) и сжатие по сравнению
+с отправкой по одной записи. Строки разложены по KEYS ключам: порядок
+внутри ключа соблюдается, ключи публикуются параллельно.
+Таблица outbox очищается до и после прогона.
+
+Запуск:
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.outbox_relay
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import timedelta
+
+import sqlalchemy as sa
+
+from src.infra.config import settings
+from src.infra.messaging.broker import Compression, MemoryBrokerImpl
+from src.infra.messaging.producer import BatchingProducerImpl
+from src.infra.messaging.relay import OutboxRelay
+from src.infra.messaging.transport import ProducerTransportImpl
+from src.infra.orm.models import Outbox
+from src.infra.orm.session import (
+    SessionFactory,
+    async_session,
+    make_async_session_factory,
+    make_engine,
+)
+
+
+TOPIC = 'benchmark.outbox'
+PARTITIONS = 3
+# Аккаунтов, по которым разложены события
+KEYS = 1_000
+# (название, linger, max_batch_size, сжатие); max_batch_size=1 - запрос на запись
+SCENARIOS: tuple[tuple[str, timedelta, int, Compression], ...] = (
+    ('record per request', timedelta(), 1, 'none'),
+    ('linger=5ms', timedelta(milliseconds=5), 16_384, 'none'),
+    ('linger=5ms gzip', timedelta(milliseconds=5), 16_384, 'gzip'),
+)
+
+
+async def fill(session_factory: SessionFactory, n: int) -> None:
+    async with async_session(session_factory) as db:
+        await db.execute(sa.delete(Outbox))
+        await db.execute(
+            sa.insert(Outbox),
+            [
+                {
+                    'topic': TOPIC,
+                    'key': f'account-{i % KEYS}',
+                    'headers': {'type': 'Benchmark'},
+                    'payload': {'i': i},
+                }
+                for i in range(n)
+            ],
+        )
+
+
+async def messages_per_second(
+    session_factory: SessionFactory,
+    n: int,
+    relays: int,
+    latency: timedelta,
+    scenario: tuple[str, timedelta, int, Compression],
+) -> tuple[float, int]:
+    _, linger, max_batch_size, compression = scenario
+    await fill(session_factory, n)
+    broker = MemoryBrokerImpl(PARTITIONS, latency=latency)
+    producer = BatchingProducerImpl(
+        broker, linger=linger, max_batch_size=max_batch_size, compression=compression
+    )
+    transport = ProducerTransportImpl(producer)
+    batch_size = settings.outbox.batch_size
+
+    async def drain(relay: OutboxRelay) -> None:
+        while await relay.run_once():
+            pass
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            drain(
+                OutboxRelay(
+                    session_factory,
+                    transport,
+                    batch_size=batch_size,
+                    max_in_flight=batch_size,
+                )
+            )
+            for _ in range(relays)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    return n / elapsed, broker.requests
+
+
+async def run(n: int, relays: int, latency: timedelta) -> None:
+    engine = make_engine(settings.database_url, pool_size=relays)
+    session_factory = make_async_session_factory(engine)
+
+    try:
+        for scenario in SCENARIOS:
+            rate, requests = await messages_per_second(
+                session_factory, n, relays, latency, scenario
+            )
+            label = scenario[0]
+            print(f'{label:<24} {rate:>10,.0f} msg/s {requests:>8} broker requests')
+    finally:
+        async with async_session(session_factory) as db:
+            await db.execute(sa.delete(Outbox))
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--messages', type=int, default=10_000)
+    parser.add_argument('--relays', type=int, default=2)
+    parser.add_argument(
+        '--latency-ms', type=float, default=2.0, help='ответ брокера на пачку'
+    )
+    args = parser.parse_args()
+
+    latency = timedelta(milliseconds=args.latency_ms)
+    asyncio.run(run(args.messages, args.relays, latency))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""partition outbox by day
+
+Revision ID: 1997d95a45c8
+Revises: 0341d6635f07
+Create Date: 2026-10-18 05:39:39.754682
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1997d95a45c8'
+down_revision: Union[str, Sequence[str], None] = '0341d6635f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Дни наперёд, как у python -m src.infra.messaging.retention
+PREMAKE_DAYS = 3
+COLUMNS = (
+    'id, topic, key, payload, headers, status, attempts, next_retry_at, error, '
+    'published_at, kafka_partition, kafka_offset'
+)
+INDEXES = ('ix_partial_next_retry_at', 'ix_partial_publishing_lease', 'ix_partial_pending_key', 'ix_partial_dlq')
+
+
+def create_indexes() -> None:
+    op.create_index('ix_partial_next_retry_at', 'outbox', ['next_retry_at'], unique=False, postgresql_where=sa.text("status IN ('NEW', 'FAILED')"), postgresql_using='btree')
+    op.create_index('ix_partial_publishing_lease', 'outbox', ['next_retry_at'], unique=False, postgresql_where=sa.text("status = 'PUBLISHING'"), postgresql_using='btree')
+    op.create_index('ix_partial_pending_key', 'outbox', ['key', 'id'], unique=False, postgresql_where=sa.text("status IN ('NEW', 'FAILED', 'PUBLISHING')"), postgresql_using='btree')
+    op.create_index('ix_partial_dlq', 'outbox', ['id'], unique=False, postgresql_where=sa.text("status = 'DLQ'"), postgresql_using='btree')
+
+
+def outbox_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('outbox_id_seq')"), nullable=False),
+        sa.Column('topic', sa.String(length=80), nullable=False),
+        sa.Column('key', sa.String(length=120), nullable=True),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('headers', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('status', postgresql.ENUM(name='outboxstatus', create_type=False), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_retry_at', sa.DateTime(), nullable=True),
+        sa.Column('error', sa.String(length=256), nullable=True),
+        sa.Column('published_at', sa.DateTime(), nullable=True),
+        sa.Column('kafka_partition', sa.Integer(), nullable=True),
+        sa.Column('kafka_offset', sa.BigInteger(), nullable=True),
+    ]
+
+
+def create_day_partition(day: date) -> None:
+    op.execute(
+        f"CREATE TABLE outbox_p{day:%Y%m%d} PARTITION OF outbox "
+        f"FOR VALUES FROM ('{day}') TO ('{day + timedelta(days=1)}')"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Старая таблица уходит в сторону, её индексы освобождают имена
+    op.execute('ALTER TABLE outbox RENAME TO outbox_unpartitioned')
+    op.execute('ALTER TABLE outbox_unpartitioned RENAME CONSTRAINT outbox_pkey TO outbox_unpartitioned_pkey')
+    for index in INDEXES:
+        op.drop_index(index, table_name='outbox_unpartitioned')
+
+    op.create_table('outbox',
+    *outbox_columns(),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('LOCALTIMESTAMP'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute('ALTER SEQUENCE outbox_id_seq OWNED BY outbox.id')
+    create_indexes()
+    op.execute('CREATE TABLE outbox_default PARTITION OF outbox DEFAULT')
+
+    # Дата создания прежних строк не хранилась: ближе всего - время публикации
+    created_at = 'LEAST(COALESCE(published_at, next_retry_at, LOCALTIMESTAMP), LOCALTIMESTAMP)'
+    bind = op.get_bind()
+    first, today = bind.execute(
+        sa.text(f'SELECT min({created_at})::date, current_date FROM outbox_unpartitioned')
+    ).one()
+    day = first or today
+    while day <= today + timedelta(days=PREMAKE_DAYS):
+        create_day_partition(day)
+        day += timedelta(days=1)
+
+    op.execute(
+        f'INSERT INTO outbox ({COLUMNS}, created_at) '
+        f'SELECT {COLUMNS}, {created_at} FROM outbox_unpartitioned'
+    )
+    op.drop_table('outbox_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE outbox RENAME TO outbox_partitioned')
+    op.execute('ALTER TABLE outbox_partitioned RENAME CONSTRAINT outbox_pkey TO outbox_partitioned_pkey')
+    for index in INDEXES:
+        op.drop_index(index, table_name='outbox_partitioned')
+
+    op.create_table('outbox',
+    *outbox_columns(),
+    sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute('ALTER SEQUENCE outbox_id_seq OWNED BY outbox.id')
+    op.execute(f'INSERT INTO outbox ({COLUMNS}) SELECT {COLUMNS} FROM outbox_partitioned')
+    # Секции удаляются вместе с родителем
+    op.drop_table('outbox_partitioned')
+    create_indexes()
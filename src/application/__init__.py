@@ -1,14 +1,24 @@
+from .services.introspect import IntrospectionService
 from .services.login import LoginResult, LoginService
+from .services.me import AccountService
+from .services.refresh import RefreshResult, RefreshService
 from .services.register import RegisterCommand, RegisterResult, RegisterService
+from .services.sessions import SessionPage, SessionService
 from .uow import SqlAlchemyUoW, UnitOfWork
 
 
 __all__ = [
+    'AccountService',
+    'IntrospectionService',
     'LoginResult',
     'LoginService',
+    'RefreshResult',
+    'RefreshService',
     'RegisterCommand',
     'RegisterResult',
     'RegisterService',
+    'SessionPage',
+    'SessionService',
     'SqlAlchemyUoW',
     'UnitOfWork',
 ]
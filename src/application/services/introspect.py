@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.domain.exceptions import InvalidTokenError
+from src.domain.ports import JwtService, RevokeStore
+from src.domain.value_objects.token import TokenIntrospection
+
+from src.application.services.revocation import ensure_not_revoked
+
+
+@dataclass(frozen=True)
+class IntrospectionService:
+    jwt_service: JwtService
+    revoke_store: RevokeStore
+
+    async def introspect(self, tokens: Sequence[str]) -> list[TokenIntrospection]:
+        """
+        State of every token in batch, order is preserved.
+
+        Invalid, expired, revoked or foreign tokens are reported as inactive,
+        not raised: one bad token must not fail the whole batch of a gateway.
+        """
+
+        results = await self.jwt_service.introspect(tokens)
+        return [await self._check_revoked(result) for result in results]
+
+    async def _check_revoked(self, result: TokenIntrospection) -> TokenIntrospection:
+        if result.claims is None:
+            return result
+
+        try:
+            await ensure_not_revoked(self.revoke_store, result.claims)
+        except InvalidTokenError:
+            return TokenIntrospection(active=False)
+        return result
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
-from src.domain.ports import JwtService, PasswordHasher
+from src.domain.factories import ClaimsFactory
+from src.domain.ports import JwtService, PasswordHasher, RefreshStore
 from src.domain.value_objects import AccessToken, Email, Password, RefreshToken
 
 from src.application.exceptions import InvalidCredentialsError
+from src.application.services.refresh import issue_session_pair
 from src.application.uow import UnitOfWork
 
 
@@ -18,6 +20,8 @@ class LoginService:
     uow: UnitOfWork
     password_hasher: PasswordHasher
     jwt_service: JwtService
+    claims_factory: ClaimsFactory
+    refresh_store: RefreshStore
 
     async def login(self, email: Email, password: Password) -> LoginResult:
         """
@@ -28,7 +32,7 @@ class LoginService:
             password: User password
 
         Returns:
-            Access and refresh token
+            Access and refresh token, refresh token starts a new session family
 
         Raises:
             InvalidCredentialsError: Email or password is not valid
@@ -37,13 +41,15 @@ class LoginService:
         async with self.uow as uow:
             account = await uow.accounts.get_by_email(email)
 
-        if not account:
+        if not account or account.identifier is None:
             raise InvalidCredentialsError('Account does not found', ctx={'email': email})
 
         if not await self.password_hasher.verify(password, account.password_hash):
             raise InvalidCredentialsError('Incorrect password', ctx={'email': email})
 
-        access_token = await self.jwt_service.issue_access(account, scopes=[])
-        refresh_token = await self.jwt_service.issue_refresh(account)
+        pair, session = await issue_session_pair(
+            self.jwt_service, self.claims_factory, account.identifier
+        )
+        await self.refresh_store.save(session)
 
-        return LoginResult(access_token, refresh_token)
+        return LoginResult(pair.access_token, pair.refresh_token)
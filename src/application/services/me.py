@@ -1,9 +1,37 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from src.domain.entities import Account
+from src.domain.exceptions import InvalidTokenError
+from src.domain.ports import JwtService, RevokeStore
 from src.domain.value_objects.account import AccessToken
 
+from src.application.services.revocation import ensure_not_revoked
+from src.application.uow import UnitOfWork
 
-@dataclass
+
+@dataclass(frozen=True)
 class AccountService:
-    def get_account(self, token: AccessToken) -> Account: ...
+    uow: UnitOfWork
+    jwt_service: JwtService
+    revoke_store: RevokeStore
+
+    async def get_account(self, token: AccessToken) -> Account:
+        """
+        Account of access token owner.
+
+        Raises:
+            InvalidTokenError: Token is not valid or revoked, or account does not
+                exist anymore
+        """
+
+        claims = await self.jwt_service.verify_access(token)
+        await ensure_not_revoked(self.revoke_store, claims)
+
+        async with self.uow as uow:
+            account = await uow.accounts.get_by_id(UUID(claims.sub))
+
+        if not account or not account.is_active:
+            raise InvalidTokenError('Account does not found', ctx={'sub': claims.sub})
+
+        return account
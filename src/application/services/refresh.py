@@ -0,0 +1,119 @@
+import hashlib
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.entities import RefreshSession
+from src.domain.exceptions import InvalidTokenError, RefreshTokenReusedError
+from src.domain.factories import ClaimsFactory
+from src.domain.ports import JwtService, RefreshStore, RevokeStore
+from src.domain.value_objects import (
+    AccessToken,
+    Claims,
+    RefreshFamilyId,
+    RefreshSessionId,
+    RefreshToken,
+    TokenPair,
+)
+
+from src.application.services.revocation import ensure_not_revoked
+
+
+def refresh_token_hash(token: RefreshToken) -> str:
+    """Store keeps digest only: leaked store does not leak usable tokens."""
+    return hashlib.sha256(token.value.encode()).hexdigest()
+
+
+def session_ids(claims: Claims) -> tuple[RefreshSessionId, RefreshFamilyId, int]:
+    """
+    Session id, family and expiration of refresh token.
+
+    Raises:
+        InvalidTokenError: Token is not bound to a session (issued before sessions)
+    """
+
+    if not (claims.jti and claims.fid and claims.exp):
+        raise InvalidTokenError('Refresh token without session', ctx={'jti': claims.jti})
+
+    return RefreshSessionId(claims.jti), RefreshFamilyId(claims.fid), claims.exp
+
+
+async def issue_session_pair(
+    jwt_service: JwtService,
+    claims_factory: ClaimsFactory,
+    account_id: UUID,
+    parent: Claims | None = None,
+) -> tuple[TokenPair, RefreshSession]:
+    """
+    Token pair and server side of its refresh token.
+
+    Args:
+        jwt_service: Signs claims
+        claims_factory: Builds claims
+        account_id: Token owner
+        parent: Claims of rotated refresh token, new family (login) if None
+    """
+
+    fid = parent.fid if parent else None
+    access, refresh = claims_factory.pair_claims(str(account_id), fid=fid)
+    access_token, refresh_token = await jwt_service.sign_claims([access, refresh])
+    pair = TokenPair(AccessToken(access_token), RefreshToken(refresh_token))
+
+    identifier, family, expires_at = session_ids(refresh)
+    session = RefreshSession(
+        identifier=identifier,
+        family=family,
+        account_id=account_id,
+        token_hash=refresh_token_hash(pair.refresh_token),
+        expires_at=expires_at,
+        parent=session_ids(parent)[0] if parent else None,
+    )
+
+    return pair, session
+
+
+@dataclass
+class RefreshResult:
+    access_token: AccessToken
+    refresh_token: RefreshToken
+
+
+@dataclass(frozen=True)
+class RefreshService:
+    jwt_service: JwtService
+    claims_factory: ClaimsFactory
+    refresh_store: RefreshStore
+    revoke_store: RevokeStore
+
+    async def refresh(self, token: RefreshToken) -> RefreshResult:
+        """
+        Exchange refresh token for a new pair, old one becomes unusable.
+
+        No password hash and no account lookup: one signature check, two HMAC,
+        local revocation filter and one atomic rotation in store.
+
+        Raises:
+            InvalidTokenError: Token is not valid, expired, revoked or unknown
+            RefreshTokenReusedError: Token was already exchanged, family is revoked
+        """
+
+        claims = await self.jwt_service.verify_refresh(token)
+        old, _, _ = session_ids(claims)
+        await ensure_not_revoked(self.revoke_store, claims)
+
+        pair, session = await issue_session_pair(
+            self.jwt_service,
+            self.claims_factory,
+            UUID(claims.sub),
+            parent=claims,
+        )
+        try:
+            await self.refresh_store.rotate(old, session)
+        except RefreshTokenReusedError as e:
+            # Семья отозвана внутри store: access-токены её сессий ещё проходят
+            # фильтры других воркеров, пока отзыв не разослан
+            await self.revoke_store.publish_revoked([
+                RefreshSessionId(jti) for jti in e.revoked
+            ])
+            raise
+
+        return RefreshResult(pair.access_token, pair.refresh_token)
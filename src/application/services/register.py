@@ -32,11 +32,16 @@ class RegisterService:
     event_publishers: list[DomainEventPublisher] = field(default_factory=list)
 
     async def register(self, cmd: RegisterCommand) -> RegisterResult:
-        async with self.uow as uow:
-            account = await uow.accounts.get_by_email(cmd.email)
+        """
+        Register account by email and password.
+
+        Cheap policy checks go first, argon2 runs outside of any transaction,
+        uniqueness check and insert are a single statement.
 
-        if account:
-            raise AccountAlreadyExistsError(ctx={'email': cmd.email})
+        Raises:
+            PasswordPolicyError: Password does not comply with policy
+            AccountAlreadyExistsError: Email already registered
+        """
 
         if self.password_policies_suite:
             ok, errors = self.password_policies_suite.validate(cmd.password)
@@ -44,18 +49,23 @@ class RegisterService:
             if not ok:
                 raise PasswordPolicyError(ctx={'errors': errors})
 
+        password_hash = await self.password_hasher.hash(cmd.password)
+
         async with self.uow as uow:
-            account = await uow.accounts.create(
+            account = await uow.accounts.create_if_not_exists(
                 Account(
                     identifier=None,
                     username=None,
                     email=cmd.email,
-                    password_hash=await self.password_hasher.hash(cmd.password),
+                    password_hash=password_hash,
                     is_active=True,
                     roles=[],  # TODO: Обновить после добавления ролей
                 )
             )
 
+            if not account:
+                raise AccountAlreadyExistsError(ctx={'email': cmd.email})
+
             event = AccountRegistered.from_account(account)
 
             for event_publisher in self.event_publishers:
@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from src.domain.exceptions import InvalidTokenError
+from src.domain.ports import RevokeStore
+from src.domain.value_objects import Claims, RefreshSessionId
+
+
+async def ensure_not_revoked(revoke_store: RevokeStore, claims: Claims) -> None:
+    """
+    Check valid token against revocations: its session and account watermark.
+
+    Common answer "not revoked" comes from local filter of revoke store,
+    see src/infra/revocation.
+
+    Raises:
+        InvalidTokenError: Session of token or all tokens of account are revoked
+    """
+
+    if claims.sid and await revoke_store.is_revoked(RefreshSessionId(claims.sid)):
+        raise InvalidTokenError('Session is revoked', ctx={'sid': claims.sid})
+
+    watermark = await revoke_store.account_watermark(UUID(claims.sub))
+    if watermark is not None and (claims.iat or 0) < watermark:
+        raise InvalidTokenError(
+            'Token is revoked', ctx={'sub': claims.sub, 'watermark': watermark}
+        )
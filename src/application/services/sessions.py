@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.exceptions import SessionNotFoundError
+from src.domain.factories import ClaimsFactory
+from src.domain.ports import JwtService, RefreshStore, RevokeStore
+from src.domain.value_objects import (
+    TTL,
+    AccessToken,
+    Claims,
+    RefreshFamilyId,
+    RefreshSessionId,
+    SessionInfo,
+)
+
+from src.application.services.revocation import ensure_not_revoked
+
+
+@dataclass
+class SessionPage:
+    sessions: list[SessionInfo]
+    cursor: str | None
+
+
+@dataclass(frozen=True)
+class SessionService:
+    """Sessions (refresh families) of access token owner.
+
+    No account lookup: account is `sub` of verified and not revoked token.
+    """
+
+    jwt_service: JwtService
+    claims_factory: ClaimsFactory
+    refresh_store: RefreshStore
+    revoke_store: RevokeStore
+
+    async def _claims(self, token: AccessToken) -> Claims:
+        claims = await self.jwt_service.verify_access(token)
+        await ensure_not_revoked(self.revoke_store, claims)
+        return claims
+
+    async def list_sessions(
+        self, token: AccessToken, limit: int, cursor: str | None = None
+    ) -> SessionPage:
+        """
+        Page of active sessions, newest first.
+
+        Args:
+            token: Access token of account
+            limit: Page size
+            cursor: Cursor of previous page, first page if None
+
+        Returns:
+            Sessions and cursor of next page, None on the last page
+
+        Raises:
+            InvalidTokenError: Token is not valid or revoked
+            InvalidCursorError: Cursor is malformed
+        """
+
+        claims = await self._claims(token)
+        sessions = await self.refresh_store.list_families(
+            UUID(claims.sub), limit, after=cursor
+        )
+
+        next_cursor = sessions[-1].cursor if len(sessions) == limit else None
+        return SessionPage(sessions, next_cursor)
+
+    async def revoke_session(self, token: AccessToken, family: RefreshFamilyId) -> None:
+        """
+        Delete session of account: its refresh token stops working.
+
+        Raises:
+            InvalidTokenError: Token is not valid or revoked
+            SessionNotFoundError: No such session of this account
+        """
+
+        claims = await self._claims(token)
+
+        if not await self.revoke_store.delete_families(UUID(claims.sub), [family]):
+            raise SessionNotFoundError(ctx={'sub': claims.sub, 'family': family.value})
+
+    async def logout(self, token: AccessToken) -> None:
+        """
+        Delete session of this token. Access token itself expires on its own.
+
+        Raises:
+            InvalidTokenError: Token is not valid or revoked
+            SessionNotFoundError: Token is not bound to a session
+        """
+
+        claims = await self._claims(token)
+        if not claims.sid:
+            raise SessionNotFoundError(ctx={'sub': claims.sub})
+
+        # sid - refresh-токен пары; уже обменянный всё равно указывает на семью
+        session = await self.refresh_store.get(RefreshSessionId(claims.sid))
+        if session is None:
+            return  # сессия уже удалена: повторный logout
+
+        await self.revoke_store.delete_families(UUID(claims.sub), [session.family])
+
+    async def logout_all(self, token: AccessToken) -> None:
+        """
+        Delete every session of account and revoke all its issued tokens.
+
+        Families go in one statement (script) whatever their number; issued
+        access tokens are cut off by account watermark.
+
+        Raises:
+            InvalidTokenError: Token is not valid or revoked
+        """
+
+        claims = await self._claims(token)
+        account_id = UUID(claims.sub)
+
+        # iat в секундах, сравнение строгое: повторный вход в ту же секунду
+        # получает рабочие токены. Access-токены, выпущенные в эту секунду до
+        # выхода, доживают свой короткий срок; refresh-токены удалены с семьями
+        issued_before = self.claims_factory.claim_factory.iat()
+        ttl = TTL.from_timedelta(self.claims_factory.spec.lifetime.refresh_ttl)
+
+        await self.revoke_store.delete_families(account_id)
+        await self.revoke_store.revoke_account(account_id, issued_before, ttl)
@@ -8,18 +8,37 @@ from src.domain.policies.password import (
     PasswordContainUppercasePolicy,
     PasswordMaxLengthPolicy,
     PasswordMinLengthPolicy,
+    PasswordNotInBlacklistPolicy,
     PasswordPolicy,
     PasswordPolicySuite,
 )
 from src.domain.value_objects.token import TokenLifetime, TokenRealm, TokenSpecification
 
+from src.infra.blocklist import open_password_blocklist
 from src.infra.config import Settings
-from src.infra.crypto.bcrypt import BcryptPasswordHasherImpl
-from src.infra.jwt_service.jose import JoseJwtServiceImpl
-from src.infra.key_provider import HS256KeyProviderImpl
+from src.infra.crypto.executor import ExecutorPasswordHasherImpl
+from src.infra.jwt_service.cache import VerifiedTokenCache
+from src.infra.jwt_service.compact import CompactJwtServiceImpl
+from src.infra.key_provider import make_key_provider
 from src.infra.orm.session import make_async_session_factory, make_engine
+from src.infra.redis import make_redis
+from src.infra.refresh_store.db import DbRefreshStoreImpl, DbRevokeStoreImpl
+from src.infra.refresh_store.redis import RedisRefreshStoreImpl, RedisRevokeStoreImpl
+from src.infra.revocation import (
+    FilteredRevokeStoreImpl,
+    PgRevocationFeedImpl,
+    RedisRevocationFeedImpl,
+)
 
-from src.application import LoginService, RegisterService, SqlAlchemyUoW
+from src.application import (
+    AccountService,
+    IntrospectionService,
+    LoginService,
+    RefreshService,
+    RegisterService,
+    SessionService,
+    SqlAlchemyUoW,
+)
 
 
 @final
@@ -63,23 +82,83 @@ class AuthContainer(containers.DeclarativeContainer):
         session_factory=session_factory,
     )
 
-    password_hasher = providers.Factory(
-        BcryptPasswordHasherImpl,
+    # Singleton: один пул соединений на процесс, клиент не подключается до первой команды
+    redis = providers.Singleton(
+        make_redis,
+        url=config.redis.url.required(),
+        max_connections=config.redis.max_connections,
     )
 
-    key_provider = providers.Factory(
-        HS256KeyProviderImpl,
+    refresh_store = providers.Selector(
+        config.refresh_store.backend,
+        redis=providers.Singleton(
+            RedisRefreshStoreImpl,
+            redis=redis,
+            key_prefix=config.redis.key_prefix,
+        ),
+        db=providers.Singleton(
+            DbRefreshStoreImpl,
+            session_factory=session_factory,
+        ),
+    )
+
+    # Лента отзывов между воркерами - там же, где хранятся сессии
+    revocation_feed = providers.Selector(
+        config.refresh_store.backend,
+        redis=providers.Singleton(RedisRevocationFeedImpl, redis=redis),
+        db=providers.Singleton(PgRevocationFeedImpl, engine=engine),
+    )
+
+    # Локальный фильтр перед store: "не отозван" отвечается без сети
+    revoke_store = providers.Singleton(
+        FilteredRevokeStoreImpl,
+        store=providers.Selector(
+            config.refresh_store.backend,
+            redis=providers.Singleton(
+                RedisRevokeStoreImpl,
+                redis=redis,
+                key_prefix=config.redis.key_prefix,
+            ),
+            db=providers.Singleton(
+                DbRevokeStoreImpl,
+                session_factory=session_factory,
+                horizon=config.jwt.refresh_ttl,
+            ),
+        ),
+        feed=revocation_feed,
+        capacity=config.revocation.filter_capacity,
+        error_rate=config.revocation.filter_error_rate,
+        resync_interval=config.revocation.resync_interval,
+    )
+
+    # Singleton: пул потоков/процессов общий на весь процесс
+    password_hasher = providers.Singleton(
+        ExecutorPasswordHasherImpl,
+        kind=config.hasher.executor,
+        max_workers=config.hasher.max_workers,
+        max_pending=config.hasher.max_pending,
+    )
+
+    # Stateless-граф собирается один раз на процесс, per-request только uow
+    key_provider = providers.Singleton(
+        make_key_provider,
         secret=config.jwt.secret_key.provided.get_secret_value.call(),  # SecretStr
+        keyring_path=config.jwt.keyring_path,
+        current_kid=config.jwt.current_kid,
+        # Снятый с ротации ключ принимается, пока живы его refresh-токены
+        retention=config.jwt.refresh_ttl.required(),
+        # Новый ключ подписывает, когда закэшированные JWKS клиентов уже с ним
+        publish_delay=config.jwt.jwks_max_age.required(),
     )
 
-    token_specification = providers.Factory(
+    token_specification = providers.Singleton(
         TokenSpecification,
-        realm=providers.Factory(
+        realm=providers.Singleton(
             TokenRealm,
             issuer=config.jwt.issuer.required(),
             audience=config.jwt.audience.required(),
         ),
-        lifetime=providers.Factory(
+        lifetime=providers.Singleton(
             TokenLifetime,
             access_ttl=config.jwt.access_ttl.required(),
             refresh_ttl=config.jwt.refresh_ttl.required(),
@@ -87,23 +166,63 @@ class AuthContainer(containers.DeclarativeContainer):
         ),
     )
 
-    claims_factory = providers.Factory(
+    claims_factory = providers.Singleton(
         ClaimsFactory,
         spec=token_specification,
     )
 
-    jwt_service = providers.Factory(
-        JoseJwtServiceImpl,
+    verified_token_cache = providers.Singleton(
+        VerifiedTokenCache,
+        max_size=config.jwt.verify_cache_size,
+    )
+
+    jwt_service = providers.Singleton(
+        CompactJwtServiceImpl,
         key_provider=key_provider,
         claims_factory=claims_factory,
         spec=token_specification,
+        cache=verified_token_cache,
     )
 
+    # Factory только из-за uow: сам сервис - dataclass поверх singleton-зависимостей
     login_service = providers.Factory(
         LoginService,
         uow=uow,
         password_hasher=password_hasher,
         jwt_service=jwt_service,
+        claims_factory=claims_factory,
+        refresh_store=refresh_store,
+    )
+
+    # Singleton: без uow и пароля, refresh - подпись, два HMAC и ротация в store
+    refresh_service = providers.Singleton(
+        RefreshService,
+        jwt_service=jwt_service,
+        claims_factory=claims_factory,
+        refresh_store=refresh_store,
+        revoke_store=revoke_store,
+    )
+
+    account_service = providers.Factory(
+        AccountService,
+        uow=uow,
+        jwt_service=jwt_service,
+        revoke_store=revoke_store,
+    )
+
+    # Singleton: как refresh_service, аккаунт - sub проверенного токена
+    session_service = providers.Singleton(
+        SessionService,
+        jwt_service=jwt_service,
+        claims_factory=claims_factory,
+        refresh_store=refresh_store,
+        revoke_store=revoke_store,
+    )
+
+    introspection_service = providers.Singleton(
+        IntrospectionService,
+        jwt_service=jwt_service,
+        revoke_store=revoke_store,
     )
 
     password_policy = providers.Singleton(
@@ -114,14 +233,24 @@ class AuthContainer(containers.DeclarativeContainer):
         require_symbol=False,
     )
 
+    # mmap открывается один раз на процесс, страницы файла общие для воркеров
+    password_blocklist = providers.Singleton(
+        open_password_blocklist,
+        path=config.blocklist.path,
+    )
+
     password_policies_suite = providers.Singleton(
         PasswordPolicySuite,
-        policies=[
-            PasswordContainLowercasePolicy(),
-            PasswordContainUppercasePolicy(),
-            PasswordMinLengthPolicy(4),
-            PasswordMaxLengthPolicy(50),
-        ],
+        policies=providers.List(
+            providers.Object(PasswordContainLowercasePolicy()),
+            providers.Object(PasswordContainUppercasePolicy()),
+            providers.Object(PasswordMinLengthPolicy(4)),
+            providers.Object(PasswordMaxLengthPolicy(50)),
+            providers.Singleton(
+                PasswordNotInBlacklistPolicy,
+                blacklist=password_blocklist,
+            ),
+        ),
     )
 
     register_service = providers.Factory(
@@ -1,7 +1,13 @@
 from dataclasses import dataclass, field
 from uuid import UUID
 
-from src.domain.value_objects import Email, PasswordHash, Role
+from src.domain.value_objects import (
+    Email,
+    PasswordHash,
+    RefreshFamilyId,
+    RefreshSessionId,
+    Role,
+)
 
 
 @dataclass
@@ -12,3 +18,39 @@ class Account:
     is_active: bool = True
     username: str | None = field(default=None)
     roles: list[Role] = field(default_factory=list)
+
+
+@dataclass
+class RefreshSession:
+    """Server side of refresh token.
+
+    Attributes:
+        identifier: Refresh token `jti`
+        family: Rotation chain, shared by every descendant of one login
+        account_id: Token owner
+        token_hash: Digest of refresh token, token itself is never stored
+        expires_at: End of token lifetime (Unix)
+        parent: Session this one was rotated from
+        rotated_at: When session was exchanged for a new one (Unix)
+        revoked_at: When session was revoked (Unix)
+        version: Counter for optimistic rotation
+    """
+
+    identifier: RefreshSessionId
+    family: RefreshFamilyId
+    account_id: UUID
+    token_hash: str
+    expires_at: int
+    parent: RefreshSessionId | None = None
+    rotated_at: int | None = None
+    revoked_at: int | None = None
+    version: int = 0
+
+    def ttl(self, now: int) -> int:
+        """Seconds left, storage may drop session after that."""
+        return max(self.expires_at - now, 0)
+
+    def is_usable(self, now: int) -> bool:
+        return (
+            self.rotated_at is None and self.revoked_at is None and now < self.expires_at
+        )
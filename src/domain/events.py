@@ -1,5 +1,6 @@
 import typing as tp
 from datetime import UTC, datetime
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -11,15 +12,27 @@ class DomainEvent(BaseModel):
     occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     def as_dict(self) -> dict[str, tp.Any]:
-        return self.model_dump()
+        """JSON-ready payload: datetime as ISO string, value objects as dicts."""
+        return self.model_dump(mode='json')
+
+    @property
+    def key(self) -> str | None:
+        """Aggregate of the event: events with the same key are published in order."""
+        return None
 
 
 class AccountRegistered(DomainEvent):
     email: Email
+    account_id: UUID | None = None
 
     @classmethod
     def from_account(cls, account: Account) -> 'AccountRegistered':
-        return cls(email=account.email)
+        return cls(email=account.email, account_id=account.identifier)
+
+    @property
+    @tp.override
+    def key(self) -> str | None:
+        return str(self.account_id) if self.account_id else None
 
 
 class AccountAuthorized(DomainEvent):
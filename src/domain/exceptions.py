@@ -1,4 +1,6 @@
-from src.exceptions import BaseMicroserviceError
+from collections.abc import Iterable
+
+from src.exceptions import BaseMicroserviceError, ErrorCtx
 
 
 class BaseDomainError(BaseMicroserviceError): ...
@@ -12,3 +14,33 @@ class ValidationError(BaseDomainError):
 class ShouldBePositiveError(ValidationError):
     code = 'value_should_be_positive'
     message = 'Value should be positive'
+
+
+class InvalidTokenError(BaseDomainError):
+    code = 'invalid_token'
+    message = 'Token is not valid'
+
+
+class RefreshTokenReusedError(InvalidTokenError):
+    """Already rotated refresh token presented again: token is probably stolen."""
+
+    code = 'refresh_token_reused'
+    message = 'Refresh token was already used, session family is revoked'
+
+    def __init__(
+        self, message: str | None = None, *, ctx: ErrorCtx, revoked: Iterable[str] = ()
+    ) -> None:
+        super().__init__(message, ctx=ctx)
+        # jti сессий, отозванных вместе с семьёй: store уже записал отзыв,
+        # осталось разослать его локальным фильтрам
+        self.revoked = tuple(revoked)
+
+
+class InvalidCursorError(ValidationError):
+    code = 'invalid_cursor'
+    message = 'Pagination cursor is not valid'
+
+
+class SessionNotFoundError(BaseDomainError):
+    code = 'session_not_found'
+    message = 'Session does not exist or belongs to another account'
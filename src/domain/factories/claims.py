@@ -1,10 +1,12 @@
 import time
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
+from typing import Any
 from uuid import uuid4
 
 from src.domain.value_objects import Claims
-from src.domain.value_objects.token import TokenSpecification
+from src.domain.value_objects.token import TokenSpecification, TokenType
 
 
 class ClaimFactory:
@@ -16,39 +18,100 @@ class ClaimFactory:
         """JWT Identifier"""
         return uuid4().hex
 
+    def fid(self) -> str:
+        """Refresh family: new one per login"""
+        return uuid4().hex
+
     def exp(self, base: int, ttl: timedelta) -> int:
         """Expiration time (unix time)"""
         return base + int(ttl.total_seconds())
 
 
+type ClaimsPair = tuple[Claims, Claims]
+
+
 @dataclass(slots=True)
 class ClaimsFactory:
     """Фабрика для создания Claims."""
 
     spec: TokenSpecification
+    claim_factory: ClaimFactory = field(default_factory=ClaimFactory)
+    _realm_claims: dict[str, Any] = field(init=False, repr=False)
 
-    def _base_claims(self, sub: str, ttl: timedelta, nbf: int | None = None) -> Claims:
-        claim_factory = ClaimFactory()
-
-        claims = {
-            'sub': sub,
-            'jti': claim_factory.jti(),
-            'iat': claim_factory.iat(),
-        }
+    def __post_init__(self) -> None:
+        """Realm не меняется: iss и aud считаются один раз."""
+        self._realm_claims = {}
 
         if iss := self.spec.realm.issuer:
-            claims['iss'] = iss
+            self._realm_claims['iss'] = iss
 
         if aud := self.spec.realm.audience:
-            claims['aud'] = aud
+            self._realm_claims['aud'] = aud
+
+    def _ttl(self, typ: TokenType) -> timedelta:
+        lifetime = self.spec.lifetime
+        return lifetime.access_ttl if typ is TokenType.ACCESS else lifetime.refresh_ttl
+
+    def _base_claims(
+        self,
+        sub: str,
+        nbf: int | None = None,
+        *,
+        typ: TokenType,
+        iat: int | None = None,
+    ) -> dict[str, Any]:
+        claims = {
+            'sub': sub,
+            'jti': self.claim_factory.jti(),
+            'iat': iat or self.claim_factory.iat(),
+            'typ': typ.value,
+            **self._realm_claims,
+        }
 
         if active_at := nbf or claims['iat']:
             claims['nbf'] = active_at
-            claims['exp'] = claim_factory.exp(base=active_at, ttl=ttl)
-        return Claims(**claims)
+            claims['exp'] = self.claim_factory.exp(base=active_at, ttl=self._ttl(typ))
+        return claims
+
+    def _pair(self, sub: str, nbf: int | None, iat: int, fid: str | None) -> ClaimsPair:
+        refresh = self._base_claims(sub, nbf, typ=TokenType.REFRESH, iat=iat)
+        refresh['fid'] = fid or self.claim_factory.fid()
+
+        # Access-токен знает свою сессию: отзыв сессии отзывает и его
+        access = self._base_claims(sub, nbf, typ=TokenType.ACCESS, iat=iat)
+        access['sid'] = refresh['jti']
+
+        return Claims(**access), Claims(**refresh)
 
     def access_claims(self, sub: str, nbf: int | None = None) -> Claims:
-        return self._base_claims(sub, nbf=nbf, ttl=self.spec.lifetime.access_ttl)
+        return Claims(**self._base_claims(sub, nbf, typ=TokenType.ACCESS))
+
+    def refresh_claims(
+        self, sub: str, nbf: int | None = None, *, fid: str | None = None
+    ) -> Claims:
+        """Refresh claims, без `fid` - новая семья (логин)."""
+        claims = self._base_claims(sub, nbf, typ=TokenType.REFRESH)
+        claims['fid'] = fid or self.claim_factory.fid()
+        return Claims(**claims)
+
+    def pair_claims(
+        self, sub: str, nbf: int | None = None, *, fid: str | None = None
+    ) -> ClaimsPair:
+        """Access и refresh claims с общим iat (одно чтение часов).
+
+        Args:
+            sub: Subject
+            nbf: Start of lifetime, iat by default
+            fid: Family of rotated refresh token, new family by default
+        """
+        return self._pair(sub, nbf, self.claim_factory.iat(), fid)
+
+    def many_pair_claims(
+        self, subs: Iterable[str], nbf: int | None = None
+    ) -> list[ClaimsPair]:
+        """Пары claims для многих subject: часы читаются один раз.
 
-    def refresh_claims(self, sub: str, nbf: int | None = None) -> Claims:
-        return self._base_claims(sub, nbf=nbf, ttl=self.spec.lifetime.refresh_ttl)
+        Каждый refresh - в своей новой семье.
+        """
+        iat = self.claim_factory.iat()
+        return [self._pair(sub, nbf, iat, None) for sub in subs]
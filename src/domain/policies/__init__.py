@@ -1,11 +1,27 @@
 from .base import Policy, PolicySuite
-from .token import ExpRequiredPolicy, JtiRequiredPolicy, SubRequiredPolicy
+from .token import (
+    AudiencePolicy,
+    ExpRequiredPolicy,
+    IssuerPolicy,
+    JtiRequiredPolicy,
+    NotBeforePolicy,
+    NotExpiredPolicy,
+    SubRequiredPolicy,
+    TokenTypePolicy,
+    verification_policies,
+)
 
 
 __all__ = [
+    'AudiencePolicy',
     'ExpRequiredPolicy',
+    'IssuerPolicy',
     'JtiRequiredPolicy',
+    'NotBeforePolicy',
+    'NotExpiredPolicy',
     'Policy',
     'PolicySuite',
     'SubRequiredPolicy',
+    'TokenTypePolicy',
+    'verification_policies',
 ]
@@ -1,6 +1,7 @@
-from collections.abc import Iterable
-from enum import Enum
-from typing import Protocol, final, override
+from collections.abc import Callable, Container, Iterable
+from dataclasses import dataclass
+from enum import Enum, IntFlag
+from typing import ClassVar, Protocol, final, override
 
 from src.domain.value_objects import Password
 
@@ -18,6 +19,71 @@ class PasswordError(Enum):
 SYMBOLS = set(r"!@#$%^&*()-_=+[]{};:'\",.<>/?\|`~")
 
 
+class CharacterClass(IntFlag):
+    NONE = 0
+    LOWER = 1
+    UPPER = 2
+    DIGIT = 4
+    SYMBOL = 8
+
+
+def classify(ch: str) -> CharacterClass:
+    result = CharacterClass.NONE
+
+    if ch.islower():
+        result |= CharacterClass.LOWER
+    if ch.isupper():
+        result |= CharacterClass.UPPER
+    if ch.isdigit():
+        result |= CharacterClass.DIGIT
+    if ch in SYMBOLS:
+        result |= CharacterClass.SYMBOL
+
+    return result
+
+
+_ASCII_SIZE = 128
+# int, а не CharacterClass: операции IntFlag в горячем цикле в разы медленнее
+_ASCII_CLASSES: tuple[int, ...] = tuple(
+    int(classify(chr(code))) for code in range(_ASCII_SIZE)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordProfile:
+    """Характеристики пароля, собранные за один проход по строке."""
+
+    password: Password
+    length: int
+    classes: int  # битовая маска CharacterClass
+
+    @classmethod
+    def scan(
+        cls,
+        password: Password,
+        required: int = CharacterClass.NONE,
+    ) -> 'PasswordProfile':
+        """Классифицировать символы пароля.
+
+        Args:
+            password: Пароль
+            required: Классы, которые нужны политикам. Проход заканчивается,
+                как только все они найдены
+        """
+        required = int(required)
+        mask = 0
+        # Пустой required: никому не нужны классы, строку можно не сканировать
+        if required:
+            for ch in password.value:
+                code = ord(ch)
+                mask |= _ASCII_CLASSES[code] if code < _ASCII_SIZE else int(classify(ch))
+
+                if mask & required == required:
+                    break
+
+        return cls(password, len(password), mask)
+
+
 class PasswordPolicy(Protocol):
     code: PasswordError
 
@@ -25,32 +91,97 @@ class PasswordPolicy(Protocol):
     def validate(self, password: Password) -> bool: ...
 
 
+class ProfilePasswordPolicy(PasswordPolicy, Protocol):
+    """Политика, которую можно вычислить по PasswordProfile.
+
+    Такие политики PasswordPolicySuite проверяет без повторных проходов по паролю.
+    """
+
+    required_classes: ClassVar[CharacterClass]
+
+    def check(self, profile: PasswordProfile) -> bool: ...
+
+
+type PasswordCheck = Callable[[PasswordProfile], bool]
+
+
 @final
 class PasswordPolicySuite:
-    def __init__(self, policies: Iterable[PasswordPolicy]) -> None:
-        self._policies = policies
-
-    def validate(self, password: Password) -> tuple[bool, list[str]]:
+    """Suite of password policies, compiled once.
+
+    All profile-aware policies share one pass over the password, other
+    policies fall back to their own `validate`. Errors keep policies order.
+
+    Args:
+        policies: Policies in order of error messages
+        fail_fast: Stop at the first failed policy (bulk import and so on)
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[PasswordPolicy],
+        *,
+        fail_fast: bool = False,
+    ) -> None:
+        self._policies = tuple(policies)
+        self._fail_fast = fail_fast
+        self._required = 0
+        self._checks: tuple[tuple[PasswordCheck, str], ...] = tuple(
+            (self._compile(policy), policy.error_message()) for policy in self._policies
+        )
+
+    def _compile(self, policy: PasswordPolicy) -> PasswordCheck:
+        check: PasswordCheck | None = getattr(policy, 'check', None)
+
+        if check is None:
+            return lambda profile: policy.validate(profile.password)
+
+        self._required |= int(getattr(policy, 'required_classes', CharacterClass.NONE))
+        return check
+
+    def validate(
+        self, password: Password, *, fail_fast: bool | None = None
+    ) -> tuple[bool, list[str]]:
+        if fail_fast is None:
+            fail_fast = self._fail_fast
+
+        profile = PasswordProfile.scan(password, self._required)
         errors: list[str] = []
 
-        for policy in self._policies:
-            is_valid = policy.validate(password)
+        for check, error_message in self._checks:
+            if check(profile):
+                continue
 
-            if not is_valid:
-                errors.append(policy.error_message())
+            errors.append(error_message)
+            if fail_fast:
+                break
 
         if errors:
             return False, errors
         return True, errors
 
 
-@final
-class PasswordContainUppercasePolicy(PasswordPolicy):
-    code: PasswordError = PasswordError.REQUIRE_UPPER
+class _ContainCharacterClassPolicy(ProfilePasswordPolicy):
+    required_classes: ClassVar[CharacterClass] = CharacterClass.NONE
+    _mask: ClassVar[int] = 0
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._mask = int(cls.required_classes)
 
     @override
     def validate(self, password: Password) -> bool:
-        return password.any_of_characters(str.isupper)
+        return self.check(PasswordProfile.scan(password, self._mask))
+
+    @override
+    def check(self, profile: PasswordProfile) -> bool:
+        return bool(profile.classes & self._mask)
+
+
+@final
+class PasswordContainUppercasePolicy(_ContainCharacterClassPolicy):
+    code: PasswordError = PasswordError.REQUIRE_UPPER
+    required_classes: ClassVar[CharacterClass] = CharacterClass.UPPER
 
     @override
     def error_message(self) -> str:
@@ -58,21 +189,39 @@ class PasswordContainUppercasePolicy(PasswordPolicy):
 
 
 @final
-class PasswordContainLowercasePolicy(PasswordPolicy):
+class PasswordContainLowercasePolicy(_ContainCharacterClassPolicy):
     code: PasswordError = PasswordError.REQUIRE_LOWER
+    required_classes: ClassVar[CharacterClass] = CharacterClass.LOWER
 
     @override
-    def validate(self, password: Password) -> bool:
-        return password.any_of_characters(str.islower)
+    def error_message(self) -> str:
+        return 'Password should contain lowercase letter'
+
+
+@final
+class PasswordContainDigitPolicy(_ContainCharacterClassPolicy):
+    code: PasswordError = PasswordError.REQUIRE_DIGIT
+    required_classes: ClassVar[CharacterClass] = CharacterClass.DIGIT
 
     @override
     def error_message(self) -> str:
-        return 'Password should contain lowercase letter'
+        return 'Password should contain digit'
 
 
 @final
-class PasswordMinLengthPolicy(PasswordPolicy):
+class PasswordContainSymbolPolicy(_ContainCharacterClassPolicy):
+    code: PasswordError = PasswordError.REQUIRE_SYMBOL
+    required_classes: ClassVar[CharacterClass] = CharacterClass.SYMBOL
+
+    @override
+    def error_message(self) -> str:
+        return 'Password should contain special symbol'
+
+
+@final
+class PasswordMinLengthPolicy(ProfilePasswordPolicy):
     code: PasswordError = PasswordError.TOO_SHORT
+    required_classes: ClassVar[CharacterClass] = CharacterClass.NONE
 
     def __init__(self, min_length: int) -> None:
         self._min_length = min_length
@@ -81,14 +230,19 @@ class PasswordMinLengthPolicy(PasswordPolicy):
     def validate(self, password: Password) -> bool:
         return len(password) > self._min_length
 
+    @override
+    def check(self, profile: PasswordProfile) -> bool:
+        return profile.length > self._min_length
+
     @override
     def error_message(self) -> str:
         return f'Password should be more than {self._min_length} symbols.'
 
 
 @final
-class PasswordMaxLengthPolicy(PasswordPolicy):
+class PasswordMaxLengthPolicy(ProfilePasswordPolicy):
     code: PasswordError = PasswordError.TOO_LONG
+    required_classes: ClassVar[CharacterClass] = CharacterClass.NONE
 
     def __init__(self, max_length: int) -> None:
         self._max_length = max_length
@@ -97,22 +251,31 @@ class PasswordMaxLengthPolicy(PasswordPolicy):
     def validate(self, password: Password) -> bool:
         return len(password) < self._max_length
 
+    @override
+    def check(self, profile: PasswordProfile) -> bool:
+        return profile.length < self._max_length
+
     @override
     def error_message(self) -> str:
         return f'Password should not be more than {self._max_length} symbols'
 
 
 @final
-class PasswordNotInBlacklistPolicy(PasswordPolicy):
+class PasswordNotInBlacklistPolicy(ProfilePasswordPolicy):
     code: PasswordError = PasswordError.FORBIDDEN_WORD
+    required_classes: ClassVar[CharacterClass] = CharacterClass.NONE
 
-    def __init__(self, blacklist: set[str]) -> None:
+    def __init__(self, blacklist: Container[str]) -> None:
         self._blacklist = blacklist
 
     @override
     def validate(self, password: Password) -> bool:
         return password.value not in self._blacklist
 
+    @override
+    def check(self, profile: PasswordProfile) -> bool:
+        return profile.password.value not in self._blacklist
+
     @override
     def error_message(self) -> str:
         return 'Password is too simple'
@@ -1,8 +1,9 @@
 from typing import final, override
 
-from src.domain.policies.base import Policy
+from src.domain.policies.base import Policy, PolicySuite
 from src.domain.types import PotentialIssues
 from src.domain.value_objects import Claims, Issue, IssueCode, IssueSeverity
+from src.domain.value_objects.token import TokenRealm, TokenType
 
 
 class SubRequiredPolicy(Policy[Claims]):
@@ -64,3 +65,92 @@ class NotExpiredPolicy(Policy[Claims]):
                 severity=IssueSeverity.HIGH,
                 ctx={'now': self.now, 'exp': ctx.exp, 'skew': self.skew},
             )
+
+
+@final
+class NotBeforePolicy(Policy[Claims]):
+    """Token should not be used before 'nbf', if it is set."""
+
+    def __init__(self, now: int, skew: int = 0) -> None:
+        self.now = now
+        self.skew = skew
+
+    @override
+    def evaluate(self, ctx: Claims) -> PotentialIssues:
+        if ctx.nbf is not None and ctx.nbf - self.skew > self.now:
+            yield Issue(
+                code=IssueCode.NOT_YET_VALID,
+                severity=IssueSeverity.HIGH,
+                ctx={'now': self.now, 'nbf': ctx.nbf, 'skew': self.skew},
+            )
+
+
+@final
+class AudiencePolicy(Policy[Claims]):
+    """Token should be issued for one of our audiences."""
+
+    def __init__(self, audience: list[str]) -> None:
+        self.audience = frozenset(audience)
+
+    @override
+    def evaluate(self, ctx: Claims) -> PotentialIssues:
+        # По RFC 7519 aud может быть и строкой
+        aud = [ctx.aud] if isinstance(ctx.aud, str) else ctx.aud or []
+        if self.audience.isdisjoint(aud):
+            yield Issue(
+                code=IssueCode.WRONG_AUDIENCE,
+                severity=IssueSeverity.HIGH,
+                ctx={'aud': ctx.aud, 'expected': sorted(self.audience)},
+            )
+
+
+@final
+class IssuerPolicy(Policy[Claims]):
+    """Token should be issued by us."""
+
+    def __init__(self, issuer: str) -> None:
+        self.issuer = issuer
+
+    @override
+    def evaluate(self, ctx: Claims) -> PotentialIssues:
+        if ctx.iss != self.issuer:
+            yield Issue(
+                code=IssueCode.WRONG_ISSUER,
+                severity=IssueSeverity.HIGH,
+                ctx={'iss': ctx.iss, 'expected': self.issuer},
+            )
+
+
+@final
+class TokenTypePolicy(Policy[Claims]):
+    """Token should have expected type: refresh token is not an access token."""
+
+    def __init__(self, expected: TokenType) -> None:
+        self.expected = expected
+
+    @override
+    def evaluate(self, ctx: Claims) -> PotentialIssues:
+        if ctx.typ != self.expected.value:
+            yield Issue(
+                code=IssueCode.WRONG_TYPE,
+                severity=IssueSeverity.HIGH,
+                ctx={'typ': ctx.typ, 'expected': self.expected.value},
+            )
+
+
+def verification_policies(
+    token_type: TokenType | None, realm: TokenRealm, now: int, skew: int = 0
+) -> PolicySuite[Claims]:
+    """Policies for every verified token of given type, None - any type."""
+    policies: list[Policy[Claims]] = [
+        SubRequiredPolicy(),
+        JtiRequiredPolicy(),
+        NotExpiredPolicy(now=now, skew=skew),
+        NotBeforePolicy(now=now, skew=skew),
+        AudiencePolicy(realm.audience),
+        IssuerPolicy(realm.issuer),
+    ]
+    if token_type is not None:
+        policies.append(TokenTypePolicy(token_type))
+
+    return PolicySuite(*policies)
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Protocol
 from uuid import UUID
@@ -6,16 +7,21 @@ from src.domain.events import DomainEvent
 from src.domain.value_objects import (
     TTL,
     AccessToken,
+    Claims,
     Email,
     Password,
     PasswordHash,
     RefreshFamilyId,
     RefreshSessionId,
     RefreshToken,
+    RevocationSnapshot,
     Scope,
+    SessionInfo,
+    TokenPair,
 )
+from src.domain.value_objects.token import TokenIntrospection
 
-from .entities import Account
+from .entities import Account, RefreshSession
 
 
 class Clock(Protocol):
@@ -24,15 +30,68 @@ class Clock(Protocol):
 
 
 class RefreshStore(Protocol):
-    async def save(self, refresh_token: RefreshToken) -> None: ...
-    async def get(self, refresh_id: RefreshSessionId) -> RefreshToken | None: ...
-    async def rotate(self, old: RefreshToken, new: RefreshToken) -> None: ...
+    async def save(self, session: RefreshSession) -> None: ...
+    async def get(self, refresh_id: RefreshSessionId) -> RefreshSession | None: ...
+    async def get_many(
+        self, refresh_ids: Sequence[RefreshSessionId]
+    ) -> list[RefreshSession | None]: ...
+    async def rotate(self, old: RefreshSessionId, new: RefreshSession) -> None:
+        """Atomically exchange usable `old` session for `new` one.
+
+        Raises:
+            InvalidTokenError: Old session is missing, expired or revoked
+            RefreshTokenReusedError: Old session was already rotated,
+                the whole family is revoked
+        """
+
+    async def list_families(
+        self, account_id: UUID, limit: int, after: str | None = None
+    ) -> list[SessionInfo]:
+        """Active families of account, newest first.
+
+        Keyset pagination: `after` - cursor of the last family of previous page.
+
+        Raises:
+            InvalidCursorError: Cursor was not issued by this store
+        """
 
 
 class RevokeStore(Protocol):
     async def is_revoked(self, refresh_id: RefreshSessionId) -> bool: ...
     async def revoke(self, refresh_id: RefreshSessionId, ttl: TTL) -> None: ...
     async def delete_family(self, family: RefreshFamilyId) -> None: ...
+    async def delete_families(
+        self, account_id: UUID, families: Sequence[RefreshFamilyId] | None = None
+    ) -> int:
+        """Delete families of account at once: all of them if `families` is None.
+
+        One statement (script), not a loop over families. Families of other
+        accounts are skipped.
+
+        Returns:
+            Number of deleted families
+        """
+
+    async def revoke_account(
+        self, account_id: UUID, issued_before: int, ttl: TTL
+    ) -> None:
+        """Revoke every token of account issued before `issued_before` (watermark).
+
+        `ttl` - how long the watermark matters: the longest token lifetime.
+        """
+
+    async def account_watermark(self, account_id: UUID) -> int | None:
+        """Tokens of account issued before watermark are revoked."""
+
+    async def snapshot(self) -> RevocationSnapshot:
+        """Revocations still in effect, to warm up local caches."""
+
+    async def publish_revoked(self, refresh_ids: Sequence[RefreshSessionId]) -> None:
+        """Tell local caches about sessions the RefreshStore revoked by itself.
+
+        Reuse of a rotated token revokes its family inside `RefreshStore.rotate`:
+        the store is up to date, only the caches of other workers are not.
+        """
 
 
 class JwtService(Protocol):
@@ -40,6 +99,16 @@ class JwtService(Protocol):
         self, account: Account, scopes: list[Scope]
     ) -> AccessToken: ...
     async def issue_refresh(self, account: Account) -> RefreshToken: ...
+    async def issue_pair(self, account: Account, scopes: list[Scope]) -> TokenPair: ...
+    async def issue_pairs(
+        self, accounts: Sequence[Account], scopes: list[Scope]
+    ) -> list[TokenPair]: ...
+    async def sign_claims(self, claims: Sequence[Claims]) -> list[str]:
+        """Tokens for ready claims (ClaimsFactory), order is preserved."""
+
+    async def verify_access(self, token: AccessToken) -> Claims: ...
+    async def verify_refresh(self, token: RefreshToken) -> Claims: ...
+    async def introspect(self, tokens: Sequence[str]) -> list[TokenIntrospection]: ...
 
 
 class PasswordHasher(Protocol):
@@ -51,7 +120,10 @@ class AccountRepository(Protocol):
     async def get_by_email(self, email: Email) -> Account | None: ...
     async def get_by_id(self, account_id: UUID) -> Account | None: ...
     async def create(self, account: Account) -> Account: ...
+    async def create_if_not_exists(self, account: Account) -> Account | None: ...
 
 
 class DomainEventPublisher(Protocol):
     async def publish(self, event: DomainEvent) -> None: ...
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Publish all events of a unit of work at once."""
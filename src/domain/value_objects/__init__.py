@@ -7,8 +7,11 @@ from .account import (
     RefreshFamilyId,
     RefreshSessionId,
     RefreshToken,
+    RevocationSnapshot,
     Role,
     Scope,
+    SessionInfo,
+    TokenPair,
 )
 from .claims import Claims, PrivateClaims, RegisteredClaims
 from .issue import Decision, Issue, IssueCode, IssueSeverity
@@ -30,6 +33,9 @@ __all__ = [
     'RefreshSessionId',
     'RefreshToken',
     'RegisteredClaims',
+    'RevocationSnapshot',
     'Role',
     'Scope',
+    'SessionInfo',
+    'TokenPair',
 ]
@@ -1,6 +1,7 @@
 from collections.abc import Callable, Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
+from uuid import UUID
 
 from src.domain.exceptions import ShouldBePositiveError
 
@@ -41,6 +42,33 @@ class RefreshFamilyId:
     value: str
 
 
+@dataclass(frozen=True, slots=True)
+class RevocationSnapshot:
+    """Revocations still in effect: revoked sessions and accounts with watermark."""
+
+    sessions: list[RefreshSessionId] = field(default_factory=list)
+    accounts: list[UUID] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionInfo:
+    """Active refresh family as seen by its owner: one login on one device.
+
+    Attributes:
+        family: Rotation chain
+        created_at: Login time (Unix)
+        last_used_at: Last rotation (Unix), None if never refreshed
+        expires_at: End of the longest session of family (Unix)
+        cursor: Opaque position in listing of account sessions (keyset)
+    """
+
+    family: RefreshFamilyId
+    created_at: int
+    last_used_at: int | None
+    expires_at: int
+    cursor: str
+
+
 @dataclass(frozen=True, slots=True)
 class AccessToken:
     value: str
@@ -57,6 +85,12 @@ class RefreshToken:
         return str(self.value)
 
 
+@dataclass(frozen=True, slots=True)
+class TokenPair:
+    access_token: AccessToken
+    refresh_token: RefreshToken
+
+
 @dataclass(frozen=True, slots=True)
 class Email:
     value: str
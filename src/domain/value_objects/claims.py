@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from typing import Any
 
 from .account import Role
@@ -10,11 +10,17 @@ class PrivateClaims:
     email: User email
     roles: User roles
     scope: Services
+    typ: Token type (access, refresh), see TokenType
+    fid: Refresh family (rotation chain) of refresh token, its `jti` is session id
+    sid: Session of access token: `jti` of refresh token issued with it
     """
 
     email: str | None = None
     roles: list[Role] | None = None
     scope: str | None = None
+    typ: str | None = None
+    fid: str | None = None
+    sid: str | None = None
 
 
 @dataclass(frozen=True)
@@ -47,13 +53,40 @@ class RegisteredClaims:
 @dataclass(frozen=True, slots=True)
 class Claims(PrivateClaims, RegisteredClaims):
     def as_dict(self, *, exclude_none: bool = False) -> dict[str, Any]:
-        """Form dict and exclude empty claims."""
+        """Form dict and exclude empty claims.
+
+        Same output as `dataclasses.asdict`, but without its recursive deepcopy:
+        claims are flat, only lists (aud, roles) need to be copied.
+        """
         output = {}
 
-        for key, value in asdict(self).items():
-            if exclude_none and value is None:
-                continue
+        for key in CLAIMS_FIELDS:
+            value = getattr(self, key)
+
+            if value is None:
+                if exclude_none:
+                    continue
+            elif isinstance(value, list):
+                value = [
+                    asdict(item)
+                    if is_dataclass(item) and not isinstance(item, type)
+                    else item
+                    for item in value
+                ]
 
             output[key] = value
 
         return output
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> 'Claims':
+        """Build claims from decoded token payload, unknown claims are ignored."""
+        claims = {key: raw[key] for key in CLAIMS_FIELDS if key in raw}
+
+        if roles := claims.get('roles'):
+            claims['roles'] = [Role(**role) for role in roles]
+
+        return cls(**claims)
+
+
+CLAIMS_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Claims))
@@ -14,6 +14,10 @@ class IssueCode(StrEnum):
     REQUIRED_JTI = 'token:required:jti'
     REQUIRED_EXP = 'token:required:exp'
     EXPIRED = 'token:expired'
+    WRONG_TYPE = 'token:wrong:typ'
+    WRONG_AUDIENCE = 'token:wrong:aud'
+    WRONG_ISSUER = 'token:wrong:iss'
+    NOT_YET_VALID = 'token:immature'
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,7 +36,7 @@ class Decision:
 
     @property
     def ok(self) -> bool:
-        return any(issue for issue in self.issues if issue.is_critical())
+        return not any(issue.is_critical() for issue in self.issues)
 
     @classmethod
     def from_issues(cls, issues: list[Issue]) -> 'Decision':
@@ -1,5 +1,13 @@
 from dataclasses import dataclass
 from datetime import timedelta
+from enum import StrEnum
+
+from .claims import Claims
+
+
+class TokenType(StrEnum):
+    ACCESS = 'access'
+    REFRESH = 'refresh'
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,3 +35,11 @@ class TokenLifetime:
 class TokenSpecification:
     realm: TokenRealm
     lifetime: TokenLifetime
+
+
+@dataclass(frozen=True, slots=True)
+class TokenIntrospection:
+    """Result of token introspection (RFC 7662): claims only for active token."""
+
+    active: bool
+    claims: Claims | None = None
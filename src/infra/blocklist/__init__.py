@@ -0,0 +1,7 @@
+from .mmap import MmapPasswordBlocklist, open_password_blocklist
+
+
+__all__ = [
+    'MmapPasswordBlocklist',
+    'open_password_blocklist',
+]
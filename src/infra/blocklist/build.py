@@ -0,0 +1,158 @@
+"""Сборка файла для MmapPasswordBlocklist из plaintext или HIBP дампа.
+
+Usage:
+    python -m src.infra.blocklist.build passwords.txt blocklist.bin --format plain
+    python -m src.infra.blocklist.build pwned-passwords-sha1.txt blocklist.bin
+
+Дамп может не помещаться в память, поэтому сортировка внешняя:
+куски по --chunk-size записей сортируются во временные файлы и сливаются.
+"""
+
+import argparse
+import heapq
+import tempfile
+from collections.abc import Iterable, Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import IO
+
+from src.infra.blocklist.mmap import (
+    DEFAULT_DIGEST_SIZE,
+    HEADER,
+    MAGIC,
+    MAX_DIGEST_SIZE,
+    VERSION,
+    raw_digest,
+)
+
+
+class DumpFormat(StrEnum):
+    PLAIN = 'plain'  # один пароль на строку
+    HIBP = 'hibp'  # SHA1HEX:COUNT (Have I Been Pwned, sha1 ordered by hash/count)
+
+
+def read_digests(path: Path, fmt: DumpFormat, digest_size: int) -> Iterator[bytes]:
+    # Байты строки как есть: в дампах утечек встречается не UTF-8
+    with path.open('rb') as f:
+        for raw_line in f:
+            line = raw_line.rstrip(b'\r\n')
+            if not line:
+                continue
+
+            if fmt is DumpFormat.HIBP:
+                sha1_hex, _, _count = line.partition(b':')
+                yield bytes.fromhex(sha1_hex.decode('ascii'))[:digest_size]
+            else:
+                yield raw_digest(line, digest_size)
+
+
+def _write_records(f: IO[bytes], records: Iterable[bytes]) -> int:
+    count = 0
+    previous = None
+
+    for record in records:
+        if record == previous:
+            continue
+        f.write(record)
+        previous = record
+        count += 1
+
+    return count
+
+
+def _read_records(f: IO[bytes], size: int) -> Iterator[bytes]:
+    while record := f.read(size):
+        yield record
+
+
+def _sorted_chunks(
+    digests: Iterator[bytes], chunk_size: int, tmp_dir: Path
+) -> Iterator[Path]:
+    chunk: list[bytes] = []
+
+    for digest in digests:
+        chunk.append(digest)
+
+        if len(chunk) >= chunk_size:
+            yield _flush_chunk(chunk, tmp_dir)
+            chunk = []
+
+    if chunk:
+        yield _flush_chunk(chunk, tmp_dir)
+
+
+def _flush_chunk(chunk: list[bytes], tmp_dir: Path) -> Path:
+    chunk.sort()
+    with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as f:
+        _write_records(f, chunk)
+    return Path(f.name)
+
+
+def build(
+    source: Path,
+    target: Path,
+    *,
+    fmt: DumpFormat = DumpFormat.HIBP,
+    digest_size: int = DEFAULT_DIGEST_SIZE,
+    chunk_size: int = 10_000_000,
+) -> int:
+    """Собрать файл blocklist.
+
+    Returns:
+        Количество уникальных записей в файле
+    """
+    # Иначе записи обрезаются молча, и файл не совпадает с заголовком
+    if not 1 <= digest_size <= MAX_DIGEST_SIZE:
+        raise ValueError(
+            f'Invalid blocklist {digest_size=}, expected 1..{MAX_DIGEST_SIZE}'
+        )
+
+    digests = read_digests(source, fmt, digest_size)
+
+    with tempfile.TemporaryDirectory(dir=target.parent) as tmp:
+        chunks = list(_sorted_chunks(digests, chunk_size, Path(tmp)))
+        files = [chunk.open('rb') for chunk in chunks]
+
+        try:
+            merged = heapq.merge(*(_read_records(f, digest_size) for f in files))
+            partial = target.with_suffix(f'{target.suffix}.partial')
+
+            with partial.open('wb') as out:
+                out.write(HEADER.pack(MAGIC, VERSION, digest_size))
+                count = _write_records(out, merged)
+        finally:
+            for f in files:
+                f.close()
+
+    # rename атомарен: воркеры не увидят недописанный файл
+    partial.replace(target)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('source', type=Path)
+    parser.add_argument('target', type=Path)
+    parser.add_argument('--format', type=DumpFormat, default=DumpFormat.HIBP)
+    parser.add_argument(
+        '--digest-size',
+        type=int,
+        default=DEFAULT_DIGEST_SIZE,
+        choices=range(1, MAX_DIGEST_SIZE + 1),
+        metavar=f'1..{MAX_DIGEST_SIZE}',
+    )
+    parser.add_argument('--chunk-size', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    count = build(
+        args.source,
+        args.target,
+        fmt=args.format,
+        digest_size=args.digest_size,
+        chunk_size=args.chunk_size,
+    )
+    print(f'{args.target}: {count} records')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Container
+from pathlib import Path
+from typing import final, override
+
+from src.infra.exceptions import InvalidBlocklistFileError
+
+
+# Заголовок: magic, версия формата, размер записи (байт), 2 байта резерва
+HEADER = struct.Struct('<4sBB2x')
+MAGIC = b'PWBL'
+VERSION = 1
+# 10 байт SHA-1: вероятность ложного совпадения ~ n / 2**80, а файл почти в 2 раза меньше
+DEFAULT_DIGEST_SIZE = 10
+# Длиннее SHA-1 дайджест не бывает
+MAX_DIGEST_SIZE = hashlib.sha1(usedforsecurity=False).digest_size
+
+
+def password_digest(password: str, digest_size: int = DEFAULT_DIGEST_SIZE) -> bytes:
+    return raw_digest(password.encode(), digest_size)
+
+
+def raw_digest(password: bytes, digest_size: int = DEFAULT_DIGEST_SIZE) -> bytes:
+    """Digest of password bytes as is: dumps are not always valid UTF-8."""
+    return hashlib.sha1(password, usedforsecurity=False).digest()[:digest_size]
+
+
+@final
+class MmapPasswordBlocklist(Container[str]):
+    """Отсортированный файл SHA-1 дайджестов, открытый через mmap.
+
+    Файл отображается read-only: страницы живут в page cache и общие для всех
+    воркеров, поиск - бинарный, O(log n). Собирается командой
+    `python -m src.infra.blocklist.build`.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+
+        with self._path.open('rb') as f:
+            # Пустой файл mmap не отображает вовсе (ValueError)
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise InvalidBlocklistFileError(ctx={'path': str(self._path)})
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, digest_size = HEADER.unpack_from(self._mm)
+        body_size = len(self._mm) - HEADER.size
+
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or not digest_size
+            or body_size % digest_size
+        ):
+            self._mm.close()
+            raise InvalidBlocklistFileError(
+                ctx={'path': str(self._path), 'magic': magic, 'version': version}
+            )
+
+        self._digest_size: int = digest_size
+        self._count = body_size // digest_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    @override
+    def __contains__(self, password: object) -> bool:
+        if not isinstance(password, str):
+            return False
+
+        return self.contains_digest(password_digest(password, self._digest_size))
+
+    def contains_digest(self, digest: bytes) -> bool:
+        size = self._digest_size
+        lo, hi = 0, self._count
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * size
+            value = self._mm[offset : offset + size]
+
+            if value == digest:
+                return True
+            if value < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return False
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def open_password_blocklist(path: Path | str | None) -> Container[str]:
+    """Blocklist из настроек: пустой, если путь не задан."""
+    if not path:
+        return frozenset()
+    return MmapPasswordBlocklist(path)
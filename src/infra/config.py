@@ -1,4 +1,6 @@
 from datetime import timedelta
+from pathlib import Path
+from typing import Literal
 
 from antidote import injectable
 from pydantic import SecretStr
@@ -17,6 +19,109 @@ class Jwt(BaseSettings):
     access_ttl: timedelta = timedelta(minutes=15)
     refresh_ttl: timedelta = timedelta(days=7)
     clock_skew: timedelta = timedelta(seconds=30)
+    # Каталог ключей (src/infra/keyring.py) вместо secret_key, алгоритм - по ключу
+    keyring_path: Path | None = None
+    # Ключ подписи из keyring, по умолчанию старший по имени приватный ключ
+    current_kid: str | None = None
+    # Опрос каталога ключей на ротацию, 0 - только SIGHUP
+    keyring_poll_interval: timedelta = timedelta(seconds=30)
+    # Сколько клиенты кэшируют JWKS; столько же новый ключ только публикуется
+    # и лишь потом подписывает (без явного current_kid)
+    jwks_max_age: timedelta = timedelta(minutes=5)
+    # LRU уже проверенных токенов на процесс, 0 - выключен
+    verify_cache_size: int = 10_000
+    # Максимум токенов в одном POST /introspect
+    introspect_max_batch: int = 100
+
+
+class Hasher(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='HASHER_')
+
+    # thread: argon2-cffi отпускает GIL, process: изоляция от GIL целиком
+    executor: Literal['thread', 'process'] = 'thread'
+    max_workers: int = 4
+    # Сверх этого числа запросы сразу получают 503, а не копятся в очереди пула
+    max_pending: int = 64
+
+
+class Blocklist(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='BLOCKLIST_')
+
+    # Файл из `python -m src.infra.blocklist.build`, без него проверка выключена
+    path: Path | None = None
+
+
+class Redis(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='REDIS_')
+
+    url: str = 'redis://localhost:6379/1'
+    # Пул на процесс: соединения переиспользуются между запросами
+    max_connections: int = 64
+    key_prefix: str = 'auth:'
+
+
+class RefreshStore(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='REFRESH_STORE_')
+
+    # db - таблицы refresh_families/refresh_tokens, для узлов без Redis
+    backend: Literal['redis', 'db'] = 'redis'
+
+
+class Revocation(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='REVOCATION_')
+
+    # Локальный bloom-фильтр отзывов на воркер: ~1.8 МБ на миллион ключей
+    filter_capacity: int = 1_000_000
+    filter_error_rate: float = 0.001
+    # Пересборка фильтра по снимку store: чистит истёкшие отзывы
+    resync_interval: timedelta = timedelta(hours=1)
+
+
+class Outbox(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='OUTBOX_')
+
+    batch_size: int = 100
+    # Одновременных отправок в транспорт на один relay
+    max_in_flight: int = 16
+    # Строка PUBLISHING принадлежит relay до конца аренды, потом снова в очереди.
+    # Отправка прерывается за 5 с до конца аренды (LEASE_MARGIN relay)
+    lease: timedelta = timedelta(seconds=30)
+    # Пауза перед повтором растёт вдвое с каждой неудачей, со случайным разбросом
+    retry_base_delay: timedelta = timedelta(seconds=1)
+    retry_max_delay: timedelta = timedelta(minutes=5)
+    # После стольких неудач строка уходит в DLQ: python -m src.infra.messaging.dlq
+    max_attempts: int = 10
+    # LISTEN на NOTIFY из вставки в outbox; опрос - только страховка от
+    # потерянных сигналов. Без LISTEN poll_interval стоит уменьшить
+    listen: bool = True
+    poll_interval: timedelta = timedelta(seconds=30)
+    # Секции по дням: python -m src.infra.messaging.retention раз в сутки
+    # удаляет дни старше retention_days и создаёт секции на premake_days вперёд
+    retention_days: int = 7
+    premake_days: int = 3
+    # Куда выгружать секции перед удалением (ndjson.gz), None - не выгружать
+    archive_dir: Path | None = None
+
+
+class Producer(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='PRODUCER_')
+
+    # log: только лог, memory/file: брокер-заглушка, kafka: нужен aiokafka
+    transport: Literal['log', 'memory', 'file', 'kafka'] = 'log'
+    # Пачка уходит по linger или по размеру, что наступит раньше
+    linger: timedelta = timedelta(milliseconds=5)
+    max_batch_size: int = 16_384
+    compression: Literal['none', 'gzip'] = 'none'
+    # Формат payload (заголовок content-type): json - через orjson, если
+    # установлен; msgpack компактнее, нужен pip install msgpack
+    codec: Literal['json', 'msgpack'] = 'json'
+    max_in_flight: int = 5
+    bootstrap_servers: str = 'localhost:29092'
+    # Таймаут запроса aiokafka; вместе с linger короче OUTBOX_LEASE без запаса
+    request_timeout: timedelta = timedelta(seconds=20)
+    # Брокер-заглушка: партиций в топике и каталог логов для file
+    partitions: int = 3
+    broker_dir: Path = Path('.broker')
 
 
 @injectable
@@ -28,6 +133,13 @@ class Settings(BaseSettings):
     database_url: str
 
     jwt: Jwt = Jwt()
+    hasher: Hasher = Hasher()
+    blocklist: Blocklist = Blocklist()
+    redis: Redis = Redis()
+    refresh_store: RefreshStore = RefreshStore()
+    revocation: Revocation = Revocation()
+    outbox: Outbox = Outbox()
+    producer: Producer = Producer()
 
 
 # Some settings do not have defaults, because it's user's responsibility for
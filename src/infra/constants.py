@@ -1,4 +1,11 @@
+from enum import StrEnum
 from typing import Literal
 
 
 DEFAULT_ALGORITHM: Literal['HS256'] = 'HS256'
+
+
+class JwtAlgorithm(StrEnum):
+    HS256 = 'HS256'
+    RS256 = 'RS256'
+    EDDSA = 'EdDSA'
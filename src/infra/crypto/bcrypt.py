@@ -1,3 +1,4 @@
+from functools import cache
 from typing import override
 
 from passlib.context import CryptContext
@@ -6,15 +7,25 @@ from src.domain.ports import PasswordHasher
 from src.domain.value_objects import Password, PasswordHash
 
 
+def make_crypt_context() -> CryptContext:
+    return CryptContext(
+        schemes=['argon2'],
+        deprecated='auto',
+        argon2__time_cost=3,
+        argon2__memory_cost=64_000,
+        argon2__parallelism=1,
+    )
+
+
+@cache
+def default_crypt_context() -> CryptContext:
+    """Один CryptContext на процесс (в т.ч. на процесс из ProcessPoolExecutor)."""
+    return make_crypt_context()
+
+
 class BcryptPasswordHasherImpl(PasswordHasher):
     def __init__(self) -> None:
-        self._context: CryptContext = CryptContext(
-            schemes=['argon2'],
-            deprecated='auto',
-            argon2__time_cost=3,
-            argon2__memory_cost=64_000,
-            argon2__parallelism=1,
-        )
+        self._context: CryptContext = make_crypt_context()
 
     @override
     async def verify(self, password: Password, password_hash: PasswordHash) -> bool:
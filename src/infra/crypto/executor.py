@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
+from typing import Any, final, override
+
+from src.domain.ports import PasswordHasher
+from src.domain.value_objects import Password, PasswordHash
+
+from src.infra.crypto.bcrypt import default_crypt_context
+from src.infra.exceptions import PasswordHasherOverloadedError
+
+
+class HasherExecutorKind(StrEnum):
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+
+def _hash(password: str) -> str:
+    return default_crypt_context().hash(password)
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    return default_crypt_context().verify(password, password_hash)
+
+
+def make_executor(kind: HasherExecutorKind, max_workers: int) -> Executor:
+    if kind is HasherExecutorKind.PROCESS:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hasher')
+
+
+@final
+class ExecutorPasswordHasherImpl(PasswordHasher):
+    """Argon2 в отдельном пуле, чтобы не блокировать event loop.
+
+    Пул создаётся лениво: для `process` это важно, воркеры uvicorn
+    форкаются раньше, чем придёт первый запрос.
+
+    Args:
+        kind: thread (argon2-cffi отпускает GIL) или process
+        max_workers: Размер пула
+        max_pending: Сколько операций может одновременно ждать/выполняться,
+            остальные получают PasswordHasherOverloadedError
+    """
+
+    def __init__(
+        self,
+        kind: HasherExecutorKind | str = HasherExecutorKind.THREAD,
+        max_workers: int = 4,
+        max_pending: int = 64,
+    ) -> None:
+        self._kind = HasherExecutorKind(kind)
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+    @override
+    async def verify(self, password: Password, password_hash: PasswordHash) -> bool:
+        return await self._run(_verify, password.value, password_hash.value)
+
+    @override
+    async def hash(self, password: Password) -> PasswordHash:
+        return PasswordHash(await self._run(_hash, password.value))
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def _run[T](self, fn: Callable[..., T], *args: str) -> T:
+        if self._pending >= self._max_pending:
+            raise PasswordHasherOverloadedError(
+                ctx={'pending': self._pending, 'max_pending': self._max_pending}
+            )
+
+        if self._executor is None:
+            self._executor = make_executor(self._kind, self._max_workers)
+
+        future = self._executor.submit(fn, *args)
+        with self._lock:
+            self._pending += 1
+        # Отмена await не останавливает уже запущенную задачу в пуле: место
+        # освобождается, только когда она действительно закончилась
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _: Future[Any]) -> None:
+        # Колбэк приходит из потока пула
+        with self._lock:
+            self._pending -= 1
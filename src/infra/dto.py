@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as tp
 from dataclasses import asdict, dataclass
+from datetime import timedelta
 
 from src.domain.value_objects.claims import Claims
 
@@ -68,3 +69,31 @@ class OutboxDto:
     headers: dict[str, tp.Any]
     payload: dict[str, tp.Any]
     id: int | None = None
+    key: str | None = None
+    attempts: int = 0
+    error: str | None = None
+
+    @property
+    def saved_id(self) -> int:
+        """Id of stored row: relay and transports work only with stored messages."""
+        if self.id is None:
+            raise ValueError(f'Outbox message to {self.topic} is not stored')
+        return self.id
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxDelivery:
+    """Message accepted by broker: where it landed."""
+
+    id: int
+    partition: int | None = None
+    offset: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxFailure:
+    """Message is not delivered: retry after `retry_delay`, None - move to DLQ."""
+
+    id: int
+    error: str
+    retry_delay: timedelta | None = None
@@ -7,3 +7,38 @@ class BaseInfrastructureError(BaseMicroserviceError): ...
 class InvalidClaimsError(BaseInfrastructureError):
     code = 'invalid_claims'
     message = 'Claims are not valid'
+
+
+class PasswordHasherOverloadedError(BaseInfrastructureError):
+    code = 'password_hasher_overloaded'
+    message = 'Too many pending password hashing operations'
+
+
+class InvalidBlocklistFileError(BaseInfrastructureError):
+    code = 'invalid_blocklist_file'
+    message = 'Password blocklist file is corrupted or has unknown format'
+
+
+class InvalidKeyringError(BaseInfrastructureError):
+    code = 'invalid_keyring'
+    message = 'Signing keyring is empty or contains unsupported keys'
+
+
+class RevocationFeedClosedError(BaseInfrastructureError):
+    code = 'revocation_feed_closed'
+    message = 'Connection to revocation feed is lost'
+
+
+class OutboxListenerClosedError(BaseInfrastructureError):
+    code = 'outbox_listener_closed'
+    message = 'Connection listening for outbox notifications is lost'
+
+
+class InvalidOutboxLeaseError(BaseInfrastructureError):
+    code = 'invalid_outbox_lease'
+    message = 'Outbox lease is not longer than the longest send'
+
+
+class UnknownEventError(BaseInfrastructureError):
+    code = 'unknown_event'
+    message = 'Message has no registered event type, version or content-type'
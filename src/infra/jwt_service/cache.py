@@ -0,0 +1,54 @@
+import hashlib
+from collections import OrderedDict
+from typing import final
+
+from src.domain.value_objects import Claims
+
+
+def token_digest(token: str) -> bytes:
+    """Ключ кэша: сам токен не храним, blake2b заметно дешевле HMAC + JSON."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+@final
+class VerifiedTokenCache:
+    """LRU уже проверенных токенов.
+
+    Запись живёт до `exp` токена (с учётом clock skew) или пока её не вытеснят.
+    Повторный запрос с тем же bearer-токеном не парсит JSON и не считает HMAC.
+    """
+
+    __slots__ = ('_entries', '_max_size')
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[Claims, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes, now: int) -> Claims | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        claims, expires_at = entry
+        if expires_at < now:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return claims
+
+    def put(self, key: bytes, claims: Claims, expires_at: int) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,181 @@
+import binascii
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.domain.entities import Account
+from src.domain.exceptions import InvalidTokenError
+from src.domain.factories import ClaimsFactory
+from src.domain.policies import verification_policies
+from src.domain.ports import JwtService
+from src.domain.value_objects import (
+    AccessToken,
+    Claims,
+    RefreshToken,
+    Scope,
+    TokenPair,
+)
+from src.domain.value_objects.token import (
+    TokenIntrospection,
+    TokenSpecification,
+    TokenType,
+)
+
+from src.infra.jwt_service.cache import VerifiedTokenCache, token_digest
+from src.infra.jwt_service.signers import JwsSigner, b64url_decode, encode_payload
+from src.infra.key_provider import KeyProvider
+
+
+@dataclass(frozen=True, slots=True)
+class CompactJwtServiceImpl(JwtService):
+    """Сервис создания и проверки токенов через JwsSigner из KeyProvider.
+
+    Токены совместимы с python-jose (тот же заголовок и payload), но без
+    его накладных расходов: см. benchmarks/jwt_sign.py.
+    """
+
+    claims_factory: ClaimsFactory
+    key_provider: KeyProvider
+    spec: TokenSpecification
+    cache: VerifiedTokenCache = field(default_factory=VerifiedTokenCache)
+
+    def _encode_claims(self, claims: Claims, signer: JwsSigner | None = None) -> str:
+        signer = signer or self.key_provider.signer()
+        return signer.sign(encode_payload(claims.as_dict()))
+
+    async def issue_access(self, account: Account, scopes: list[Scope]) -> AccessToken:
+        claims = self.claims_factory.access_claims(sub=str(account.identifier))
+        return AccessToken(self._encode_claims(claims))
+
+    async def issue_refresh(self, account: Account) -> RefreshToken:
+        claims = self.claims_factory.refresh_claims(sub=str(account.identifier))
+        return RefreshToken(self._encode_claims(claims))
+
+    async def issue_pair(self, account: Account, scopes: list[Scope]) -> TokenPair:
+        return (await self.issue_pairs([account], scopes))[0]
+
+    async def issue_pairs(
+        self, accounts: Sequence[Account], scopes: list[Scope]
+    ) -> list[TokenPair]:
+        """Пары токенов: одно чтение часов и один signer на весь батч."""
+        signer = self.key_provider.signer()
+        subs = [str(account.identifier) for account in accounts]
+
+        return [
+            TokenPair(
+                access_token=AccessToken(self._encode_claims(access, signer)),
+                refresh_token=RefreshToken(self._encode_claims(refresh, signer)),
+            )
+            for access, refresh in self.claims_factory.many_pair_claims(subs)
+        ]
+
+    async def sign_claims(self, claims: Sequence[Claims]) -> list[str]:
+        """Один signer на пачку: ротация ключа не разрежет пару токенов."""
+        signer = self.key_provider.signer()
+        return [self._encode_claims(item, signer) for item in claims]
+
+    async def verify_access(self, token: AccessToken) -> Claims:
+        return self._verify(token.value, TokenType.ACCESS, int(time.time()))
+
+    async def verify_refresh(self, token: RefreshToken) -> Claims:
+        return self._verify(token.value, TokenType.REFRESH, int(time.time()))
+
+    async def introspect(self, tokens: Sequence[str]) -> list[TokenIntrospection]:
+        """Проверить пачку токенов одним проходом.
+
+        Общие на всю пачку: одно чтение часов, один текущий signer, кэш.
+        Повторы внутри пачки (несколько запросов одного клиента) проверяются раз.
+        """
+        now = int(time.time())
+        signer = self.key_provider.signer()
+        results: dict[str, TokenIntrospection] = {}
+
+        for token in tokens:
+            if token in results:
+                continue
+
+            try:
+                claims = self._verify(token, None, now, signer)
+            except InvalidTokenError:
+                results[token] = TokenIntrospection(active=False)
+            else:
+                results[token] = TokenIntrospection(active=True, claims=claims)
+
+        return [results[token] for token in tokens]
+
+    def _verify(
+        self,
+        token: str,
+        token_type: TokenType | None,
+        now: int,
+        signer: JwsSigner | None = None,
+    ) -> Claims:
+        """Проверка от дешёвого к дорогому: кэш, exp, подпись, политики.
+
+        Raises:
+            InvalidTokenError: Token is malformed, expired or has bad signature
+        """
+        skew = int(self.spec.lifetime.clock_skew.total_seconds())
+        digest = token_digest(token)
+
+        if claims := self.cache.get(digest, now):
+            if token_type is not None and claims.typ != token_type.value:
+                raise InvalidTokenError('Wrong token type', ctx={'typ': claims.typ})
+            return claims
+
+        header_segment, payload_segment, signature = self._split(token)
+        payload = self._decode_segment(payload_segment)
+
+        # exp до подписи: просроченные токены не стоят ни одного HMAC
+        exp = payload.get('exp')
+        if not isinstance(exp, int) or exp + skew < now:
+            raise InvalidTokenError('Token expired', ctx={'exp': exp, 'now': now})
+
+        verifier = self._verifier(header_segment, signer or self.key_provider.signer())
+        signing_input = f'{header_segment}.{payload_segment}'.encode()
+
+        if not verifier.verify(signing_input, signature):
+            raise InvalidTokenError('Bad signature', ctx={'kid': verifier.kid})
+
+        claims = Claims.from_dict(payload)
+        decision = verification_policies(
+            token_type, self.spec.realm, now=now, skew=skew
+        ).decide(claims)
+
+        if not decision.ok:
+            issues = [issue.code.value for issue in decision.issues]
+            raise InvalidTokenError(ctx={'issues': issues})
+
+        self.cache.put(digest, claims, expires_at=exp + skew)
+        return claims
+
+    def _split(self, token: str) -> tuple[str, str, bytes]:
+        try:
+            header_segment, payload_segment, signature_segment = token.split('.')
+            return header_segment, payload_segment, b64url_decode(signature_segment)
+        except (ValueError, binascii.Error) as e:
+            raise InvalidTokenError('Malformed token', ctx={}) from e
+
+    def _decode_segment(self, segment: str) -> dict[str, Any]:
+        try:
+            decoded = json.loads(b64url_decode(segment))
+        except (ValueError, binascii.Error) as e:
+            raise InvalidTokenError('Malformed token', ctx={}) from e
+
+        if not isinstance(decoded, dict):
+            raise InvalidTokenError('Malformed token', ctx={})
+        return decoded
+
+    def _verifier(self, header_segment: str, signer: JwsSigner) -> JwsSigner:
+        # Токен выпущен текущим ключом: заголовок байт-в-байт наш, JSON не нужен
+        if header_segment == signer.header_segment:
+            return signer
+
+        header = self._decode_segment(header_segment)
+        verifier = self.key_provider.verifier(header.get('kid'))
+
+        if verifier is None or header.get('alg') != verifier.alg:
+            raise InvalidTokenError('Unknown signing key', ctx={'header': header})
+        return verifier
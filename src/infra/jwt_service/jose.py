@@ -1,13 +1,27 @@
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from jose import jwt
+from jose import JWTError, jwt
 
 from src.domain.entities import Account
+from src.domain.exceptions import InvalidTokenError
 from src.domain.factories import ClaimsFactory
+from src.domain.policies import verification_policies
 from src.domain.ports import JwtService
-from src.domain.value_objects import AccessToken, Claims, RefreshToken, Scope
-from src.domain.value_objects.token import TokenSpecification
+from src.domain.value_objects import (
+    AccessToken,
+    Claims,
+    RefreshToken,
+    Scope,
+    TokenPair,
+)
+from src.domain.value_objects.token import (
+    TokenIntrospection,
+    TokenSpecification,
+    TokenType,
+)
 
 from src.infra.key_provider import KeyProvider
 
@@ -35,7 +49,26 @@ class JoseJwtServiceImpl(JwtService):
             audience=audience,
         )
 
-        return Claims(**raw_claims)
+        return Claims.from_dict(raw_claims)
+
+    async def _verify(self, token: str, token_type: TokenType | None) -> Claims:
+        try:
+            claims = await self._decode_claims(
+                token, audience=self.spec.realm.audience[0]
+            )
+        except JWTError as e:
+            raise InvalidTokenError(str(e), ctx={}) from e
+
+        now = int(time.time())
+        skew = int(self.spec.lifetime.clock_skew.total_seconds())
+        decision = verification_policies(
+            token_type, self.spec.realm, now=now, skew=skew
+        ).decide(claims)
+
+        if not decision.ok:
+            issues = [issue.code.value for issue in decision.issues]
+            raise InvalidTokenError(ctx={'issues': issues})
+        return claims
 
     async def issue_access(self, account: Account, scopes: list[Scope]) -> AccessToken:
         claims = self.claims_factory.access_claims(sub=str(account.identifier))
@@ -46,3 +79,41 @@ class JoseJwtServiceImpl(JwtService):
         claims = self.claims_factory.refresh_claims(sub=str(account.identifier))
         token: str = await self._encode_claims(claims)
         return RefreshToken(token)
+
+    async def issue_pair(self, account: Account, scopes: list[Scope]) -> TokenPair:
+        return (await self.issue_pairs([account], scopes))[0]
+
+    async def issue_pairs(
+        self, accounts: Sequence[Account], scopes: list[Scope]
+    ) -> list[TokenPair]:
+        subs = [str(account.identifier) for account in accounts]
+
+        return [
+            TokenPair(
+                access_token=AccessToken(await self._encode_claims(access)),
+                refresh_token=RefreshToken(await self._encode_claims(refresh)),
+            )
+            for access, refresh in self.claims_factory.many_pair_claims(subs)
+        ]
+
+    async def sign_claims(self, claims: Sequence[Claims]) -> list[str]:
+        return [await self._encode_claims(item) for item in claims]
+
+    async def verify_access(self, token: AccessToken) -> Claims:
+        return await self._verify(token.value, TokenType.ACCESS)
+
+    async def verify_refresh(self, token: RefreshToken) -> Claims:
+        return await self._verify(token.value, TokenType.REFRESH)
+
+    async def introspect(self, tokens: Sequence[str]) -> list[TokenIntrospection]:
+        results: list[TokenIntrospection] = []
+
+        for token in tokens:
+            try:
+                claims = await self._verify(token, None)
+            except InvalidTokenError:
+                results.append(TokenIntrospection(active=False))
+            else:
+                results.append(TokenIntrospection(active=True, claims=claims))
+
+        return results
@@ -0,0 +1,29 @@
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from operator import itemgetter
+
+from src.infra.jwt_service.signers import JwsSigner
+
+
+_jwks_json = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+
+
+@dataclass(frozen=True, slots=True)
+class JwksDocument:
+    """Готовый ответ `/.well-known/jwks.json`.
+
+    Собирается один раз при загрузке ключей: на запрос - только сравнение ETag.
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_signers(cls, signers: Iterable[JwsSigner]) -> 'JwksDocument':
+        keys = [jwk for signer in signers if (jwk := signer.jwk()) is not None]
+        keys.sort(key=itemgetter('kid'))
+
+        body = _jwks_json.encode({'keys': keys}).encode()
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
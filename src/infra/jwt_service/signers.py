@@ -0,0 +1,206 @@
+import base64
+import hashlib
+import hmac
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Protocol, final, override
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from src.infra.constants import JwtAlgorithm
+from src.infra.exceptions import InvalidKeyringError
+
+
+# Один экземпляр вместо json.dumps(..., separators=...): dumps с нестандартными
+# аргументами каждый раз создаёт новый JSONEncoder
+_compact_json = json.JSONEncoder(separators=(',', ':'))
+_header_json = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+
+
+def b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def b64url_decode(data: str | bytes) -> bytes:
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+def encode_payload(payload: dict[str, Any]) -> bytes:
+    return _compact_json.encode(payload).encode()
+
+
+def encode_header(alg: str, kid: str | None = None) -> bytes:
+    """Base64url JOSE header, байт-в-байт как у python-jose."""
+    header = {'typ': 'JWT', 'alg': alg}
+
+    if kid is not None:
+        header['kid'] = kid
+
+    return b64url_encode(_header_json.encode(header).encode())
+
+
+def _b64url_uint(value: int) -> str:
+    return b64url_encode(value.to_bytes((value.bit_length() + 7) // 8, 'big')).decode()
+
+
+class JwsSigner(Protocol):
+    """Подпись JWS Compact Serialization (`header.payload.signature`)."""
+
+    alg: str
+    kid: str | None
+    header_segment: str
+
+    def sign(self, payload: bytes) -> str: ...
+    def verify(self, signing_input: bytes, signature: bytes) -> bool: ...
+    def jwk(self) -> dict[str, str] | None: ...
+
+
+@final
+class HS256Signer(JwsSigner):
+    """HS256 без накладных расходов python-jose на каждый токен.
+
+    Заголовок сериализуется один раз, HMAC-ключ (ipad/opad) тоже:
+    на токен остаётся `copy()` готового состояния и один `update`.
+    """
+
+    alg: str = JwtAlgorithm.HS256.value
+
+    def __init__(self, secret: str | bytes, kid: str | None = None) -> None:
+        key = secret.encode() if isinstance(secret, str) else secret
+
+        header = encode_header(self.alg, kid)
+
+        self.kid = kid
+        self.header_segment = header.decode()
+        self._header_prefix = header + b'.'
+        self._hmac = hmac.new(key, digestmod=hashlib.sha256)
+
+    @override
+    def sign(self, payload: bytes) -> str:
+        signing_input = self._header_prefix + b64url_encode(payload)
+        return (
+            signing_input + b'.' + b64url_encode(self._digest(signing_input))
+        ).decode()
+
+    @override
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        return hmac.compare_digest(self._digest(signing_input), signature)
+
+    @override
+    def jwk(self) -> dict[str, str] | None:
+        return None  # симметричный ключ не публикуется
+
+    def _digest(self, signing_input: bytes) -> bytes:
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+
+class _AsymmetricSigner(JwsSigner, ABC):
+    """Общая часть RS256/EdDSA: заголовок один раз, ключ без приватной части - только verify."""
+
+    def __init__(self, kid: str) -> None:
+        header = encode_header(self.alg, kid)
+
+        self.kid = kid
+        self.header_segment = header.decode()
+        self._header_prefix = header + b'.'
+
+    @override
+    def sign(self, payload: bytes) -> str:
+        signing_input = self._header_prefix + b64url_encode(payload)
+        return (signing_input + b'.' + b64url_encode(self._sign(signing_input))).decode()
+
+    @abstractmethod
+    def _sign(self, signing_input: bytes) -> bytes: ...
+
+    def _verification_only(self) -> InvalidKeyringError:
+        return InvalidKeyringError(
+            'Key has no private part', ctx={'kid': self.kid, 'alg': self.alg}
+        )
+
+
+@final
+class RS256Signer(_AsymmetricSigner):
+    alg: str = JwtAlgorithm.RS256.value
+
+    def __init__(self, key: RSAPrivateKey | RSAPublicKey, kid: str) -> None:
+        super().__init__(kid)
+        self._private = key if isinstance(key, RSAPrivateKey) else None
+        self._public = key.public_key() if isinstance(key, RSAPrivateKey) else key
+
+    @override
+    def _sign(self, signing_input: bytes) -> bytes:
+        if self._private is None:
+            raise self._verification_only()
+        return self._private.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+
+    @override
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        try:
+            self._public.verify(
+                signature, signing_input, padding.PKCS1v15(), hashes.SHA256()
+            )
+        except InvalidSignature:
+            return False
+        return True
+
+    @override
+    def jwk(self) -> dict[str, str] | None:
+        numbers = self._public.public_numbers()
+        return {
+            'kty': 'RSA',
+            'use': 'sig',
+            'alg': self.alg,
+            'kid': self.kid,
+            'n': _b64url_uint(numbers.n),
+            'e': _b64url_uint(numbers.e),
+        }
+
+
+@final
+class EdDSASigner(_AsymmetricSigner):
+    """Ed25519: подпись на порядок дешевле RSA, токены короче."""
+
+    alg: str = JwtAlgorithm.EDDSA.value
+
+    def __init__(self, key: Ed25519PrivateKey | Ed25519PublicKey, kid: str) -> None:
+        super().__init__(kid)
+        self._private = key if isinstance(key, Ed25519PrivateKey) else None
+        self._public = key.public_key() if isinstance(key, Ed25519PrivateKey) else key
+
+    @override
+    def _sign(self, signing_input: bytes) -> bytes:
+        if self._private is None:
+            raise self._verification_only()
+        return self._private.sign(signing_input)
+
+    @override
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        try:
+            self._public.verify(signature, signing_input)
+        except InvalidSignature:
+            return False
+        return True
+
+    @override
+    def jwk(self) -> dict[str, str] | None:
+        raw = self._public.public_bytes(Encoding.Raw, PublicFormat.Raw)
+        return {
+            'kty': 'OKP',
+            'crv': 'Ed25519',
+            'use': 'sig',
+            'alg': self.alg,
+            'kid': self.kid,
+            'x': b64url_encode(raw).decode(),
+        }
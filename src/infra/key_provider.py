@@ -1,9 +1,17 @@
-from enum import StrEnum
+import time
+from datetime import timedelta
+from pathlib import Path
 from typing import Protocol
 
-
-class JwtAlgorithm(StrEnum):
-    HS256 = 'HS256'
+from src.infra.constants import JwtAlgorithm
+from src.infra.jwt_service.jwks import JwksDocument
+from src.infra.jwt_service.signers import HS256Signer, JwsSigner
+from src.infra.keyring import (
+    Keyring,
+    keyring_fingerprint,
+    load_keyring,
+    read_keyring_directory,
+)
 
 
 class KeyProvider(Protocol):
@@ -11,11 +19,16 @@ class KeyProvider(Protocol):
     def current_kid(self) -> str | None: ...
     def signing_key(self) -> str: ...
     def verification_key(self, kid: str | None) -> str: ...
+    def signer(self) -> JwsSigner: ...
+    def verifier(self, kid: str | None) -> JwsSigner | None: ...
+    def jwks(self) -> JwksDocument: ...
 
 
 class HS256KeyProviderImpl(KeyProvider):
     def __init__(self, secret: str) -> None:
         self._secret = secret
+        self._signer = HS256Signer(secret)
+        self._jwks = JwksDocument.from_signers([])  # секрет не публикуется
 
     def algorithm(self) -> str:
         return JwtAlgorithm.HS256.value
@@ -28,3 +41,127 @@ class HS256KeyProviderImpl(KeyProvider):
 
     def verification_key(self, kid: str | None) -> str:
         return self._secret
+
+    def signer(self) -> JwsSigner:
+        return self._signer
+
+    def verifier(self, kid: str | None) -> JwsSigner | None:
+        return self._signer
+
+    def jwks(self) -> JwksDocument:
+        return self._jwks
+
+
+class KeyringKeyProviderImpl(KeyProvider):
+    """Ключи из каталога с горячей ротацией, см. src/infra/keyring.py.
+
+    Ключи разбираются один раз, поиск verifier по kid - обращение к dict.
+    `refresh()` перечитывает каталог, только если он изменился, и подменяет
+    Keyring одним присваиванием. Ключ, исчезнувший из каталога, остаётся в
+    наборе проверки ещё `retention` (refresh_ttl): выпущенные им токены живы.
+    Новый ключ подписывает не раньше, чем через `publish_delay` (max-age
+    JWKS) после появления: до этого он только в JWKS.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        current_kid: str | None = None,
+        *,
+        retention: timedelta = timedelta(0),
+        publish_delay: timedelta = timedelta(0),
+    ) -> None:
+        self._directory = directory
+        self._current_kid = current_kid
+        self._retention = retention.total_seconds()
+        self._publish_delay = publish_delay.total_seconds()
+        self._fingerprint = keyring_fingerprint(directory)
+        self._keyring = load_keyring(
+            directory, current_kid, publish_delay=self._publish_delay
+        )
+        # kid -> (signer, до какого момента принимать его токены)
+        self._retired: dict[str, tuple[JwsSigner, float]] = {}
+
+    def refresh(self, *, force: bool = False, now: float | None = None) -> bool:
+        """Перечитать каталог, если он изменился.
+
+        Returns:
+            True, если набор ключей поменялся
+
+        Raises:
+            InvalidKeyringError: New keyring is broken, the old one stays active
+        """
+        now = time.time() if now is None else now
+        fingerprint = keyring_fingerprint(self._directory)
+        expired = any(until <= now for _, until in self._retired.values())
+        activates_at = self._keyring.activates_at
+        activated = activates_at is not None and activates_at <= now
+
+        if (
+            not force
+            and not expired
+            and not activated
+            and fingerprint == self._fingerprint
+        ):
+            return False
+
+        files = read_keyring_directory(self._directory)
+        retired = {
+            kid: (signer, until)
+            for kid, (signer, until) in self._retired.items()
+            if until > now and kid not in files
+        }
+        # Только что удалённые из каталога ключи: отсчёт retention начинается сейчас
+        for kid, signer in self._keyring.signers.items():
+            if kid not in files and kid not in self._retired:
+                retired[kid] = (signer, now + self._retention)
+
+        keyring = Keyring.from_files(
+            files,
+            self._current_kid,
+            retired={kid: signer for kid, (signer, _) in retired.items()},
+            publish_delay=self._publish_delay,
+            now=now,
+        )
+
+        self._keyring, self._retired, self._fingerprint = keyring, retired, fingerprint
+        return True
+
+    def algorithm(self) -> str:
+        return self._keyring.current.alg
+
+    def current_kid(self) -> str | None:
+        return self._keyring.current.kid
+
+    def signing_key(self) -> str:
+        keyring = self._keyring
+        return keyring.materials[keyring.current.kid or '']
+
+    def verification_key(self, kid: str | None) -> str:
+        return self._keyring.materials[kid or '']
+
+    def signer(self) -> JwsSigner:
+        return self._keyring.current
+
+    def verifier(self, kid: str | None) -> JwsSigner | None:
+        if kid is None:
+            return None
+        return self._keyring.signers.get(kid)
+
+    def jwks(self) -> JwksDocument:
+        return self._keyring.jwks
+
+
+def make_key_provider(
+    secret: str,
+    keyring_path: Path | None,
+    current_kid: str | None,
+    retention: timedelta,
+    publish_delay: timedelta = timedelta(0),
+) -> KeyProvider:
+    """HS256 из настроек или каталог ключей, если задан JWT_KEYRING_PATH."""
+    if keyring_path is None:
+        return HS256KeyProviderImpl(secret)
+    return KeyringKeyProviderImpl(
+        keyring_path, current_kid, retention=retention, publish_delay=publish_delay
+    )
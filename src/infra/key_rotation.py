@@ -0,0 +1,83 @@
+"""Горячая ротация ключей подписи без рестарта воркеров.
+
+Каталог ключей перечитывается по SIGHUP и по опросу mtime раз в `interval`.
+Опрос - только stat файлов каталога, разбор ключей - лишь при изменениях.
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+from datetime import timedelta
+from typing import final
+
+from src.infra.exceptions import InvalidKeyringError
+from src.infra.key_provider import KeyringKeyProviderImpl
+
+
+logger = logging.getLogger(__name__)
+
+
+@final
+class KeyringWatcher:
+    """Фоновая задача ротации для KeyringKeyProviderImpl.
+
+    Битый каталог (файл дописан наполовину, удалён текущий ключ) не ломает
+    сервис: ошибка пишется в лог, продолжает работать прежний набор ключей.
+
+    Args:
+        provider: Провайдер, который нужно обновлять
+        interval: Период опроса, 0 - только SIGHUP
+    """
+
+    def __init__(self, provider: KeyringKeyProviderImpl, interval: timedelta) -> None:
+        self._provider = provider
+        self._interval = interval.total_seconds()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._force = False
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        # Сигналы только в главном потоке и не на Windows: там остаётся опрос
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            loop.add_signal_handler(signal.SIGHUP, self.reload)
+
+        self._task = loop.create_task(self._run(), name='keyring-watcher')
+
+    async def stop(self) -> None:
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def reload(self) -> None:
+        """Перечитать каталог немедленно (обработчик SIGHUP)."""
+        self._force = True
+        self._wakeup.set()
+
+    def refresh(self) -> None:
+        force, self._force = self._force, False
+
+        try:
+            if self._provider.refresh(force=force):
+                logger.info(
+                    'Keyring reloaded, current kid %s', self._provider.current_kid()
+                )
+        except (InvalidKeyringError, OSError):
+            logger.exception('Keyring reload failed, keeping previous keys')
+
+    async def _run(self) -> None:
+        timeout = self._interval or None
+
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+            self._wakeup.clear()
+            self.refresh()
@@ -0,0 +1,235 @@
+"""Кольцо ключей подписи из каталога.
+
+Каталог содержит по файлу на ключ, имя файла - kid:
+    `<kid>.pem` - PKCS#8 приватный ключ (подпись и проверка) или
+        SubjectPublicKeyInfo (только проверка, например выведенный из оборота
+        ключ, чьи токены ещё живы). RSA (RS256) и Ed25519 (EdDSA).
+    `<kid>.secret` - HS256 секрет, содержимое файла целиком.
+
+Генерация ключа:
+    openssl genpkey -algorithm ed25519 -out keys/2026-10-01.pem
+    openssl genpkey -algorithm rsa -pkeyopt rsa_keygen_bits:2048 -out keys/k1.pem
+    openssl rand -base64 48 > keys/2026-10-01.secret
+
+Ротация: положить новый файл (через rename, чтобы не прочитать недописанный)
+и прислать SIGHUP или дождаться опроса, см. src/infra/key_rotation.py.
+Без явного current_kid новый ключ сначала только публикуется в JWKS и
+начинает подписывать через publish_delay после mtime файла: верификаторы с
+закэшированным JWKS успевают его увидеть.
+"""
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+    PublicKeyTypes,
+)
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+
+from src.infra.exceptions import InvalidKeyringError
+from src.infra.jwt_service.jwks import JwksDocument
+from src.infra.jwt_service.signers import (
+    EdDSASigner,
+    HS256Signer,
+    JwsSigner,
+    RS256Signer,
+)
+
+
+_PRIVATE_KEY_MARKER = b'PRIVATE KEY-----'
+
+
+class KeyFormat(StrEnum):
+    PEM = '.pem'
+    SECRET = '.secret'  # noqa: S105 suffix, not a secret
+
+
+@dataclass(frozen=True, slots=True)
+class KeyFile:
+    kid: str
+    fmt: KeyFormat
+    data: bytes
+    # mtime файла: с этого момента ключ виден в JWKS
+    mtime: float = 0.0
+
+    @property
+    def can_sign(self) -> bool:
+        return self.fmt is KeyFormat.SECRET or _PRIVATE_KEY_MARKER in self.data
+
+
+def load_signer(key_file: KeyFile) -> JwsSigner:
+    """Разобрать ключ и построить для него signer.
+
+    Raises:
+        InvalidKeyringError: Key is malformed or has unsupported type
+    """
+    if key_file.fmt is KeyFormat.SECRET:
+        secret = key_file.data.strip()
+        if not secret:
+            raise InvalidKeyringError('Empty secret', ctx={'kid': key_file.kid})
+        return HS256Signer(secret, kid=key_file.kid)
+
+    return _load_pem_signer(key_file)
+
+
+def _material(key_file: KeyFile) -> str:
+    """Ключ текстом для python-jose.
+
+    Raises:
+        InvalidKeyringError: Key file is not UTF-8 text (raw bytes of `openssl rand`)
+    """
+    try:
+        return key_file.data.decode().strip()
+    except UnicodeDecodeError as e:
+        raise InvalidKeyringError(
+            'Key is not UTF-8 text', ctx={'kid': key_file.kid}
+        ) from e
+
+
+def _load_pem_signer(key_file: KeyFile) -> JwsSigner:
+    kid = key_file.kid
+    key: PrivateKeyTypes | PublicKeyTypes
+
+    try:
+        if key_file.can_sign:
+            key = load_pem_private_key(key_file.data, password=None)
+        else:
+            key = load_pem_public_key(key_file.data)
+    except (ValueError, TypeError) as e:
+        raise InvalidKeyringError('Malformed key', ctx={'kid': kid}) from e
+
+    if isinstance(key, RSAPrivateKey | RSAPublicKey):
+        return RS256Signer(key, kid)
+    if isinstance(key, Ed25519PrivateKey | Ed25519PublicKey):
+        return EdDSASigner(key, kid)
+
+    raise InvalidKeyringError(
+        'Unsupported key type', ctx={'kid': kid, 'type': type(key).__name__}
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Keyring:
+    """Разобранные ключи: signer на kid, текущий ключ подписи и JWKS.
+
+    Неизменяемый: ротация собирает новый Keyring и подменяет ссылку целиком,
+    читатели никогда не видят полуобновлённое состояние.
+    """
+
+    current: JwsSigner
+    signers: Mapping[str, JwsSigner]
+    materials: Mapping[str, str]  # PEM или секрет по kid, для python-jose
+    jwks: JwksDocument
+    # Когда ждущий публикации ключ станет ключом подписи
+    activates_at: float | None = None
+
+    @classmethod
+    def from_files(
+        cls,
+        files: Mapping[str, KeyFile],
+        current_kid: str | None,
+        *,
+        retired: Mapping[str, JwsSigner] | None = None,
+        publish_delay: float = 0,
+        now: float | None = None,
+    ) -> 'Keyring':
+        """Собрать кольцо.
+
+        Args:
+            files: Ключи по kid
+            current_kid: Ключ подписи. По умолчанию - старший по имени ключ с
+                приватной частью, опубликованный не меньше publish_delay
+                секунд назад, так что kid вида `2026-10-01` ротируются
+                простым добавлением файла
+            retired: Ключи, которых уже нет в каталоге, но токены которых
+                ещё нужно принимать
+            publish_delay: Сколько новый ключ только публикуется в JWKS
+            now: Текущее время, по умолчанию time.time()
+        """
+        signers = {**(retired or {})}
+        signers.update({kid: load_signer(key_file) for kid, key_file in files.items()})
+        signing_kids = sorted(kid for kid, key_file in files.items() if key_file.can_sign)
+        activates_at = None
+
+        if current_kid is None and signing_kids:
+            now = time.time() if now is None else now
+            published = [
+                kid for kid in signing_kids if files[kid].mtime + publish_delay <= now
+            ]
+            # Опубликованных нет (первый запуск): ждать некого, подписывает старший
+            current_kid = (published or signing_kids)[-1]
+            activates_at = min(
+                (
+                    files[kid].mtime + publish_delay
+                    for kid in signing_kids
+                    if kid > current_kid
+                ),
+                default=None,
+            )
+
+        if current_kid not in signing_kids:
+            raise InvalidKeyringError(
+                'No private key to sign with',
+                ctx={'current_kid': current_kid, 'kids': sorted(signers)},
+            )
+
+        return cls(
+            current=signers[current_kid],
+            signers=signers,
+            materials={kid: _material(key_file) for kid, key_file in files.items()},
+            jwks=JwksDocument.from_signers(signers.values()),
+            activates_at=activates_at,
+        )
+
+
+def read_keyring_directory(directory: Path) -> dict[str, KeyFile]:
+    files: dict[str, KeyFile] = {}
+
+    for path in sorted(directory.iterdir()):
+        if path.suffix not in KeyFormat or not path.is_file():
+            continue
+        if path.stem in files:
+            raise InvalidKeyringError('Duplicate kid', ctx={'kid': path.stem})
+
+        files[path.stem] = KeyFile(
+            path.stem,
+            KeyFormat(path.suffix),
+            path.read_bytes(),
+            mtime=path.stat().st_mtime,
+        )
+
+    return files
+
+
+def keyring_fingerprint(directory: Path) -> tuple[tuple[str, int, int], ...]:
+    """Дешёвый слепок каталога (stat без чтения файлов) для опроса изменений."""
+    return tuple(
+        (path.name, stat.st_mtime_ns, stat.st_size)
+        for path in sorted(directory.iterdir())
+        if path.suffix in KeyFormat and (stat := path.stat())
+    )
+
+
+def load_keyring(
+    directory: Path, current_kid: str | None = None, *, publish_delay: float = 0
+) -> Keyring:
+    """Прочитать и разобрать все ключи каталога.
+
+    Raises:
+        InvalidKeyringError: Directory has no usable signing key
+    """
+    return Keyring.from_files(
+        read_keyring_directory(directory), current_kid, publish_delay=publish_delay
+    )
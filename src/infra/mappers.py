@@ -1,3 +1,5 @@
+from typing import Any
+
 from src.domain.entities import Account
 from src.domain.value_objects import Email, PasswordHash
 
@@ -15,11 +17,16 @@ def account_db_to_account(account_db: AccountDb) -> Account:
     )
 
 
-def account_to_account_db(account: Account) -> AccountDb:
-    return AccountDb(
-        id=account.identifier,
-        username=account.username,
-        email=account.email.value,
-        password_hash=account.password_hash.value,
-        is_active=account.is_active,
-    )
+def account_to_row(account: Account) -> dict[str, Any]:
+    """Values for Core INSERT (without ORM object and session identity map)."""
+    row: dict[str, Any] = {
+        'username': account.username,
+        'email': account.email.value,
+        'password_hash': account.password_hash.value,
+        'is_active': account.is_active,
+    }
+
+    if account.identifier is not None:
+        row['id'] = account.identifier
+
+    return row
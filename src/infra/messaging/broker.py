@@ -0,0 +1,199 @@
+"""Брокер-заглушка для продюсера: локальный запуск, тесты и бенчмарки без Kafka.
+
+Брокер принимает пачку записей целиком (сжатую, как её отправил продюсер),
+назначает ей смещения подряд и возвращает смещение первой записи - как
+produce-запрос к лидеру партиции в Kafka.
+
+Формат пачки: байт кодека, затем (возможно сжатые) записи подряд, каждая -
+заголовок `>iII` (длина ключа или -1, длина значения, длина заголовков),
+ключ, значение и заголовки в JSON.
+"""
+
+import asyncio
+import gzip
+import json
+import struct
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Literal, Protocol, final, override
+
+
+type Compression = Literal['none', 'gzip']
+
+_CODECS: dict[Compression, int] = {'none': 0, 'gzip': 1}
+_RECORD = struct.Struct('>iII')
+# Кадр в логе FileBrokerImpl: смещение первой записи, число записей, длина пачки
+_FRAME = struct.Struct('>QII')
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    value: bytes
+    key: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def encode_batch(records: list[Record], compression: Compression = 'none') -> bytes:
+    buffer = bytearray()
+    for record in records:
+        key = record.key.encode() if record.key is not None else b''
+        headers = json.dumps(record.headers).encode()
+        key_length = len(key) if record.key is not None else -1
+        buffer += _RECORD.pack(key_length, len(record.value), len(headers))
+        buffer += key + record.value + headers
+
+    body = gzip.compress(buffer, compresslevel=1) if compression == 'gzip' else buffer
+    return bytes([_CODECS[compression]]) + body
+
+
+def decode_batch(batch: bytes) -> list[Record]:
+    body = gzip.decompress(batch[1:]) if batch[0] == _CODECS['gzip'] else batch[1:]
+
+    records: list[Record] = []
+    position = 0
+    while position < len(body):
+        key_length, value_length, headers_length = _RECORD.unpack_from(body, position)
+        position += _RECORD.size
+
+        key = None
+        if key_length >= 0:
+            key = body[position : position + key_length].decode()
+            position += key_length
+        value = body[position : position + value_length]
+        position += value_length
+        headers = json.loads(body[position : position + headers_length])
+        position += headers_length
+
+        records.append(Record(value=bytes(value), key=key, headers=headers))
+
+    return records
+
+
+class Broker(Protocol):
+    def partitions(self, topic: str) -> int: ...
+
+    async def append(self, topic: str, partition: int, batch: bytes, count: int) -> int:
+        """Store batch of `count` records and return offset of the first one."""
+
+
+@final
+class MemoryBrokerImpl(Broker):
+    """Пачки в памяти процесса.
+
+    Args:
+        partitions: Партиций в каждом топике
+        latency: Задержка ответа на каждую пачку, как сетевой round trip
+    """
+
+    def __init__(self, partitions: int = 1, latency: timedelta = timedelta()) -> None:
+        self._partitions = partitions
+        self._latency = latency.total_seconds()
+        self._batches: dict[tuple[str, int], list[bytes]] = defaultdict(list)
+        self._offsets: dict[tuple[str, int], int] = defaultdict(int)
+        self.requests = 0
+
+    @override
+    def partitions(self, topic: str) -> int:
+        return self._partitions
+
+    @override
+    async def append(self, topic: str, partition: int, batch: bytes, count: int) -> int:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+        self.requests += 1
+        self._batches[topic, partition].append(batch)
+        base_offset = self._offsets[topic, partition]
+        self._offsets[topic, partition] += count
+        return base_offset
+
+    def records(self, topic: str, partition: int) -> list[Record]:
+        return [
+            record
+            for batch in self._batches[topic, partition]
+            for record in decode_batch(batch)
+        ]
+
+
+@final
+class FileBrokerImpl(Broker):
+    """Лог `<topic>-<partition>.log` на партицию: смещения переживают перезапуск.
+
+    Запись в файл - в потоке, чтобы не блокировать event loop.
+    Один процесс на каталог: смещения после старта считаются по кадрам лога.
+    """
+
+    def __init__(self, directory: Path, partitions: int = 1) -> None:
+        self._directory = directory
+        self._partitions = partitions
+        self._offsets: dict[tuple[str, int], int] = {}
+        self._locks: dict[tuple[str, int], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @override
+    def partitions(self, topic: str) -> int:
+        return self._partitions
+
+    @override
+    async def append(self, topic: str, partition: int, batch: bytes, count: int) -> int:
+        path = self._path(topic, partition)
+        async with self._locks[topic, partition]:
+            if (topic, partition) not in self._offsets:
+                self._offsets[topic, partition] = await asyncio.to_thread(
+                    _next_offset, path
+                )
+
+            base_offset = self._offsets[topic, partition]
+            frame = _FRAME.pack(base_offset, count, len(batch)) + batch
+            await asyncio.to_thread(_append, path, frame)
+            self._offsets[topic, partition] = base_offset + count
+
+        return base_offset
+
+    def records(self, topic: str, partition: int) -> list[Record]:
+        path = self._path(topic, partition)
+        if not path.exists():
+            return []
+
+        return [
+            record
+            for _, _, batch in _frames(path.read_bytes())
+            for record in decode_batch(batch)
+        ]
+
+    def _path(self, topic: str, partition: int) -> Path:
+        return self._directory / f'{topic}-{partition}.log'
+
+
+def _frames(data: bytes) -> list[tuple[int, int, bytes]]:
+    frames: list[tuple[int, int, bytes]] = []
+    position = 0
+    while position < len(data):
+        base_offset, count, length = _FRAME.unpack_from(data, position)
+        position += _FRAME.size
+        frames.append((base_offset, count, data[position : position + length]))
+        position += length
+
+    return frames
+
+
+def _next_offset(path: Path) -> int:
+    if not path.exists():
+        return 0
+
+    # Только заголовки кадров: пачки пропускаются seek-ом
+    next_offset = 0
+    with path.open('rb') as log:
+        while header := log.read(_FRAME.size):
+            base_offset, count, length = _FRAME.unpack(header)
+            next_offset = base_offset + count
+            log.seek(length, 1)
+
+    return next_offset
+
+
+def _append(path: Path, frame: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('ab') as log:
+        log.write(frame)
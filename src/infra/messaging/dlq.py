@@ -0,0 +1,69 @@
+"""Просмотр и replay строк outbox в DLQ.
+
+Usage:
+    python -m src.infra.messaging.dlq list --limit 50
+    python -m src.infra.messaging.dlq replay --id 17 --id 42
+    python -m src.infra.messaging.dlq replay --all
+
+Replay возвращает строку в очередь как новую: attempts обнуляется, relay
+берёт её в ближайшем claim. Причина ошибки видна в list до replay.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Sequence
+
+from src.infra.config import settings
+from src.infra.dto import OutboxDto
+from src.infra.orm.session import async_session, make_async_session_factory, make_engine
+from src.infra.repositories.outbox import OutboxRepositoryDb
+
+
+async def _list(limit: int, after_id: int | None) -> list[OutboxDto]:
+    engine = make_engine(settings.database_url, pool_size=1)
+    try:
+        async with async_session(make_async_session_factory(engine)) as db:
+            return await OutboxRepositoryDb(db).dead_letters(limit, after_id)
+    finally:
+        await engine.dispose()
+
+
+async def _replay(ids: Sequence[int] | None) -> int:
+    engine = make_engine(settings.database_url, pool_size=1)
+    try:
+        async with async_session(make_async_session_factory(engine)) as db:
+            return await OutboxRepositoryDb(db).replay(ids)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list')
+    list_parser.add_argument('--limit', type=int, default=50)
+    list_parser.add_argument('--after-id', type=int, default=None)
+
+    replay_parser = commands.add_parser('replay')
+    target = replay_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--id', type=int, action='append', dest='ids')
+    target.add_argument('--all', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for message in asyncio.run(_list(args.limit, args.after_id)):
+            print(  # noqa: T201
+                f'#{message.id} {message.topic} key={message.key} '
+                f'attempts={message.attempts} error={message.error}'
+            )
+        return
+
+    replayed = asyncio.run(_replay(None if args.all else args.ids))
+    print(f'replayed: {replayed}')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Транспорт в настоящую Kafka через aiokafka (ставится отдельно: pip install aiokafka).
+
+Пачки, linger и сжатие делает сам AIOKafkaProducer; в полёте у него не больше
+одного запроса на партицию, так что порядок внутри партиции сохраняется.
+"""
+
+from datetime import timedelta
+from typing import final, override
+
+from aiokafka import AIOKafkaProducer  # type: ignore[import-not-found]
+
+from src.infra.dto import OutboxDelivery, OutboxDto
+from src.infra.messaging.broker import Compression
+from src.infra.messaging.serialization import Codec, JsonCodecImpl
+from src.infra.messaging.transport import OutboxTransport, encode_headers
+
+
+@final
+class KafkaTransportImpl(OutboxTransport):
+    def __init__(  # noqa: PLR0913 настройки продюсера
+        self,
+        bootstrap_servers: str,
+        *,
+        linger: timedelta = timedelta(milliseconds=5),
+        max_batch_size: int = 16_384,
+        compression: Compression = 'none',
+        codec: Codec | None = None,
+        request_timeout: timedelta = timedelta(seconds=20),
+    ) -> None:
+        self._codec = codec or JsonCodecImpl()
+        self._producer = AIOKafkaProducer(
+            bootstrap_servers=bootstrap_servers,
+            linger_ms=int(linger.total_seconds() * 1000),
+            max_batch_size=max_batch_size,
+            compression_type=None if compression == 'none' else compression,
+            acks='all',
+            enable_idempotence=True,
+            request_timeout_ms=int(request_timeout.total_seconds() * 1000),
+        )
+
+    async def start(self) -> None:
+        await self._producer.start()
+
+    async def close(self) -> None:
+        await self._producer.stop()
+
+    @override
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        headers = encode_headers(message.headers, self._codec)
+        delivery = await self._producer.send(
+            message.topic,
+            self._codec.encode(message.payload),
+            key=message.key.encode() if message.key is not None else None,
+            headers=[(name, value.encode()) for name, value in headers.items()],
+        )
+        metadata = await delivery
+        return OutboxDelivery(message.saved_id, metadata.partition, metadata.offset)
@@ -1,11 +1,12 @@
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, Protocol, TypeVar, final, override
 
-from src.domain.events import DomainEvent
+from src.domain.events import AccountRegistered, DomainEvent
 from src.domain.ports import DomainEventPublisher
 
 from src.infra.dto import OutboxDto
+from src.infra.messaging.serialization import EventDecoderRegistry, EventSerializers
 from src.infra.repositories.outbox import OutboxRepository
 
 
@@ -25,31 +26,78 @@ V = TypeVar('V')
 
 @final
 class ClassRegistry[K, V]:
-    __slots__: tuple[str] = ('_storage',)
+    """Значения по классу ключа с учётом наследования.
+
+    Значение, зарегистрированное для базового класса, достаётся и всем его
+    наследникам. Таблица `тип -> значения` считается по MRO один раз на
+    конкретный тип; `freeze()` после старта заранее строит её для всех
+    известных наследников и запрещает новые регистрации.
+    """
+
+    __slots__: tuple[str, ...] = ('_dispatch', '_frozen', '_storage')
 
     def __init__(self) -> None:
-        self._storage: dict[type[K], list[type[V]]] = defaultdict(list)
+        self._storage: dict[type[K], list[V]] = defaultdict(list)
+        self._dispatch: dict[type[K], tuple[V, ...]] = {}
+        self._frozen = False
+
+    def add(self, key: type[K], value: V) -> None:
+        if self._frozen:
+            raise RuntimeError(f'Registry is frozen, {key.__name__} is too late')
 
-    def add(self, key: type[K], value: type[V]) -> None:
         self._storage[key].append(value)
+        self._dispatch.clear()
+
+    def resolve(self, key: type[K]) -> tuple[V, ...]:
+        """Values for `key` and its bases, most specific class first."""
+        try:
+            return self._dispatch[key]
+        except KeyError:
+            values = self._dispatch[key] = self._compile(key)
+            return values
 
-    def get(
-        self, key: type[K], default: list[type[V]] | None = None
-    ) -> list[type[V]] | None:
-        return self._storage.get(key, default)
+    def freeze(self) -> None:
+        for key in list(self._storage):
+            for cls in (key, *_subclasses(key)):
+                self.resolve(cls)
+
+        self._frozen = True
+
+    def register(self, key: type[K]) -> Callable[[type[V]], type[V]]:
+        """Register single instance of decorated class: values are reused."""
 
-    def register(self, key: type[K]) -> Callable[..., type[V]]:
         def wrapper(cls: type[V]) -> type[V]:
-            self.add(key, cls)
+            self.add(key, cls())
             return cls
 
         return wrapper
 
+    def _compile(self, key: type[K]) -> tuple[V, ...]:
+        values: list[V] = []
+        for cls in key.__mro__:
+            for value in self._storage.get(cls, ()):
+                if value not in values:
+                    values.append(value)
+
+        return tuple(values)
+
+
+def _subclasses[T](cls: type[T]) -> list[type[T]]:
+    found: list[type[T]] = []
+    for subclass in cls.__subclasses__():
+        found.extend((subclass, *_subclasses(subclass)))
+
+    return found
+
 
 event_publisher = ClassRegistry[DomainEvent, KafkaEventPublisher]()
+event_serializers = EventSerializers()
+# Для консумеров: событие по заголовкам type/v публикатора
+event_decoders = EventDecoderRegistry()
 
 
-@event_publisher.register(DomainEvent)
+@event_decoders.register(AccountRegistered)
+@event_publisher.register(AccountRegistered)
 class UserRegisteredPublisher(KafkaEventPublisher):
     topic: str = 'acccount.registered'
     event_type: str = 'AccountRegistered'
@@ -63,17 +111,26 @@ class OutboxEventPublisher(DomainEventPublisher):
 
     @override
     async def publish(self, event: DomainEvent) -> None:
-        publishers = event_publisher.get(event.__class__)
-        if not publishers:
-            return
-
-        for publisher_class in publishers:
-            publisher = publisher_class()
+        await self.publish_many([event])
 
-            outbox_dto = OutboxDto(
-                topic=publisher.topic,
-                headers=publisher.headers,
-                payload=event.as_dict(),
+    @override
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Все строки outbox пачки событий - одним INSERT."""
+        rows: list[OutboxDto] = []
+        for event in events:
+            publishers = event_publisher.resolve(type(event))
+            if not publishers:
+                continue
+
+            payload = event_serializers.get(type(event)).payload(event)
+            rows.extend(
+                OutboxDto(
+                    topic=publisher.topic,
+                    headers=publisher.headers,
+                    payload=payload,
+                    key=event.key,
+                )
+                for publisher in publishers
             )
 
-            await self._repo.create(outbox_dto)
+        await self._repo.create_many(rows)
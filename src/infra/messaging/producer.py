@@ -0,0 +1,162 @@
+"""Асинхронный продюсер с пачками, как у клиентов Kafka.
+
+Записи копятся по партициям и уходят в брокер одним запросом, когда пачка
+набрала `max_batch_size` байт или прошло `linger` с первой записи в ней.
+Запросов в полёте не больше `max_in_flight` на продюсер и не больше одного
+на партицию: порядок записей внутри партиции сохраняется.
+
+`send()` возвращает future с `RecordMetadata` - на неё вешаются
+delivery callbacks; ошибка брокера падает во все future пачки.
+"""
+
+import asyncio
+import logging
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import final
+
+from src.infra.messaging.broker import Broker, Compression, Record, encode_batch
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordMetadata:
+    topic: str
+    partition: int
+    offset: int
+
+
+@dataclass(slots=True)
+class _Batch:
+    records: list[Record] = field(default_factory=list)
+    futures: list[asyncio.Future[RecordMetadata]] = field(default_factory=list)
+    size: int = 0
+    linger: asyncio.TimerHandle | None = None
+
+
+@final
+class BatchingProducerImpl:
+    """Продюсер поверх `Broker`.
+
+    Args:
+        broker: Куда уходят пачки
+        linger: Сколько пачка ждёт попутчиков после первой записи
+        max_batch_size: Размер пачки в байтах, после которого она уходит сразу
+        compression: Сжатие пачки целиком
+        max_in_flight: Одновременных запросов к брокеру
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        *,
+        linger: timedelta = timedelta(milliseconds=5),
+        max_batch_size: int = 16_384,
+        compression: Compression = 'none',
+        max_in_flight: int = 5,
+    ) -> None:
+        self._broker = broker
+        self._linger = linger.total_seconds()
+        self._max_batch_size = max_batch_size
+        self._compression: Compression = compression
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._batches: dict[tuple[str, int], _Batch] = {}
+        self._partition_locks: dict[tuple[str, int], asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        # Записи без ключа липнут к одной партиции, пока её пачка не ушла
+        self._sticky: dict[str, int] = defaultdict(int)
+        self._requests: set[asyncio.Task[None]] = set()
+
+    def send(
+        self,
+        topic: str,
+        value: bytes,
+        *,
+        key: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> asyncio.Future[RecordMetadata]:
+        record = Record(value=value, key=key, headers=headers or {})
+        partition = self._partition(topic, key)
+        batch = self._batches.setdefault((topic, partition), _Batch())
+
+        future = asyncio.get_running_loop().create_future()
+        batch.records.append(record)
+        batch.futures.append(future)
+        batch.size += len(value) + len(key or '')
+
+        if batch.size >= self._max_batch_size:
+            self._flush(topic, partition)
+        elif batch.linger is None:
+            batch.linger = asyncio.get_running_loop().call_later(
+                self._linger, self._flush, topic, partition
+            )
+
+        return future
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes,
+        *,
+        key: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> RecordMetadata:
+        return await self.send(topic, value, key=key, headers=headers)
+
+    async def flush(self) -> None:
+        """Отправить всё накопленное и дождаться ответов брокера."""
+        for topic, partition in list(self._batches):
+            self._flush(topic, partition)
+
+        await asyncio.gather(*self._requests, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+
+    def _partition(self, topic: str, key: str | None) -> int:
+        partitions = self._broker.partitions(topic)
+        if key is None:
+            return self._sticky[topic] % partitions
+
+        # Стабильный хеш: один ключ - одна партиция в любом процессе
+        return zlib.crc32(key.encode()) % partitions
+
+    def _flush(self, topic: str, partition: int) -> None:
+        batch = self._batches.pop((topic, partition), None)
+        if batch is None:
+            return
+
+        if batch.linger is not None:
+            batch.linger.cancel()
+        if self._sticky[topic] % self._broker.partitions(topic) == partition:
+            self._sticky[topic] += 1
+
+        request = asyncio.create_task(self._deliver(topic, partition, batch))
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _deliver(self, topic: str, partition: int, batch: _Batch) -> None:
+        # Lock партиции раньше семафора: пачки одной партиции уходят по очереди
+        async with self._partition_locks[topic, partition], self._semaphore:
+            try:
+                payload = encode_batch(batch.records, self._compression)
+                base_offset = await self._broker.append(
+                    topic, partition, payload, len(batch.records)
+                )
+            except Exception as e:
+                logger.warning(
+                    'Batch to %s[%d] is not delivered: %r', topic, partition, e
+                )
+                for future in batch.futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for i, future in enumerate(batch.futures):
+            if not future.done():
+                future.set_result(RecordMetadata(topic, partition, base_offset + i))
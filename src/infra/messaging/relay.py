@@ -0,0 +1,306 @@
+"""Outbox relay: публикация строк outbox через транспорт.
+
+Usage:
+    python -m src.infra.messaging.relay --batch-size 100 --max-in-flight 16
+    python -m src.infra.messaging.relay --transport file
+
+Relay спит, пока очередь пуста: вставка в outbox шлёт NOTIFY при коммите,
+relay слушает канал (LISTEN) и идёт за пачкой сразу. Редкий опрос по таймеру
+остаётся только на случай потерянных сигналов (NOTIFY во время переподключения).
+
+Цикл: claim пачки (короткая транзакция, FOR UPDATE SKIP LOCKED, строки
+становятся PUBLISHING с арендой), публикация вне транзакции с ограниченным
+параллелизмом, затем статусы всей пачки - по одному UPDATE на исход.
+Неотправленная строка повторяется с экспоненциальной паузой (RetryPolicy),
+после max_attempts неудач - уходит в DLQ (python -m src.infra.messaging.dlq).
+Экземпляров relay может быть сколько угодно: SKIP LOCKED раздаёт им разные
+строки, а PUBLISHING не попадает в следующий claim. Строки упавшего relay
+возвращаются в очередь, когда кончается аренда. Отправка пачки ограничена
+арендой без LEASE_MARGIN: не уложившаяся строка считается неудачной, пока
+её не забрал другой relay.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+from datetime import timedelta
+from typing import final
+
+from src.infra.config import settings
+from src.infra.dto import OutboxDelivery, OutboxDto, OutboxFailure
+from src.infra.exceptions import InvalidOutboxLeaseError
+from src.infra.messaging.broker import Broker, FileBrokerImpl, MemoryBrokerImpl
+from src.infra.messaging.producer import BatchingProducerImpl
+from src.infra.messaging.retry import RetryPolicy
+from src.infra.messaging.serialization import make_codec
+from src.infra.messaging.transport import (
+    LogTransportImpl,
+    OutboxTransport,
+    ProducerTransportImpl,
+)
+from src.infra.messaging.wakeup import (
+    PgWakeupSourceImpl,
+    PollWakeupSourceImpl,
+    Wakeup,
+    WakeupSource,
+)
+from src.infra.orm.session import (
+    SessionFactory,
+    async_session,
+    make_async_session_factory,
+    make_engine,
+)
+from src.infra.repositories.outbox import OUTBOX_CHANNEL, OutboxRepositoryDb
+
+
+logger = logging.getLogger(__name__)
+
+# Самый короткий сон после пустого claim: расписание повторов не должно
+# превращать цикл в опрос базы без пауз
+MIN_IDLE_WAIT = 0.1
+# Запас аренды после отправки: успеть записать статусы, пока строки наши
+LEASE_MARGIN = timedelta(seconds=5)
+
+
+def check_lease(lease: timedelta, send_time: timedelta = timedelta(0)) -> None:
+    """Отправка со всеми таймаутами продюсера укладывается в аренду с запасом.
+
+    Raises:
+        InvalidOutboxLeaseError: Lease minus LEASE_MARGIN is not longer than send_time
+    """
+    if lease - LEASE_MARGIN <= send_time:
+        raise InvalidOutboxLeaseError(
+            ctx={
+                'lease': lease.total_seconds(),
+                'send_time': send_time.total_seconds(),
+                'margin': LEASE_MARGIN.total_seconds(),
+            }
+        )
+
+
+@final
+class OutboxRelay:
+    """Публикует outbox пачками.
+
+    Args:
+        session_factory: Фабрика сессий
+        transport: Куда публиковать
+        batch_size: Строк в одном claim
+        max_in_flight: Одновременных отправок в транспорт
+        lease: Сколько строка PUBLISHING принадлежит relay; отправка пачки
+            прерывается за LEASE_MARGIN до её конца
+        retry: Паузы между попытками и их число до DLQ
+        wakeups: Сигналы о новых строках, без них - только опрос
+        poll_interval: Самый долгий сон при пустой очереди
+    """
+
+    def __init__(  # noqa: PLR0913 настройки relay
+        self,
+        session_factory: SessionFactory,
+        transport: OutboxTransport,
+        *,
+        batch_size: int = 100,
+        max_in_flight: int = 16,
+        lease: timedelta = timedelta(seconds=30),
+        retry: RetryPolicy | None = None,
+        wakeups: WakeupSource | None = None,
+        poll_interval: timedelta = timedelta(seconds=1),
+    ) -> None:
+        self._session_factory = session_factory
+        self._transport = transport
+        self._wakeups = wakeups or PollWakeupSourceImpl()
+        self._batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        check_lease(lease)
+        self._lease = lease
+        self._send_timeout = (lease - LEASE_MARGIN).total_seconds()
+        self._retry = retry or RetryPolicy()
+        self._poll_interval = poll_interval.total_seconds()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                async with self._wakeups.listen() as wakeup:
+                    await self._drain(wakeup)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Outbox wakeups are lost, reconnecting')
+                await asyncio.sleep(self._retry.base_delay.total_seconds())
+
+    async def _drain(self, wakeup: Wakeup) -> None:
+        loop = asyncio.get_running_loop()
+        next_release = loop.time()
+
+        while True:
+            # До claim: NOTIFY, пришедший во время пачки, не потеряется
+            wakeup.clear()
+            try:
+                if loop.time() >= next_release:
+                    await self.release_expired()
+                    next_release = loop.time() + self._lease.total_seconds()
+
+                published = await self.run_once()
+            except Exception:
+                logger.exception('Outbox relay batch failed')
+                published = 0
+
+            # Полная пачка - в очереди наверняка есть ещё
+            if published < self._batch_size:
+                timeout = min(self._poll_interval, next_release - loop.time())
+                due = await self._seconds_until_due()
+                if due is not None:
+                    # Ближайший повтор раньше опроса: проснуться к нему
+                    timeout = min(timeout, due)
+                min_wait = MIN_IDLE_WAIT if published == 0 else 0
+                await wakeup.wait(max(timeout, min_wait))
+
+    async def run_once(self) -> int:
+        """Claim, публикация и статусы одной пачки. Возвращает размер пачки."""
+        async with async_session(self._session_factory) as db:
+            messages = await OutboxRepositoryDb(db).claim(self._batch_size, self._lease)
+
+        if not messages:
+            return 0
+
+        # Аренда пошла с claim: ожидание семафора тоже в её счёт
+        deadline = asyncio.get_running_loop().time() + self._send_timeout
+        results = await asyncio.gather(
+            *(self._send(message, deadline) for message in messages)
+        )
+        deliveries = [r for r in results if isinstance(r, OutboxDelivery)]
+        failures = [r for r in results if isinstance(r, OutboxFailure)]
+
+        async with async_session(self._session_factory) as db:
+            repository = OutboxRepositoryDb(db)
+            await repository.mark_published(deliveries)
+            await repository.mark_failed(failures)
+
+        logger.info(
+            'Outbox batch: %d published, %d failed', len(deliveries), len(failures)
+        )
+        return len(messages)
+
+    async def release_expired(self) -> int:
+        async with async_session(self._session_factory) as db:
+            repository = OutboxRepositoryDb(db)
+            released = await repository.release_expired(self._retry.max_attempts)
+
+        if released:
+            logger.warning('Released %d outbox rows with expired lease', released)
+        return released
+
+    async def _send(
+        self, message: OutboxDto, deadline: float
+    ) -> OutboxDelivery | OutboxFailure:
+        try:
+            # Не дольше аренды: потом строку заберёт другой relay
+            async with asyncio.timeout_at(deadline), self._semaphore:
+                return await self._transport.send(message)
+        except Exception as e:
+            # attempts уже учитывает эту попытку: claim увеличил счётчик
+            retry_delay = self._retry.delay(message.attempts)
+            if retry_delay is None:
+                logger.exception('Outbox #%s is moved to DLQ', message.id)
+            else:
+                logger.warning('Outbox #%s is not published: %r', message.id, e)
+            return OutboxFailure(message.saved_id, repr(e), retry_delay)
+
+    async def _seconds_until_due(self) -> float | None:
+        try:
+            async with async_session(self._session_factory) as db:
+                return await OutboxRepositoryDb(db).seconds_until_due()
+        except Exception:
+            logger.exception('Outbox retry schedule is unknown')
+            return None
+
+
+async def _make_transport(name: str, stack: contextlib.AsyncExitStack) -> OutboxTransport:
+    config = settings.producer
+    if name == 'log':
+        return LogTransportImpl()
+
+    if name == 'kafka':
+        # aiokafka - необязательная зависимость, импорт только по требованию
+        from src.infra.messaging.kafka import KafkaTransportImpl  # noqa: PLC0415
+
+        kafka = KafkaTransportImpl(
+            config.bootstrap_servers,
+            linger=config.linger,
+            request_timeout=config.request_timeout,
+            max_batch_size=config.max_batch_size,
+            compression=config.compression,
+            codec=make_codec(config.codec),
+        )
+        await kafka.start()
+        stack.push_async_callback(kafka.close)
+        return kafka
+
+    broker: Broker = (
+        FileBrokerImpl(config.broker_dir, config.partitions)
+        if name == 'file'
+        else MemoryBrokerImpl(config.partitions)
+    )
+    producer = BatchingProducerImpl(
+        broker,
+        linger=config.linger,
+        max_batch_size=config.max_batch_size,
+        compression=config.compression,
+        max_in_flight=config.max_in_flight,
+    )
+    stack.push_async_callback(producer.close)
+    return ProducerTransportImpl(producer, make_codec(config.codec))
+
+
+async def _main(args: argparse.Namespace) -> None:
+    # Одно соединение держит LISTEN, второе - под claim и статусы
+    engine = make_engine(settings.database_url, pool_size=2)
+    wakeups = (
+        PgWakeupSourceImpl(engine, OUTBOX_CHANNEL) if settings.outbox.listen else None
+    )
+    # Отправка в Kafka длится до linger + request_timeout: аренда должна быть дольше
+    send_time = settings.producer.linger
+    if args.transport == 'kafka':
+        send_time += settings.producer.request_timeout
+    check_lease(settings.outbox.lease, send_time)
+
+    async with contextlib.AsyncExitStack() as stack:
+        stack.push_async_callback(engine.dispose)
+        relay = OutboxRelay(
+            make_async_session_factory(engine),
+            await _make_transport(args.transport, stack),
+            batch_size=args.batch_size,
+            max_in_flight=args.max_in_flight,
+            lease=settings.outbox.lease,
+            retry=RetryPolicy(
+                base_delay=settings.outbox.retry_base_delay,
+                max_delay=settings.outbox.retry_max_delay,
+                max_attempts=settings.outbox.max_attempts,
+            ),
+            wakeups=wakeups,
+            poll_interval=settings.outbox.poll_interval,
+        )
+        await relay.run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch-size', type=int, default=settings.outbox.batch_size)
+    parser.add_argument(
+        '--max-in-flight', type=int, default=settings.outbox.max_in_flight
+    )
+    parser.add_argument(
+        '--transport',
+        choices=['log', 'memory', 'file', 'kafka'],
+        default=settings.producer.transport,
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_main(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+"""Обслуживание секций outbox: дни наперёд, архив и удаление старых дней.
+
+Usage:
+    python -m src.infra.messaging.retention --retention-days 7
+    python -m src.infra.messaging.retention --archive-dir /var/lib/auth/outbox
+
+outbox секционирована по дню created_at (outbox_pYYYYMMDD). Задача создаёт
+секции на premake_days вперёд, а дни старше retention отцепляет (DETACH),
+при необходимости выгружает в <archive-dir>/outbox_pYYYYMMDD.ndjson.gz и
+удаляет (DROP) - это операции над метаданными, без массового DELETE, а
+значит без раздувания таблицы и индексов. Секция удаляется, только когда
+все её строки PUBLISHED: строки в очереди и в DLQ держат день до конца
+(проверка по частичным индексам ix_partial_pending_key и ix_partial_dlq).
+
+Запуск раз в сутки (cron): созданные наперёд секции переживают пропуск.
+Если задача упала между DETACH и DROP, отцепленная секция дочищается
+следующим запуском.
+"""
+
+import argparse
+import asyncio
+import gzip
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import IO, final
+
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.config import settings
+from src.infra.orm.models import Outbox as OutboxDb
+from src.infra.orm.models.outbox import (
+    DEFAULT_PARTITION,
+    PARTITION_PREFIX,
+    PENDING_STATUSES,
+    OutboxStatus,
+)
+from src.infra.orm.session import (
+    SessionFactory,
+    async_session,
+    make_async_session_factory,
+    make_engine,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_NAME = re.compile(rf'^{PARTITION_PREFIX}(\d{{8}})$')
+# Таблицы с префиксом секций в текущей схеме: attached - ещё часть outbox.
+# Дневная ли это секция, решает _PARTITION_NAME
+_PARTITIONS = sa.text(
+    r"""
+    SELECT c.relname, c.relispartition
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = current_schema() AND c.relkind = 'r'
+      AND c.relname LIKE :prefix ESCAPE '\'
+    """
+)
+# Строк на один проход курсора при выгрузке в архив
+ARCHIVE_CHUNK = 1000
+
+
+@dataclass(slots=True)
+class RetentionReport:
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    archived: list[Path] = field(default_factory=list)
+    # Старые секции, где ещё есть неопубликованные строки
+    kept: list[str] = field(default_factory=list)
+    # Опубликованные старые строки, удалённые из DEFAULT
+    default_deleted: int = 0
+
+
+def partition_name(day: date) -> str:
+    return f'{PARTITION_PREFIX}{day:%Y%m%d}'
+
+
+def partition_day(name: str) -> date | None:
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    try:
+        return date(int(match[1][:4]), int(match[1][4:6]), int(match[1][6:]))
+    except ValueError:
+        return None
+
+
+def _is_expired(name: str, cutoff: date) -> bool:
+    day = partition_day(name)
+    return day is not None and day < cutoff
+
+
+@final
+class OutboxRetention:
+    """Args:
+    session_factory: Фабрика сессий
+    retention: Сколько дней опубликованные строки остаются в outbox
+    premake_days: На сколько дней вперёд создаются секции
+    archive_dir: Куда выгружать секции перед удалением, None - без архива
+    lock_timeout: Сколько ждать блокировку outbox для DETACH
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        retention: timedelta = timedelta(days=7),
+        premake_days: int = 3,
+        archive_dir: Path | None = None,
+        lock_timeout: timedelta = timedelta(seconds=1),
+    ) -> None:
+        self._session_factory = session_factory
+        self._retention = retention
+        self._premake_days = premake_days
+        self._archive_dir = archive_dir
+        self._lock_timeout = lock_timeout
+
+    async def run(self, today: date) -> RetentionReport:
+        report = RetentionReport()
+        report.created = await self.create_partitions(today)
+
+        cutoff = today - timedelta(days=self._retention.days)
+        attached, detached = await self._partitions()
+        detached = [name for name in detached if _is_expired(name, cutoff)]
+
+        for name in sorted(attached):
+            if not _is_expired(name, cutoff):
+                continue
+
+            if await self._detach(name):
+                detached.append(name)
+            else:
+                report.kept.append(name)
+
+        for name in sorted(detached):
+            archive = await self._drop(name)
+            report.dropped.append(name)
+            if archive is not None:
+                report.archived.append(archive)
+
+        report.default_deleted = await self._clean_default(cutoff)
+        return report
+
+    async def create_partitions(self, today: date) -> list[str]:
+        """Секции с сегодня на premake_days вперёд, которых ещё нет."""
+        attached, _ = await self._partitions()
+        days = (today + timedelta(days=i) for i in range(self._premake_days + 1))
+
+        created: list[str] = []
+        for day in days:
+            name = partition_name(day)
+            if name in attached:
+                continue
+
+            try:
+                async with async_session(self._session_factory) as db:
+                    await self._set_lock_timeout(db)
+                    await db.execute(
+                        sa.text(
+                            f'CREATE TABLE {name} PARTITION OF outbox '
+                            f"FOR VALUES FROM ('{day}') TO ('{day + timedelta(days=1)}')"
+                        )
+                    )
+            except DBAPIError:
+                # Обычно: строки этого дня уже лежат в DEFAULT. Они удалятся
+                # вместе с ним по retention, день живёт в DEFAULT
+                logger.exception('Outbox partition %s is not created', name)
+                continue
+
+            created.append(name)
+
+        return created
+
+    async def _partitions(self) -> tuple[list[str], list[str]]:
+        async with async_session(self._session_factory) as db:
+            prefix = PARTITION_PREFIX.replace('_', r'\_')
+            rows = (await db.execute(_PARTITIONS, {'prefix': f'{prefix}%'})).all()
+
+        days = [
+            (name, is_partition) for name, is_partition in rows if partition_day(name)
+        ]
+        attached = [name for name, is_partition in days if is_partition]
+        detached = [name for name, is_partition in days if not is_partition]
+        return attached, detached
+
+    async def _detach(self, name: str) -> bool:
+        """DETACH, если в секции остались только PUBLISHED строки."""
+        partition = sa.table(name, sa.column('status', OutboxDb.status.type))
+        unfinished = sa.select(
+            sa.or_(
+                sa.exists().where(partition.c.status.in_(PENDING_STATUSES)),
+                sa.exists().where(partition.c.status == OutboxStatus.DLQ),
+            )
+        )
+
+        try:
+            async with async_session(self._session_factory) as db:
+                if await db.scalar(unfinished):
+                    logger.warning('Outbox partition %s has unpublished rows', name)
+                    return False
+
+                # ACCESS EXCLUSIVE на outbox на миг: не ждать в очереди
+                # за долгими транзакциями, а повторить в следующий запуск
+                await self._set_lock_timeout(db)
+                await db.execute(sa.text(f'ALTER TABLE outbox DETACH PARTITION {name}'))
+        except DBAPIError:
+            logger.exception('Outbox partition %s is not detached', name)
+            return False
+
+        return True
+
+    async def _drop(self, name: str) -> Path | None:
+        archive = None
+        if self._archive_dir is not None:
+            archive = await self._archive(name, self._archive_dir)
+
+        async with async_session(self._session_factory) as db:
+            await db.execute(sa.text(f'DROP TABLE {name}'))
+
+        logger.info('Outbox partition %s is dropped', name)
+        return archive
+
+    async def _archive(self, name: str, directory: Path) -> Path:
+        """NDJSON строк секции (row_to_json) в gzip, через временный файл."""
+        path = directory / f'{name}.ndjson.gz'
+        partial = path.with_name(f'{path.name}.partial')
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+
+        partition = sa.table(name, sa.column('id')).alias('p')
+        stmt = (
+            sa
+            .select(sa.cast(sa.func.row_to_json(partition.table_valued()), sa.Text))
+            .order_by(partition.c.id)
+            .execution_options(yield_per=ARCHIVE_CHUNK)
+        )
+
+        archive = await asyncio.to_thread(gzip.open, partial, 'wt', encoding='utf-8')
+        try:
+            async with async_session(self._session_factory) as db:
+                result = await db.stream_scalars(stmt)
+                async for chunk in result.partitions():
+                    await asyncio.to_thread(_write_lines, archive, chunk)
+        finally:
+            await asyncio.to_thread(archive.close)
+
+        await asyncio.to_thread(partial.replace, path)
+        return path
+
+    async def _clean_default(self, cutoff: date) -> int:
+        """DEFAULT пуст, пока секции создаются вовремя: DELETE здесь небольшой."""
+        default = sa.table(
+            DEFAULT_PARTITION,
+            sa.column('status', OutboxDb.status.type),
+            sa.column('created_at'),
+        )
+        stmt = sa.delete(default).where(
+            default.c.status == OutboxStatus.PUBLISHED,
+            default.c.created_at < cutoff,
+        )
+
+        async with async_session(self._session_factory) as db:
+            result = await db.execute(stmt)
+
+        return result.rowcount  # type: ignore[attr-defined, no-any-return]
+
+    async def _set_lock_timeout(self, db: AsyncSession) -> None:
+        timeout = f'{int(self._lock_timeout.total_seconds() * 1000)}ms'
+        await db.execute(
+            sa.select(sa.func.set_config('lock_timeout', timeout, sa.true()))
+        )
+
+
+def _write_lines(archive: IO[str], lines: Iterable[str]) -> None:
+    for line in lines:
+        archive.write(line)
+        archive.write('\n')
+
+
+async def _main(args: argparse.Namespace) -> RetentionReport:
+    engine = make_engine(settings.database_url, pool_size=1)
+    retention = OutboxRetention(
+        make_async_session_factory(engine),
+        retention=timedelta(days=args.retention_days),
+        premake_days=args.premake_days,
+        archive_dir=args.archive_dir,
+    )
+
+    try:
+        async with async_session(make_async_session_factory(engine)) as db:
+            today = (await db.execute(sa.select(sa.func.current_date()))).scalar_one()
+        return await retention.run(today)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        '--retention-days', type=int, default=settings.outbox.retention_days
+    )
+    parser.add_argument('--premake-days', type=int, default=settings.outbox.premake_days)
+    parser.add_argument('--archive-dir', type=Path, default=settings.outbox.archive_dir)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(_main(args))
+    print(  # noqa: T201
+        f'created: {len(report.created)}, dropped: {len(report.dropped)}, '
+        f'archived: {len(report.archived)}, kept: {len(report.kept)}, '
+        f'default rows deleted: {report.default_deleted}'
+    )
+
+
+if __name__ == '__main__':
+    main()
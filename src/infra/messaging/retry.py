@@ -0,0 +1,35 @@
+"""Когда повторять неотправленную строку outbox и когда сдаться (DLQ)."""
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Экспоненциальная пауза с jitter.
+
+    Пауза после n-й попытки - случайная в [cap / 2, cap], где
+    cap = min(base_delay * 2 ** (n - 1), max_delay). Случайная половина
+    разводит повторы строк, упавших вместе (брокер лёг), и после его подъёма
+    relay не получает их все одновременно.
+
+    Attributes:
+        base_delay: Пауза после первой неудачи (до jitter)
+        max_delay: Потолок паузы
+        max_attempts: После стольких неудач строка уходит в DLQ
+    """
+
+    base_delay: timedelta = timedelta(seconds=1)
+    max_delay: timedelta = timedelta(minutes=5)
+    max_attempts: int = 10
+
+    def delay(self, attempts: int) -> timedelta | None:
+        """Pause before next attempt, None when `attempts` are exhausted."""
+        if attempts >= self.max_attempts:
+            return None
+
+        # Степень ограничена: 2 ** attempts без потолка переполняет timedelta
+        exponent = min(max(attempts - 1, 0), 32)
+        cap = min(self.base_delay * 2**exponent, self.max_delay)
+        return cap * random.uniform(0.5, 1)  # noqa: S311 jitter, не криптография
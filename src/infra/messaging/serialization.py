@@ -0,0 +1,198 @@
+"""Байты событий для брокера и обратно: кодеки, сериализаторы и декодеры.
+
+Сериализатор собирается на тип события один раз (`EventSerializers.compile`
+при старте) и строит payload outbox прямо из схемы pydantic, без model_dump().
+Байты для брокера делает relay: кодек из настроек кодирует payload, прочитанный
+из outbox. JSON - через orjson, если он установлен (pip install orjson), иначе
+pydantic-core; msgpack - только если установлен msgpack (pip install msgpack).
+
+Консумер находит класс события по заголовкам type/v, а кодек - по
+content-type: `EventDecoderRegistry.decode(headers, value)`.
+"""
+
+import json
+from collections.abc import Callable, Mapping
+from typing import Any, Final, Protocol, TypeVar, final, override
+
+from pydantic_core import to_json
+
+from src.domain.events import DomainEvent
+
+from src.infra.exceptions import UnknownEventError
+
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # type: ignore[import-untyped, import-not-found, unused-ignore]
+except ImportError:
+    msgpack = None
+
+
+JSON: Final = 'application/json'
+MSGPACK: Final = 'application/msgpack'
+
+
+class Codec(Protocol):
+    content_type: str
+
+    def encode(self, data: Any) -> bytes: ...  # noqa: ANN401 JSON-ready data
+    def decode(self, data: bytes) -> Any: ...  # noqa: ANN401 JSON-ready data
+
+
+@final
+class JsonCodecImpl(Codec):
+    """Компактный JSON: orjson, если установлен, иначе pydantic-core."""
+
+    content_type: str = JSON
+
+    @override
+    def encode(self, data: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(data)  # type: ignore[no-any-return]
+        return to_json(data)
+
+    @override
+    def decode(self, data: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+@final
+class MsgpackCodecImpl(Codec):
+    content_type: str = MSGPACK
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise RuntimeError('msgpack is not installed: pip install msgpack')
+
+    @override
+    def encode(self, data: Any) -> bytes:
+        return msgpack.packb(data)  # type: ignore[no-any-return]
+
+    @override
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+def make_codec(name: str) -> Codec:
+    """Codec by setting value: json or msgpack."""
+    if name == 'msgpack':
+        return MsgpackCodecImpl()
+    return JsonCodecImpl()
+
+
+def codec_for(content_type: str | None) -> Codec:
+    """Codec of received message; no content-type means JSON of older producers.
+
+    Raises:
+        UnknownEventError: Unknown content-type or its codec is not installed
+    """
+    if content_type == MSGPACK:
+        if msgpack is None:
+            raise UnknownEventError(
+                'msgpack is not installed', ctx={'content-type': content_type}
+            )
+        return MsgpackCodecImpl()
+    if content_type in {None, JSON}:
+        return JsonCodecImpl()
+    raise UnknownEventError(ctx={'content-type': content_type})
+
+
+E = TypeVar('E', bound=DomainEvent)
+
+
+@final
+class EventSerializer[E: DomainEvent]:
+    """Сериализация одного типа события по его скомпилированной схеме."""
+
+    __slots__: tuple[str, ...] = ('_schema', 'event_type')
+
+    def __init__(self, event_type: type[E]) -> None:
+        self.event_type = event_type
+        self._schema = event_type.__pydantic_serializer__
+
+    def payload(self, event: E) -> dict[str, Any]:
+        """JSON-ready dict for outbox JSONB, same as `event.as_dict()`."""
+        return self._schema.to_python(event, mode='json')  # type: ignore[no-any-return]
+
+
+@final
+class EventSerializers:
+    """Сериализаторы по типу события, собранные заранее."""
+
+    __slots__: tuple[str, ...] = ('_serializers',)
+
+    def __init__(self) -> None:
+        self._serializers: dict[type[DomainEvent], EventSerializer[Any]] = {}
+
+    def get(self, event_type: type[E]) -> EventSerializer[E]:
+        try:
+            return self._serializers[event_type]
+        except KeyError:
+            serializer = self._serializers[event_type] = EventSerializer(event_type)
+            return serializer
+
+    def compile(self, base: type[DomainEvent] = DomainEvent) -> None:
+        """Build serializers for `base` and all its subclasses."""
+        pending = [base]
+        while pending:
+            event_type = pending.pop()
+            self.get(event_type)
+            pending.extend(event_type.__subclasses__())
+
+
+class EventSchema(Protocol):
+    """Заголовки type/v, по которым консумер узнаёт событие."""
+
+    event_type: str
+    version: str
+
+
+S = TypeVar('S', bound=EventSchema)
+
+
+@final
+class EventDecoderRegistry:
+    __slots__: tuple[str, ...] = ('_events',)
+
+    def __init__(self) -> None:
+        self._events: dict[tuple[str, str], type[DomainEvent]] = {}
+
+    def add(self, event_type: str, version: str, event: type[DomainEvent]) -> None:
+        self._events[event_type, version] = event
+
+    def register(self, event: type[DomainEvent]) -> Callable[[type[S]], type[S]]:
+        """Decode `event` by type/v headers of decorated publisher."""
+
+        def wrapper(cls: type[S]) -> type[S]:
+            self.add(cls.event_type, cls.version, event)
+            return cls
+
+        return wrapper
+
+    def decode(self, headers: Mapping[str, str | bytes], value: bytes) -> DomainEvent:
+        """Event from broker record.
+
+        Raises:
+            UnknownEventError: No event registered for type/v or unknown content-type
+        """
+        text = {
+            name: header.decode() if isinstance(header, bytes) else header
+            for name, header in headers.items()
+        }
+        try:
+            event = self._events[text['type'], text.get('v', '1')]
+        except KeyError:
+            raise UnknownEventError(
+                ctx={'type': text.get('type'), 'v': text.get('v')}
+            ) from None
+
+        codec = codec_for(text.get('content-type'))
+        if codec.content_type == JSON:
+            return event.model_validate_json(value)
+        return event.model_validate(codec.decode(value))
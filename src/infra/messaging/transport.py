@@ -0,0 +1,61 @@
+"""Транспорт outbox relay: куда уходят сообщения из таблицы outbox."""
+
+import logging
+from typing import Any, Protocol, final, override
+
+from src.infra.dto import OutboxDelivery, OutboxDto
+from src.infra.messaging.producer import BatchingProducerImpl
+from src.infra.messaging.serialization import Codec, JsonCodecImpl
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxTransport(Protocol):
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        """Deliver message to broker and wait for acknowledgement.
+
+        Raises:
+            Exception: Message is not delivered, relay will retry it
+        """
+
+
+@final
+class LogTransportImpl(OutboxTransport):
+    """Без брокера: сообщение пишется в лог и считается доставленным."""
+
+    @override
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        logger.info('Outbox #%s -> %s (key=%s)', message.id, message.topic, message.key)
+        return OutboxDelivery(message.saved_id)
+
+
+def encode_headers(headers: dict[str, Any], codec: Codec) -> dict[str, str]:
+    """Headers of outbox row (type, v) and content-type of payload."""
+    encoded = {name: str(value) for name, value in headers.items()}
+    encoded['content-type'] = codec.content_type
+    return encoded
+
+
+@final
+class ProducerTransportImpl(OutboxTransport):
+    """Через `BatchingProducerImpl`: параллельные send() relay сливаются в пачки.
+
+    Партиция и смещение из ответа брокера попадают в outbox при mark_published.
+    """
+
+    def __init__(
+        self, producer: BatchingProducerImpl, codec: Codec | None = None
+    ) -> None:
+        self._producer = producer
+        self._codec = codec or JsonCodecImpl()
+
+    @override
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        metadata = await self._producer.send_and_wait(
+            message.topic,
+            self._codec.encode(message.payload),
+            key=message.key,
+            headers=encode_headers(message.headers, self._codec),
+        )
+        return OutboxDelivery(message.saved_id, metadata.partition, metadata.offset)
@@ -0,0 +1,90 @@
+"""Когда relay снова идти за пачкой: по NOTIFY из outbox или по таймеру."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Protocol, final, override
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infra.exceptions import OutboxListenerClosedError
+
+
+class Wakeup(Protocol):
+    def clear(self) -> None:
+        """Forget signals received so far: call before reading the queue."""
+
+    async def wait(self, timeout: float) -> None:
+        """Return on signal after last `clear()` or after `timeout` seconds.
+
+        Raises:
+            OutboxListenerClosedError: Connection to the signal source is lost
+        """
+
+
+class WakeupSource(Protocol):
+    def listen(self) -> AbstractAsyncContextManager[Wakeup]: ...
+
+
+@final
+class _EventWakeup(Wakeup):
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+        self.closed = False
+
+    @override
+    def clear(self) -> None:
+        self.event.clear()
+
+    @override
+    async def wait(self, timeout: float) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self.event.wait(), timeout)
+
+        if self.closed:
+            raise OutboxListenerClosedError(ctx={})
+
+
+@final
+class PollWakeupSourceImpl(WakeupSource):
+    """Без сигналов: relay просыпается только по таймеру."""
+
+    @asynccontextmanager
+    async def listen(self) -> AsyncGenerator[Wakeup]:
+        yield _EventWakeup()
+
+
+@final
+class PgWakeupSourceImpl(WakeupSource):
+    """LISTEN на отдельном соединении из пула, пока relay работает."""
+
+    def __init__(self, engine: AsyncEngine, channel: str) -> None:
+        self._engine = engine
+        self._channel = channel
+
+    @asynccontextmanager
+    async def listen(self) -> AsyncGenerator[Wakeup]:
+        wakeup = _EventWakeup()
+
+        def on_notify(_conn: object, _pid: int, _channel: str, _payload: str) -> None:
+            wakeup.event.set()
+
+        def on_close(_conn: object) -> None:
+            wakeup.closed = True
+            wakeup.event.set()
+
+        async with self._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if driver is None:
+                raise OutboxListenerClosedError(ctx={'channel': self._channel})
+
+            driver.add_termination_listener(on_close)
+            await driver.add_listener(self._channel, on_notify)
+            try:
+                yield wakeup
+            finally:
+                driver.remove_termination_listener(on_close)
+                if not driver.is_closed():
+                    await driver.remove_listener(self._channel, on_notify)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import final, override
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, Index, String, func
+from sqlalchemy import TIMESTAMP, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import (
     Mapped,
@@ -15,7 +15,14 @@ from .base import Base
 @final
 class Account(Base):
     __tablename__ = 'accounts'
-    __table_args__ = (Index('ix_account_email', 'email'),)
+    __table_args__ = (
+        Index('ix_account_email', 'email'),
+        Index(
+            'ix_account_tokens_revoked_before',
+            'tokens_revoked_before',
+            postgresql_where=text('tokens_revoked_before IS NOT NULL'),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -34,6 +41,10 @@ class Account(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), default=func.now(), nullable=False, onupdate=func.now()
     )
+    # Watermark: токены, выпущенные раньше, отозваны (logout со всех устройств)
+    tokens_revoked_before: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True)
+    )
 
     @override
     def __repr__(self) -> str:
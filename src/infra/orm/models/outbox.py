@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any, override
 
-from sqlalchemy import Enum, Index, String
+from sqlalchemy import DDL, BigInteger, Enum, Index, String, event, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,17 +15,34 @@ class OutboxStatus(StrEnum):
     PUBLISHING = 'publishing'
     PUBLISHED = 'published'
     FAILED = 'failed'
-    DLQ = 'dql'
+    DLQ = 'dlq'
 
 
 # This affects index, change it carefully
 READY_FOR_PUBLISH_STATUSES = [OutboxStatus.NEW, OutboxStatus.FAILED]
+# Строки, которые ещё держат очередь своего key (индекс ix_partial_pending_key)
+PENDING_STATUSES = [*READY_FOR_PUBLISH_STATUSES, OutboxStatus.PUBLISHING]
+
+
+# Секции по дню created_at: outbox_pYYYYMMDD, см. src.infra.messaging.retention
+PARTITION_PREFIX = 'outbox_p'
+# Строки без своей дневной секции (обслуживание не успело её создать)
+DEFAULT_PARTITION = 'outbox_default'
 
 
 class Outbox(Base):
+    """Секционирована по дню created_at: старые дни удаляются целой секцией.
+
+    Ключ секционирования обязан входить в первичный ключ, поэтому он
+    составной (id, created_at); id по-прежнему уникален - из последовательности.
+    """
+
     __tablename__: str = 'outbox'
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(
+        primary_key=True, server_default=func.localtimestamp()
+    )
     topic: Mapped[str] = mapped_column(String(80))
     key: Mapped[str | None] = mapped_column(String(120), default=None)
     payload: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
@@ -34,19 +51,44 @@ class Outbox(Base):
         Enum(OutboxStatus), default=OutboxStatus.NEW
     )
     attempts: Mapped[int] = mapped_column(default=0)
-    next_retry_at: Mapped[datetime | None] = mapped_column(default=None)
+    # Когда строку можно забрать: для новой - сразу, для PUBLISHING - конец аренды
+    next_retry_at: Mapped[datetime | None] = mapped_column(default=func.localtimestamp())
     error: Mapped[str | None] = mapped_column(String(256), default=None)
     published_at: Mapped[datetime | None] = mapped_column(default=None)
     kafka_partition: Mapped[int | None] = mapped_column(default=None)
-    kafka_offset: Mapped[int | None] = mapped_column(default=None)
+    # offset в Kafka - int64
+    kafka_offset: Mapped[int | None] = mapped_column(BigInteger, default=None)
 
-    __table_args__: tuple[Index] = (
+    __table_args__: tuple[Index | dict[str, str], ...] = (
         Index(
             'ix_partial_next_retry_at',
             'next_retry_at',
             postgresql_where=(status.in_(READY_FOR_PUBLISH_STATUSES)),
             postgresql_using='btree',
         ),
+        # Аренды упавших relay: строки PUBLISHING с истёкшим next_retry_at
+        Index(
+            'ix_partial_publishing_lease',
+            'next_retry_at',
+            postgresql_where=(status == OutboxStatus.PUBLISHING),
+            postgresql_using='btree',
+        ),
+        # Порядок внутри key: есть ли у строки неопубликованная предшественница
+        Index(
+            'ix_partial_pending_key',
+            'key',
+            'id',
+            postgresql_where=(status.in_(PENDING_STATUSES)),
+            postgresql_using='btree',
+        ),
+        # Просмотр и replay DLQ без обхода всей таблицы
+        Index(
+            'ix_partial_dlq',
+            'id',
+            postgresql_where=(status == OutboxStatus.DLQ),
+            postgresql_using='btree',
+        ),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
 
     @override
@@ -58,6 +100,7 @@ class Outbox(Base):
         return cls(
             id=outbox_dto.id,
             topic=outbox_dto.topic,
+            key=outbox_dto.key,
             payload=outbox_dto.payload,
             headers=outbox_dto.headers,
         )
@@ -66,6 +109,19 @@ class Outbox(Base):
         return OutboxDto(
             id=self.id,
             topic=self.topic,
+            key=self.key,
             payload=self.payload,
             headers=self.headers or {},
+            attempts=self.attempts,
+            error=self.error,
         )
+
+
+# Вставка в секционированную таблицу без подходящей секции падает: DEFAULT
+# принимает всё, что не попало в дневные секции (в том числе в тестах, где
+# схема создаётся через create_all, а не миграциями)
+event.listen(
+    Outbox.__table__,
+    'after_create',
+    DDL(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF outbox DEFAULT'),
+)
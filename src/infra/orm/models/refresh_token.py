@@ -7,32 +7,35 @@ import sqlalchemy.dialects.postgresql as pg
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.domain.entities import Account
-
+from src.infra.orm.models.account import Account
 from src.infra.orm.models.base import Base, TimestampMixin
 
 
 class RefreshFamily(TimestampMixin, Base):
     __tablename__: str = 'refresh_families'
+    __table_args__ = (
+        # Список сессий аккаунта: keyset по (account_id, created_at)
+        sa.Index('ix_refresh_families_account_created_at', 'account_id', 'created_at'),
+    )
 
     fid: Mapped[UUID] = mapped_column(
         pg.UUID(as_uuid=True),
         primary_key=True,
         default=uuid4,
     )
-    fingerprint_hash: Mapped[str] = mapped_column(sa.String(256))
+    fingerprint_hash: Mapped[str | None] = mapped_column(sa.String(256))
     version: Mapped[int] = mapped_column(default=0, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True), index=True)
-    revoked_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
+    revoked_at: Mapped[datetime | None] = mapped_column(sa.TIMESTAMP(timezone=True))
+    last_used_at: Mapped[datetime | None] = mapped_column(sa.TIMESTAMP(timezone=True))
 
     # прямые связи
     account_id: Mapped[UUID] = mapped_column(
         pg.UUID(as_uuid=True),
         sa.ForeignKey('accounts.id', ondelete='CASCADE'),
         nullable=False,
-        index=True,
     )
-    account: Mapped[UUID] = relationship('Account', back_populates='refresh_tokens')
+    account: Mapped[Account] = relationship()
 
     # обратные связи
     refresh_tokens: Mapped[list['RefreshToken']] = relationship(
@@ -48,6 +51,14 @@ class RefreshFamily(TimestampMixin, Base):
 
 class RefreshToken(TimestampMixin, Base):
     __tablename__: str = 'refresh_tokens'
+    __table_args__ = (
+        # Снимок отзывов для фильтров воркеров: только отозванные строки
+        sa.Index(
+            'ix_refresh_tokens_revoked_expires_at',
+            'expires_at',
+            postgresql_where=sa.text('revoked_at IS NOT NULL'),
+        ),
+    )
 
     jti: Mapped[UUID] = mapped_column(
         pg.UUID(as_uuid=True),
@@ -55,10 +66,11 @@ class RefreshToken(TimestampMixin, Base):
         default=uuid4,
     )
     hash: Mapped[str] = mapped_column(sa.String(256), unique=True)
-    rotated_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
-    revoked_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
-    expires_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
-    last_used_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True))
+    rotated_at: Mapped[datetime | None] = mapped_column(sa.TIMESTAMP(timezone=True))
+    revoked_at: Mapped[datetime | None] = mapped_column(sa.TIMESTAMP(timezone=True))
+    # keyset-курсор очистки истёкших токенов
+    expires_at: Mapped[datetime] = mapped_column(sa.TIMESTAMP(timezone=True), index=True)
+    last_used_at: Mapped[datetime | None] = mapped_column(sa.TIMESTAMP(timezone=True))
     meta: Mapped[dict[str, Any]] = mapped_column(
         MutableDict.as_mutable(pg.JSONB(astext_type=sa.Text())),
         server_default=sa.text("'{}'::jsonb"),
@@ -80,9 +92,7 @@ class RefreshToken(TimestampMixin, Base):
         sa.ForeignKey('accounts.id', ondelete='CASCADE'),
         index=True,
     )
-    account: Mapped['Account'] = relationship(
-        back_populates='refresh_tokens',
-    )
+    account: Mapped[Account] = relationship()
 
     rotation_parent_jti: Mapped[UUID | None] = mapped_column(
         pg.UUID(as_uuid=True),
@@ -90,7 +100,7 @@ class RefreshToken(TimestampMixin, Base):
         index=True,
     )
     rotation_parent: Mapped['RefreshToken | None'] = relationship(
-        back_populates='children',
+        remote_side=[jti],
     )
 
     @override
@@ -0,0 +1,9 @@
+from redis.asyncio import ConnectionPool, Redis
+
+
+def make_redis(url: str, max_connections: int) -> Redis:
+    """Клиент поверх общего пула: соединение берётся на команду, не на запрос."""
+    pool = ConnectionPool.from_url(
+        url, max_connections=max_connections, decode_responses=True
+    )
+    return Redis(connection_pool=pool)
@@ -0,0 +1,41 @@
+"""Курсор списка семей аккаунта: `<created_at в микросекундах>:<fid>`.
+
+Общий для обоих хранилищ: порядок `created_at DESC, fid DESC`, микросекунды -
+точность created_at в Postgres и score в zset Redis (double точен до 2**53).
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+from src.domain.exceptions import InvalidCursorError
+from src.domain.value_objects import RefreshFamilyId
+
+
+EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND: Final = timedelta(microseconds=1)
+
+
+def to_micros(value: datetime) -> int:
+    # Без float: timestamp() теряет микросекунды на текущих датах
+    return (value - EPOCH) // _MICROSECOND
+
+
+def from_micros(value: int) -> datetime:
+    return EPOCH + value * _MICROSECOND
+
+
+def encode_cursor(created_at: int, family: RefreshFamilyId) -> str:
+    return f'{created_at}:{family.value}'
+
+
+def decode_cursor(cursor: str) -> tuple[int, RefreshFamilyId]:
+    """Время создания и семья из курсора.
+
+    Raises:
+        InvalidCursorError: Cursor is malformed
+    """
+    created_at, _, family = cursor.partition(':')
+    if not (created_at.isascii() and created_at.isdigit() and family):
+        raise InvalidCursorError(ctx={'cursor': cursor})
+
+    return int(created_at), RefreshFamilyId(family)
@@ -0,0 +1,428 @@
+"""RefreshStore и RevokeStore поверх таблиц refresh_families/refresh_tokens.
+
+Для узлов без Redis. Ротация - один SQL-запрос (CTE): условный UPDATE старого
+токена (`rotated_at IS NULL` - compare-and-set вместо SELECT ... FOR UPDATE),
+UPDATE семьи и INSERT нового токена. Конкурирующая ротация того же токена
+ждёт только блокировку одной строки и после неё не находит строку по условию.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, final, override
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import RefreshSession
+from src.domain.exceptions import (
+    InvalidCursorError,
+    InvalidTokenError,
+    RefreshTokenReusedError,
+)
+from src.domain.ports import RefreshStore, RevokeStore
+from src.domain.value_objects import (
+    TTL,
+    RefreshFamilyId,
+    RefreshSessionId,
+    RevocationSnapshot,
+    SessionInfo,
+)
+
+from src.infra.orm.models import Account, RefreshFamily, RefreshToken
+from src.infra.orm.session import SessionFactory, async_session
+from src.infra.refresh_store.cursor import (
+    decode_cursor,
+    encode_cursor,
+    from_micros,
+    to_micros,
+)
+
+
+def _ts(value: int | None) -> datetime | None:
+    return None if value is None else datetime.fromtimestamp(value, UTC)
+
+
+def _unix(value: datetime | None) -> int | None:
+    return None if value is None else int(value.timestamp())
+
+
+def session_to_row(session: RefreshSession) -> dict[str, Any]:
+    return {
+        'jti': UUID(session.identifier.value),
+        'fid': UUID(session.family.value),
+        'account_id': session.account_id,
+        'hash': session.token_hash,
+        'expires_at': _ts(session.expires_at),
+        'rotation_parent_jti': UUID(session.parent.value) if session.parent else None,
+        'rotated_at': _ts(session.rotated_at),
+        'revoked_at': _ts(session.revoked_at),
+    }
+
+
+def row_to_session(row: sa.Row[Any]) -> RefreshSession:
+    return RefreshSession(
+        identifier=RefreshSessionId(row.jti.hex),
+        family=RefreshFamilyId(row.fid.hex),
+        account_id=row.account_id,
+        token_hash=row.hash,
+        expires_at=int(row.expires_at.timestamp()),
+        parent=RefreshSessionId(row.rotation_parent_jti.hex)
+        if row.rotation_parent_jti
+        else None,
+        rotated_at=_unix(row.rotated_at),
+        # Отзыв семьи отзывает все её токены
+        revoked_at=_unix(row.revoked_at or row.family_revoked_at),
+    )
+
+
+_SESSION_COLUMNS = (
+    RefreshToken.jti,
+    RefreshToken.fid,
+    RefreshToken.account_id,
+    RefreshToken.hash,
+    RefreshToken.expires_at,
+    RefreshToken.rotation_parent_jti,
+    RefreshToken.rotated_at,
+    RefreshToken.revoked_at,
+    RefreshFamily.revoked_at.label('family_revoked_at'),
+)
+
+
+def _select_sessions() -> sa.Select[*tuple[Any, ...]]:
+    return sa.select(*_SESSION_COLUMNS).join(
+        RefreshFamily, RefreshFamily.fid == RefreshToken.fid
+    )
+
+
+def revoke_families_stmt(families: sa.ColumnElement[bool], now: datetime) -> sa.Update:
+    """Отзыв семей и всех их токенов одним запросом.
+
+    Args:
+        families: Условие на RefreshFamily
+        now: Момент отзыва
+    """
+    families_cte = (
+        sa
+        .update(RefreshFamily)
+        .where(families, RefreshFamily.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .returning(RefreshFamily.fid)
+        .cte('revoked_families')
+    )
+    return (
+        sa
+        .update(RefreshToken)
+        .where(
+            RefreshToken.fid.in_(sa.select(families_cte.c.fid)),
+            RefreshToken.revoked_at.is_(None),
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.jti)
+    )
+
+
+@final
+class DbRefreshStoreImpl(RefreshStore):
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    @override
+    async def save(self, session: RefreshSession) -> None:
+        """Новая семья (логин) или продление существующей и токен - одна транзакция."""
+        row = session_to_row(session)
+        family = (
+            insert(RefreshFamily)
+            .values(
+                fid=row['fid'],
+                account_id=row['account_id'],
+                expires_at=row['expires_at'],
+            )
+            .on_conflict_do_update(
+                index_elements=[RefreshFamily.fid],
+                set_={
+                    'expires_at': sa.func.greatest(
+                        RefreshFamily.expires_at, row['expires_at']
+                    )
+                },
+            )
+        )
+
+        async with async_session(self._session_factory) as db:
+            await db.execute(family)
+            await db.execute(insert(RefreshToken).values(row))
+
+    @override
+    async def get(self, refresh_id: RefreshSessionId) -> RefreshSession | None:
+        return (await self.get_many([refresh_id]))[0]
+
+    @override
+    async def get_many(
+        self, refresh_ids: Sequence[RefreshSessionId]
+    ) -> list[RefreshSession | None]:
+        """Пачка одним `WHERE jti = ANY(...)`, порядок ответа - порядок refresh_ids."""
+        jtis = [UUID(refresh_id.value) for refresh_id in refresh_ids]
+
+        async with async_session(self._session_factory) as db:
+            rows = (
+                await db.execute(_select_sessions().where(RefreshToken.jti.in_(jtis)))
+            ).all()
+
+        sessions = {row.jti: row_to_session(row) for row in rows}
+        return [sessions.get(jti) for jti in jtis]
+
+    @override
+    async def rotate(self, old: RefreshSessionId, new: RefreshSession) -> None:
+        now = datetime.now(UTC)
+        row = session_to_row(new)
+        old_jti = UUID(old.value)
+
+        rotated = (
+            sa
+            .update(RefreshToken)
+            .where(
+                RefreshToken.jti == old_jti,
+                RefreshToken.fid == row['fid'],
+                RefreshToken.rotated_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            )
+            .values(rotated_at=now, last_used_at=now)
+            .returning(RefreshToken.fid)
+            .cte('rotated')
+        )
+        family = (
+            sa
+            .update(RefreshFamily)
+            .where(
+                RefreshFamily.fid.in_(sa.select(rotated.c.fid)),
+                RefreshFamily.revoked_at.is_(None),
+            )
+            .values(
+                version=RefreshFamily.version + 1,
+                last_used_at=now,
+                expires_at=sa.func.greatest(RefreshFamily.expires_at, row['expires_at']),
+            )
+            .returning(RefreshFamily.fid)
+            .cte('family')
+        )
+        # INSERT ... SELECT FROM family: новый токен появится, только если
+        # оба UPDATE прошли
+        values = sa.select(
+            *(
+                sa.literal(value, RefreshToken.__table__.c[key].type)
+                for key, value in row.items()
+            )
+        ).select_from(family)
+        stmt = (
+            insert(RefreshToken)
+            .from_select(list(row), values)
+            .returning(RefreshToken.jti)
+        )
+
+        async with async_session(self._session_factory) as db:
+            inserted = (await db.execute(stmt)).scalar_one_or_none()
+
+            if inserted is None:
+                await self._reject(db, old_jti, row['fid'], now)
+
+    @override
+    async def list_families(
+        self, account_id: UUID, limit: int, after: str | None = None
+    ) -> list[SessionInfo]:
+        """Обратный проход по индексу (account_id, created_at), без OFFSET."""
+        now = datetime.now(UTC)
+        stmt = (
+            sa
+            .select(
+                RefreshFamily.fid,
+                RefreshFamily.created_at,
+                RefreshFamily.last_used_at,
+                RefreshFamily.expires_at,
+            )
+            .where(
+                RefreshFamily.account_id == account_id,
+                RefreshFamily.revoked_at.is_(None),
+                RefreshFamily.expires_at > now,
+            )
+            .order_by(RefreshFamily.created_at.desc(), RefreshFamily.fid.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            created_at, family = decode_cursor(after)
+            try:
+                fid = UUID(family.value)
+            except ValueError as e:
+                raise InvalidCursorError(ctx={'cursor': after}) from e
+            stmt = stmt.where(
+                sa.tuple_(RefreshFamily.created_at, RefreshFamily.fid)
+                < sa.tuple_(from_micros(created_at), fid)
+            )
+
+        async with async_session(self._session_factory) as db:
+            rows = (await db.execute(stmt)).all()
+
+        return [
+            SessionInfo(
+                family=RefreshFamilyId(row.fid.hex),
+                created_at=int(row.created_at.timestamp()),
+                last_used_at=_unix(row.last_used_at),
+                expires_at=int(row.expires_at.timestamp()),
+                cursor=encode_cursor(
+                    to_micros(row.created_at), RefreshFamilyId(row.fid.hex)
+                ),
+            )
+            for row in rows
+        ]
+
+    async def _reject(
+        self, db: AsyncSession, old: UUID, family: UUID, now: datetime
+    ) -> None:
+        """Разобрать отказ ротации. Редкий путь, поэтому отдельным запросом.
+
+        Raises:
+            RefreshTokenReusedError: Old token was already rotated, family is revoked
+            InvalidTokenError: Token is missing, expired or revoked
+        """
+        current = (
+            await db.execute(_select_sessions().where(RefreshToken.jti == old))
+        ).one_or_none()
+
+        if current is None or current.fid != family:
+            raise InvalidTokenError('Refresh session not found', ctx={'jti': old.hex})
+
+        session = row_to_session(current)
+        if session.rotated_at is not None and session.revoked_at is None:
+            # Без синхронизации ORM: UPDATE с CTE и RETURNING идёт как Core
+            revoked = await db.scalars(
+                revoke_families_stmt(RefreshFamily.fid == family, now),
+                execution_options={'synchronize_session': False},
+            )
+            jtis = [jti.hex for jti in revoked]
+            await db.commit()
+            raise RefreshTokenReusedError(
+                ctx={'jti': old.hex, 'family': family.hex}, revoked=jtis
+            )
+
+        raise InvalidTokenError(
+            'Refresh session is not usable',
+            ctx={'jti': old.hex, 'revoked_at': session.revoked_at},
+        )
+
+
+@final
+class DbRevokeStoreImpl(RevokeStore):
+    """Отзывы - колонки revoked_at и accounts.tokens_revoked_before.
+
+    Args:
+        session_factory: Фабрика сессий
+        horizon: Самый долгий срок жизни токена: более старый watermark
+            ничего не отзывает и в снимок не попадает
+    """
+
+    def __init__(
+        self, session_factory: SessionFactory, horizon: timedelta = timedelta(days=7)
+    ) -> None:
+        self._session_factory = session_factory
+        self._horizon = horizon
+
+    @override
+    async def is_revoked(self, refresh_id: RefreshSessionId) -> bool:
+        stmt = _select_sessions().where(RefreshToken.jti == UUID(refresh_id.value))
+
+        async with async_session(self._session_factory) as db:
+            row = (await db.execute(stmt)).one_or_none()
+
+        return row is not None and row_to_session(row).revoked_at is not None
+
+    @override
+    async def revoke(self, refresh_id: RefreshSessionId, ttl: TTL) -> None:
+        # ttl не нужен: строка живёт до expires_at, её удалит очистка таблицы
+        stmt = (
+            sa
+            .update(RefreshToken)
+            .where(
+                RefreshToken.jti == UUID(refresh_id.value),
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now(UTC))
+        )
+
+        async with async_session(self._session_factory) as db:
+            await db.execute(stmt)
+
+    @override
+    async def delete_family(self, family: RefreshFamilyId) -> None:
+        # Токены семьи удалит ON DELETE CASCADE
+        stmt = sa.delete(RefreshFamily).where(RefreshFamily.fid == UUID(family.value))
+
+        async with async_session(self._session_factory) as db:
+            await db.execute(stmt)
+
+    @override
+    async def delete_families(
+        self, account_id: UUID, families: Sequence[RefreshFamilyId] | None = None
+    ) -> int:
+        """Один DELETE по индексу (account_id, created_at), токены - каскадом."""
+        stmt = sa.delete(RefreshFamily).where(RefreshFamily.account_id == account_id)
+        if families is not None:
+            stmt = stmt.where(
+                RefreshFamily.fid.in_([UUID(family.value) for family in families])
+            )
+
+        async with async_session(self._session_factory) as db:
+            deleted = await db.scalars(stmt.returning(RefreshFamily.fid))
+            return len(deleted.all())
+
+    @override
+    async def revoke_account(
+        self, account_id: UUID, issued_before: int, ttl: TTL
+    ) -> None:
+        # greatest() в Postgres пропускает NULL; watermark только растёт
+        stmt = (
+            sa
+            .update(Account)
+            .where(Account.id == account_id)
+            .values(
+                tokens_revoked_before=sa.func.greatest(
+                    Account.tokens_revoked_before, _ts(issued_before)
+                )
+            )
+        )
+
+        async with async_session(self._session_factory) as db:
+            await db.execute(stmt)
+
+    @override
+    async def account_watermark(self, account_id: UUID) -> int | None:
+        stmt = sa.select(Account.tokens_revoked_before).where(Account.id == account_id)
+
+        async with async_session(self._session_factory) as db:
+            return _unix(await db.scalar(stmt))
+
+    @override
+    async def publish_revoked(self, refresh_ids: Sequence[RefreshSessionId]) -> None:
+        # Локальных кэшей нет, отзыв уже в таблице
+        return
+
+    @override
+    async def snapshot(self) -> RevocationSnapshot:
+        """Оба запроса идут по частичным индексам только отозванных строк."""
+        now = datetime.now(UTC)
+        sessions = sa.select(RefreshToken.jti).where(
+            RefreshToken.revoked_at.is_not(None), RefreshToken.expires_at > now
+        )
+        accounts = sa.select(Account.id).where(
+            Account.tokens_revoked_before.is_not(None),
+            Account.tokens_revoked_before > now - self._horizon,
+        )
+
+        async with async_session(self._session_factory) as db:
+            jtis = (await db.scalars(sessions)).all()
+            account_ids = (await db.scalars(accounts)).all()
+
+        return RevocationSnapshot(
+            sessions=[RefreshSessionId(jti.hex) for jti in jtis],
+            accounts=list(account_ids),
+        )
@@ -0,0 +1,483 @@
+"""RefreshStore и RevokeStore поверх Redis.
+
+Ключи (prefix - REDIS_KEY_PREFIX):
+    `{prefix}rt:{jti}` - hash RefreshSession, TTL до `expires_at`
+    `{prefix}rf:{family}` - set jti цепочки ротаций, TTL до конца самой
+        долгоживущей сессии
+    `{prefix}fi:{family}` - hash семьи для списка сессий (account_id,
+        created_at в микросекундах, last_used_at, expires_at, revoked_at), TTL
+        как у `rf:`
+    `{prefix}af:{account_id}` - zset семей аккаунта, score - created_at
+        в микросекундах: keyset-пагинация и удаление всех семей разом
+    `{prefix}rv:{jti}` - отметка отзыва с TTL из RevokeStore.revoke
+    `{prefix}aw:{account_id}` - watermark аккаунта с TTL из revoke_account
+    `{prefix}revoked` - zset действующих отзывов для снимка: ключи фильтра
+        (`s:<jti>`, `a:<account_id>`), score - когда отзыв перестаёт действовать
+
+Ротация - один Lua-скрипт (EVALSHA, один round trip): скрипт выполняется
+атомарно, гонка двух воркеров за один refresh-токен невозможна.
+Скрипты обращаются к ключам сессий цепочки по имени, поэтому рассчитаны на
+один Redis (или Sentinel), не на Redis Cluster.
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from typing import Final, final, override
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.domain.entities import RefreshSession
+from src.domain.exceptions import InvalidTokenError, RefreshTokenReusedError
+from src.domain.ports import RefreshStore, RevokeStore
+from src.domain.value_objects import (
+    TTL,
+    RefreshFamilyId,
+    RefreshSessionId,
+    RevocationSnapshot,
+    SessionInfo,
+)
+
+from src.infra.refresh_store.cursor import decode_cursor, encode_cursor
+from src.infra.revocation.keys import account_key, session_key, snapshot_from_keys
+
+
+# KEYS: сессия, set цепочки, hash семьи, zset семей аккаунта
+# ARGV: ttl, jti, цепочка, now в микросекундах, account_id, expires_at, поля сессии
+_SAVE: Final = """
+local ttl = tonumber(ARGV[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 7))
+redis.call('EXPIRE', KEYS[1], ttl)
+redis.call('SADD', KEYS[2], ARGV[2])
+if redis.call('HSETNX', KEYS[3], 'created_at', ARGV[4]) == 1 then
+    redis.call('HSET', KEYS[3], 'account_id', ARGV[5])
+    redis.call('ZADD', KEYS[4], ARGV[4], ARGV[3])
+end
+local expires_at = tonumber(redis.call('HGET', KEYS[3], 'expires_at') or 0)
+if expires_at < tonumber(ARGV[6]) then
+    redis.call('HSET', KEYS[3], 'expires_at', ARGV[6])
+end
+for i = 2, 4 do
+    if redis.call('TTL', KEYS[i]) < ttl then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+"""
+
+# KEYS: старая сессия, новая сессия, set цепочки, отметка отзыва старой, zset отзывов,
+#   hash семьи, zset семей аккаунта
+# ARGV: now, ttl новой, префикс ключей сессий, jti новой, цепочка, поля новой
+_ROTATE: Final = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local old = redis.call('HMGET', KEYS[1], 'family', 'rotated_at', 'revoked_at', 'expires_at')
+
+if not old[1] then
+    return 'missing'
+end
+if old[3] or redis.call('EXISTS', KEYS[4]) == 1 then
+    return 'revoked'
+end
+if tonumber(old[4]) <= now then
+    return 'expired'
+end
+if old[1] ~= ARGV[5] then
+    return 'missing'
+end
+
+if old[2] then
+    -- повторное предъявление уже обменянного токена: отзываем всю цепочку,
+    -- отозванные jti возвращаем для ленты отзывов
+    local revoked = {'reused'}
+    for _, jti in ipairs(redis.call('SMEMBERS', KEYS[3])) do
+        local key = ARGV[3] .. jti
+        local session = redis.call('HMGET', key, 'expires_at', 'revoked_at')
+        if session[1] and not session[2] then
+            redis.call('HSET', key, 'revoked_at', now)
+            -- 's:' - SESSION_PREFIX ключей фильтра (src/infra/revocation/keys.py)
+            redis.call('ZADD', KEYS[5], session[1], 's:' .. jti)
+            table.insert(revoked, jti)
+        end
+    end
+    redis.call('HSET', KEYS[6], 'revoked_at', now)
+    return revoked
+end
+
+redis.call('HSET', KEYS[1], 'rotated_at', now)
+redis.call('HINCRBY', KEYS[1], 'version', 1)
+redis.call('HSET', KEYS[2], unpack(ARGV, 6))
+redis.call('EXPIRE', KEYS[2], ttl)
+redis.call('SADD', KEYS[3], ARGV[4])
+redis.call('HSET', KEYS[6], 'last_used_at', now)
+if tonumber(redis.call('HGET', KEYS[6], 'expires_at') or 0) < now + ttl then
+    redis.call('HSET', KEYS[6], 'expires_at', now + ttl)
+end
+for _, key in ipairs({KEYS[3], KEYS[6], KEYS[7]}) do
+    if redis.call('TTL', key) < ttl then
+        redis.call('EXPIRE', key, ttl)
+    end
+end
+return 'ok'
+"""
+
+# KEYS: set цепочки, hash семьи. ARGV: префикс ключей сессий, префикс zset семей
+# аккаунта, цепочка
+_DELETE_FAMILY: Final = """
+for _, jti in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    redis.call('DEL', ARGV[1] .. jti)
+end
+local account_id = redis.call('HGET', KEYS[2], 'account_id')
+if account_id then
+    redis.call('ZREM', ARGV[2] .. account_id, ARGV[3])
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+"""
+
+# KEYS: zset семей аккаунта
+# ARGV: префикс ключей сессий, префикс set цепочек, префикс hash семей, цепочки
+#   (все семьи аккаунта, если не переданы)
+_DELETE_FAMILIES: Final = """
+local families = {unpack(ARGV, 4)}
+if #families == 0 then
+    families = redis.call('ZRANGE', KEYS[1], 0, -1)
+end
+
+local deleted = 0
+for _, family in ipairs(families) do
+    -- ZREM вернёт 0 для чужой или уже удалённой семьи
+    if redis.call('ZREM', KEYS[1], family) == 1 then
+        local chain = ARGV[2] .. family
+        for _, jti in ipairs(redis.call('SMEMBERS', chain)) do
+            redis.call('DEL', ARGV[1] .. jti)
+        end
+        redis.call('DEL', chain, ARGV[3] .. family)
+        deleted = deleted + 1
+    end
+end
+return deleted
+"""
+
+# KEYS: zset семей аккаунта
+# ARGV: префикс hash семей, now, limit, курсор: created_at (или '+inf') и цепочка
+# Истёкшие и удалённые семьи попутно удаляются из zset
+_LIST_FAMILIES: Final = """
+local now = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local max = ARGV[4]
+local after = ARGV[5]
+local result, stale = {}, {}
+local offset = 0
+
+while #result < limit do
+    local rows = redis.call(
+        'ZREVRANGEBYSCORE', KEYS[1], max, '-inf', 'WITHSCORES', 'LIMIT', offset, limit
+    )
+    if #rows == 0 then
+        break
+    end
+    offset = offset + #rows / 2
+
+    for i = 1, #rows, 2 do
+        local family, score = rows[i], rows[i + 1]
+        -- равный created_at: порядок по цепочке, как ORDER BY ... fid DESC
+        if after == '' or tonumber(score) < tonumber(max) or family < after then
+            local info = redis.call(
+                'HMGET', ARGV[1] .. family, 'created_at', 'last_used_at',
+                'expires_at', 'revoked_at'
+            )
+            if not info[1] or tonumber(info[3]) <= now then
+                table.insert(stale, family)
+            elseif not info[4] then
+                table.insert(result, {family, info[1], info[2] or '', info[3]})
+                if #result == limit then
+                    break
+                end
+            end
+        end
+    end
+end
+
+if #stale > 0 then
+    redis.call('ZREM', KEYS[1], unpack(stale))
+end
+return result
+"""
+
+_OPTIONAL_INT_FIELDS: Final = ('rotated_at', 'revoked_at')
+
+
+def session_to_fields(session: RefreshSession) -> list[str | int]:
+    """Поля hash в порядке `field, value, ...`: сразу аргументы HSET."""
+    fields: dict[str, str | int | None] = {
+        'jti': session.identifier.value,
+        'family': session.family.value,
+        'account_id': str(session.account_id),
+        'token_hash': session.token_hash,
+        'expires_at': session.expires_at,
+        'parent': session.parent.value if session.parent else None,
+        'rotated_at': session.rotated_at,
+        'revoked_at': session.revoked_at,
+        'version': session.version,
+    }
+    return [
+        item
+        for key, value in fields.items()
+        if value is not None
+        for item in (key, value)
+    ]
+
+
+def session_from_fields(fields: Mapping[str, str]) -> RefreshSession | None:
+    if not fields:
+        return None
+
+    optional = {key: int(fields[key]) for key in _OPTIONAL_INT_FIELDS if key in fields}
+    parent = fields.get('parent')
+
+    return RefreshSession(
+        identifier=RefreshSessionId(fields['jti']),
+        family=RefreshFamilyId(fields['family']),
+        account_id=UUID(fields['account_id']),
+        token_hash=fields['token_hash'],
+        expires_at=int(fields['expires_at']),
+        parent=RefreshSessionId(parent) if parent else None,
+        version=int(fields.get('version', 0)),
+        **optional,
+    )
+
+
+class _RedisKeys:
+    def __init__(self, prefix: str) -> None:
+        self.session_prefix = f'{prefix}rt:'
+        self.family_prefix = f'{prefix}rf:'
+        self.family_info_prefix = f'{prefix}fi:'
+        self.account_families_prefix = f'{prefix}af:'
+        self._revoked_prefix = f'{prefix}rv:'
+        self._watermark_prefix = f'{prefix}aw:'
+        self.revocations = f'{prefix}revoked'
+
+    def session(self, refresh_id: RefreshSessionId) -> str:
+        return f'{self.session_prefix}{refresh_id.value}'
+
+    def family(self, family: RefreshFamilyId) -> str:
+        return f'{self.family_prefix}{family.value}'
+
+    def family_info(self, family: RefreshFamilyId) -> str:
+        return f'{self.family_info_prefix}{family.value}'
+
+    def account_families(self, account_id: UUID) -> str:
+        # Тот же вид, что account_id в hash семьи: скрипт собирает ключ сам
+        return f'{self.account_families_prefix}{account_id}'
+
+    def revoked(self, refresh_id: RefreshSessionId) -> str:
+        return f'{self._revoked_prefix}{refresh_id.value}'
+
+    def watermark(self, account_id: UUID) -> str:
+        return f'{self._watermark_prefix}{account_id.hex}'
+
+
+@final
+class RedisRefreshStoreImpl(RefreshStore):
+    def __init__(self, redis: Redis, key_prefix: str = 'auth:') -> None:
+        self._redis = redis
+        self._keys = _RedisKeys(key_prefix)
+        # register_script: EVALSHA, а EVAL с телом скрипта - только после рестарта Redis
+        self._save = redis.register_script(_SAVE)
+        self._rotate = redis.register_script(_ROTATE)
+        self._list_families = redis.register_script(_LIST_FAMILIES)
+
+    @override
+    async def save(self, session: RefreshSession) -> None:
+        ttl = session.ttl(int(time.time()))
+        if not ttl:
+            return
+
+        await self._save(
+            keys=[
+                self._keys.session(session.identifier),
+                self._keys.family(session.family),
+                self._keys.family_info(session.family),
+                self._keys.account_families(session.account_id),
+            ],
+            args=[
+                ttl,
+                session.identifier.value,
+                session.family.value,
+                time.time_ns() // 1000,
+                str(session.account_id),
+                session.expires_at,
+                *session_to_fields(session),
+            ],
+        )
+
+    @override
+    async def get(self, refresh_id: RefreshSessionId) -> RefreshSession | None:
+        return (await self.get_many([refresh_id]))[0]
+
+    @override
+    async def get_many(
+        self, refresh_ids: Sequence[RefreshSessionId]
+    ) -> list[RefreshSession | None]:
+        """Все сессии пачки одним pipeline: один round trip на пачку."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for refresh_id in refresh_ids:
+                pipe.hgetall(self._keys.session(refresh_id))
+            rows = await pipe.execute()
+
+        return [session_from_fields(row) for row in rows]
+
+    @override
+    async def rotate(self, old: RefreshSessionId, new: RefreshSession) -> None:
+        now = int(time.time())
+
+        result = await self._rotate(
+            keys=[
+                self._keys.session(old),
+                self._keys.session(new.identifier),
+                self._keys.family(new.family),
+                self._keys.revoked(old),
+                self._keys.revocations,
+                self._keys.family_info(new.family),
+                self._keys.account_families(new.account_id),
+            ],
+            args=[
+                now,
+                new.ttl(now),
+                self._keys.session_prefix,
+                new.identifier.value,
+                new.family.value,
+                *session_to_fields(new),
+            ],
+        )
+
+        if isinstance(result, list):
+            _, *revoked = result
+            raise RefreshTokenReusedError(
+                ctx={'jti': old.value, 'family': new.family.value}, revoked=revoked
+            )
+        if result != 'ok':
+            raise InvalidTokenError(
+                'Refresh session is not usable', ctx={'jti': old.value, 'reason': result}
+            )
+
+    @override
+    async def list_families(
+        self, account_id: UUID, limit: int, after: str | None = None
+    ) -> list[SessionInfo]:
+        """Страница - один скрипт: ZREVRANGEBYSCORE по zset аккаунта и hash семей."""
+        max_score, after_family = '+inf', ''
+        if after is not None:
+            created_at, family = decode_cursor(after)
+            max_score, after_family = str(created_at), family.value
+
+        rows = await self._list_families(
+            keys=[self._keys.account_families(account_id)],
+            args=[
+                self._keys.family_info_prefix,
+                int(time.time()),
+                limit,
+                max_score,
+                after_family,
+            ],
+        )
+
+        return [
+            SessionInfo(
+                family=RefreshFamilyId(family),
+                created_at=int(created_at) // 1_000_000,
+                last_used_at=int(last_used_at) if last_used_at else None,
+                expires_at=int(expires_at),
+                cursor=encode_cursor(int(created_at), RefreshFamilyId(family)),
+            )
+            for family, created_at, last_used_at, expires_at in rows
+        ]
+
+
+@final
+class RedisRevokeStoreImpl(RevokeStore):
+    def __init__(self, redis: Redis, key_prefix: str = 'auth:') -> None:
+        self._redis = redis
+        self._keys = _RedisKeys(key_prefix)
+        self._delete_family = redis.register_script(_DELETE_FAMILY)
+        self._delete_families = redis.register_script(_DELETE_FAMILIES)
+
+    @override
+    async def is_revoked(self, refresh_id: RefreshSessionId) -> bool:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self._keys.revoked(refresh_id))
+            pipe.hexists(self._keys.session(refresh_id), 'revoked_at')
+            marked, revoked_session = await pipe.execute()
+
+        return bool(marked or revoked_session)
+
+    @override
+    async def revoke(self, refresh_id: RefreshSessionId, ttl: TTL) -> None:
+        # Отметка живёт ровно столько, сколько мог бы жить сам токен
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._keys.revoked(refresh_id), 1, ex=int(ttl))
+            pipe.zadd(
+                self._keys.revocations,
+                {session_key(refresh_id): int(time.time()) + int(ttl)},
+            )
+            await pipe.execute()
+
+    @override
+    async def delete_family(self, family: RefreshFamilyId) -> None:
+        await self._delete_family(
+            keys=[self._keys.family(family), self._keys.family_info(family)],
+            args=[
+                self._keys.session_prefix,
+                self._keys.account_families_prefix,
+                family.value,
+            ],
+        )
+
+    @override
+    async def delete_families(
+        self, account_id: UUID, families: Sequence[RefreshFamilyId] | None = None
+    ) -> int:
+        # Без цепочек в ARGV скрипт удалит все семьи, а пустой список - ничего
+        if families is not None and not families:
+            return 0
+
+        return await self._delete_families(
+            keys=[self._keys.account_families(account_id)],
+            args=[
+                self._keys.session_prefix,
+                self._keys.family_prefix,
+                self._keys.family_info_prefix,
+                *(family.value for family in families or ()),
+            ],
+        )
+
+    @override
+    async def revoke_account(
+        self, account_id: UUID, issued_before: int, ttl: TTL
+    ) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._keys.watermark(account_id), issued_before, ex=int(ttl))
+            pipe.zadd(
+                self._keys.revocations,
+                {account_key(account_id): int(time.time()) + int(ttl)},
+            )
+            await pipe.execute()
+
+    @override
+    async def account_watermark(self, account_id: UUID) -> int | None:
+        watermark = await self._redis.get(self._keys.watermark(account_id))
+        return None if watermark is None else int(watermark)
+
+    @override
+    async def publish_revoked(self, refresh_ids: Sequence[RefreshSessionId]) -> None:
+        # Локальных кэшей нет, отзыв уже в Redis
+        return
+
+    @override
+    async def snapshot(self) -> RevocationSnapshot:
+        """Снимок заодно вычищает из zset отзывы с истёкшим сроком."""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self._keys.revocations, '-inf', int(time.time()))
+            pipe.zrange(self._keys.revocations, 0, -1)
+            _, keys = await pipe.execute()
+
+        return snapshot_from_keys(keys)
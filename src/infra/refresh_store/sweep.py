@@ -0,0 +1,231 @@
+"""Очистка истёкших refresh_tokens и refresh_families.
+
+Usage:
+    python -m src.infra.refresh_store.sweep --batch-size 1000 --max-rows-per-second 5000
+
+Удаление пачками по keyset-курсору `(expires_at, pk)` и индексу expires_at:
+каждая пачка - короткая транзакция с `lock_timeout`, строки, занятые
+конкурентными транзакциями, пропускаются (SKIP LOCKED) до следующего запуска.
+Пачка, которая max_lock_retries раз подряд не дождалась блокировки, завершает
+очистку таблицы до следующего запуска.
+Сначала токены, потом семьи: каскад из семьи ничего не удаляет, размер
+каждой транзакции ограничен batch_size. Скорость ограничена сверху, чтобы
+autovacuum успевал за удалением, а реплики - за WAL.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final, final
+
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.infra.config import settings
+from src.infra.orm.models import RefreshFamily, RefreshToken
+from src.infra.orm.session import (
+    SessionFactory,
+    async_session,
+    make_async_session_factory,
+    make_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+LOCK_NOT_AVAILABLE: Final = '55P03'
+
+
+@dataclass(frozen=True, slots=True)
+class SweepReport:
+    tokens: int
+    families: int
+    seconds: float
+
+    @property
+    def rows(self) -> int:
+        return self.tokens + self.families
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+type _Column = InstrumentedAttribute[Any]
+
+
+@final
+class RefreshSweeper:
+    """Удаляет строки с `expires_at < cutoff` ограниченными пачками.
+
+    Args:
+        session_factory: Фабрика сессий
+        batch_size: Строк в одной транзакции
+        max_rows_per_second: Потолок скорости удаления, None - без ограничения
+        lock_timeout: Сколько пачка ждёт блокировку, потом откладывается
+        retry_interval: Пауза после пачки, не дождавшейся блокировки
+        max_lock_retries: Повторов такой пачки подряд, потом таблица
+            откладывается до следующего запуска
+    """
+
+    def __init__(  # noqa: PLR0913 настройки очистки
+        self,
+        session_factory: SessionFactory,
+        *,
+        batch_size: int = 1000,
+        max_rows_per_second: float | None = None,
+        lock_timeout: timedelta = timedelta(seconds=1),
+        retry_interval: timedelta = timedelta(seconds=1),
+        max_lock_retries: int = 3,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._max_rows_per_second = max_rows_per_second
+        self._lock_timeout_ms = int(lock_timeout.total_seconds() * 1000)
+        self._retry_interval = retry_interval.total_seconds()
+        self._max_lock_retries = max_lock_retries
+
+    async def sweep(self, cutoff: datetime) -> SweepReport:
+        started = time.monotonic()
+
+        tokens = await self._sweep(RefreshToken.expires_at, RefreshToken.jti, cutoff)
+        families = await self._sweep(RefreshFamily.expires_at, RefreshFamily.fid, cutoff)
+
+        report = SweepReport(tokens, families, time.monotonic() - started)
+        logger.info(
+            'Swept %d tokens, %d families in %.1fs, %.0f rows/s',
+            report.tokens,
+            report.families,
+            report.seconds,
+            report.rows_per_second,
+        )
+        return report
+
+    async def _sweep(self, expires_at: _Column, pk: _Column, cutoff: datetime) -> int:
+        started = time.monotonic()
+        last: tuple[datetime, Any] | None = None
+        total = 0
+
+        while True:
+            rows = await self._delete_batch_retrying(expires_at, pk, cutoff, last)
+            if rows is None:
+                return total
+
+            total += len(rows)
+            if rows:
+                last = max(rows)
+
+            if len(rows) < self._batch_size:
+                return total
+
+            await self._throttle(total, started)
+
+    async def _delete_batch_retrying(
+        self,
+        expires_at: _Column,
+        pk: _Column,
+        cutoff: datetime,
+        last: tuple[datetime, Any] | None,
+    ) -> list[tuple[datetime, Any]] | None:
+        """None - пачка так и не дождалась блокировки, таблица откладывается."""
+        for attempt in range(self._max_lock_retries + 1):
+            if attempt:
+                await asyncio.sleep(self._retry_interval)
+            try:
+                return await self._delete_batch(expires_at, pk, cutoff, last)
+            except DBAPIError as e:
+                if getattr(e.orig, 'sqlstate', None) != LOCK_NOT_AVAILABLE:
+                    raise
+                logger.warning('Sweep batch of %s hit lock timeout', pk.class_.__name__)
+
+        # Строки держит долгая транзакция: не ждать её бесконечно
+        logger.warning(
+            'Sweep of %s is postponed after %d lock timeouts in a row',
+            pk.class_.__name__,
+            self._max_lock_retries + 1,
+        )
+        return None
+
+    async def _delete_batch(
+        self,
+        expires_at: _Column,
+        pk: _Column,
+        cutoff: datetime,
+        last: tuple[datetime, Any] | None,
+    ) -> list[tuple[datetime, Any]]:
+        batch = sa.select(pk).where(expires_at < cutoff)
+        if last is not None:
+            batch = batch.where(sa.tuple_(expires_at, pk) > sa.tuple_(*last))
+
+        batch_cte = (
+            batch
+            .order_by(expires_at, pk)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+            .cte('batch')
+        )
+        stmt = (
+            sa
+            .delete(pk.class_)
+            .where(pk.in_(sa.select(batch_cte.c[pk.key])))
+            .returning(expires_at, pk)
+        )
+
+        async with async_session(self._session_factory) as db:
+            # set_config(..., is_local=true) = SET LOCAL, но с параметром
+            await db.execute(
+                sa.select(
+                    sa.func.set_config(
+                        'lock_timeout', f'{self._lock_timeout_ms}ms', sa.true()
+                    )
+                )
+            )
+            return [(row[0], row[1]) for row in await db.execute(stmt)]
+
+    async def _throttle(self, total: int, started: float) -> None:
+        if not self._max_rows_per_second:
+            return
+
+        ahead = total / self._max_rows_per_second - (time.monotonic() - started)
+        if ahead > 0:
+            await asyncio.sleep(ahead)
+
+
+async def _main(args: argparse.Namespace) -> SweepReport:
+    engine = make_engine(settings.database_url, pool_size=1)
+    sweeper = RefreshSweeper(
+        make_async_session_factory(engine),
+        batch_size=args.batch_size,
+        max_rows_per_second=args.max_rows_per_second,
+        lock_timeout=timedelta(seconds=args.lock_timeout),
+        max_lock_retries=args.max_lock_retries,
+    )
+
+    try:
+        # Запас на clock skew: такие токены ещё проходят проверку exp
+        return await sweeper.sweep(datetime.now(UTC) - settings.jwt.clock_skew)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--max-rows-per-second', type=float, default=None)
+    parser.add_argument('--lock-timeout', type=float, default=1.0, help='seconds')
+    parser.add_argument('--max-lock-retries', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(_main(args))
+    print(  # noqa: T201
+        f'tokens: {report.tokens}, families: {report.families}, '
+        f'{report.rows_per_second:.0f} rows/s'
+    )
+
+
+if __name__ == '__main__':
+    main()
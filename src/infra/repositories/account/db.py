@@ -2,13 +2,14 @@ from typing import final, override
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities import Account
 from src.domain.ports import AccountRepository
 from src.domain.value_objects import Email
 
-from src.infra.mappers import account_db_to_account, account_to_account_db
+from src.infra.mappers import account_db_to_account, account_to_row
 from src.infra.orm.models import Account as AccountModel
 
 
@@ -40,8 +41,29 @@ class DbAccountRepositoryImpl(AccountRepository):
 
     @override
     async def create(self, account: Account) -> Account:
-        account_db = account_to_account_db(account)
-        self.session.add(account_db)
-        await self.session.commit()
-        await self.session.refresh(account_db)
+        """INSERT ... RETURNING, commit остаётся за UoW."""
+        stmt = (
+            insert(AccountModel).values(account_to_row(account)).returning(AccountModel)
+        )
+        account_db = (await self.session.scalars(stmt)).one()
+        return account_db_to_account(account_db)
+
+    @override
+    async def create_if_not_exists(self, account: Account) -> Account | None:
+        """Проверка уникальности email и вставка одним запросом.
+
+        Returns:
+            Созданный аккаунт или None, если email уже занят
+        """
+        stmt = (
+            insert(AccountModel)
+            .values(account_to_row(account))
+            .on_conflict_do_nothing(index_elements=[AccountModel.email])
+            .returning(AccountModel)
+        )
+        account_db = (await self.session.scalars(stmt)).one_or_none()
+
+        if not account_db:
+            return None
+
         return account_db_to_account(account_db)
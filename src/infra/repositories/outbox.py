@@ -1,19 +1,50 @@
 from collections.abc import Sequence
+from datetime import timedelta
 from typing import Protocol, final
 
+import sqlalchemy as sa
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from src.infra.dto import OutboxDto
+from src.infra.dto import OutboxDelivery, OutboxDto, OutboxFailure
 from src.infra.orm.models import Outbox as OutboxDb
-from src.infra.orm.models.outbox import READY_FOR_PUBLISH_STATUSES
+from src.infra.orm.models.outbox import (
+    PENDING_STATUSES,
+    READY_FOR_PUBLISH_STATUSES,
+    OutboxStatus,
+)
+
+
+# Колонка error - String(256)
+MAX_ERROR_LENGTH = 256
+# NOTIFY при вставке: будит relay, который слушает канал (LISTEN)
+OUTBOX_CHANNEL = 'outbox_ready'
 
 
 class OutboxRepository(Protocol):
     async def create(self, outbox_dto: OutboxDto) -> None: ...
+    async def create_many(self, outbox_dtos: Sequence[OutboxDto]) -> None: ...
     async def ready_for_publishing(
         self, limit: int | None = None
     ) -> Sequence[OutboxDto]: ...
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxDto]:
+        """Take due rows for publishing: they become PUBLISHING until lease ends."""
+
+    async def mark_published(self, deliveries: Sequence[OutboxDelivery]) -> None: ...
+    async def mark_failed(self, failures: Sequence[OutboxFailure]) -> None: ...
+    async def release_expired(self, max_attempts: int) -> int:
+        """Return rows of crashed relays (lease is over) to FAILED or DLQ."""
+
+    async def seconds_until_due(self) -> float | None:
+        """How long until the earliest row may be claimed, None for empty queue."""
+
+    async def dead_letters(
+        self, limit: int, after_id: int | None = None
+    ) -> list[OutboxDto]: ...
+    async def replay(self, ids: Sequence[int] | None = None) -> int:
+        """Return DLQ rows (all or `ids`) to the queue with a fresh attempt budget."""
 
 
 @final
@@ -22,8 +53,30 @@ class OutboxRepositoryDb:
         self._session = session
 
     async def create(self, outbox_dto: OutboxDto) -> None:
+        """Строка и NOTIFY в одной транзакции: relay разбудит только её коммит.
+
+        Одинаковые NOTIFY одной транзакции Postgres схлопывает в один.
+        """
         outbox_db = OutboxDb.from_dto(outbox_dto)
         self._session.add(outbox_db)
+        await self._session.execute(select(sa.func.pg_notify(OUTBOX_CHANNEL, '')))
+
+    async def create_many(self, outbox_dtos: Sequence[OutboxDto]) -> None:
+        """Один INSERT ... VALUES (...), (...) на все строки и один NOTIFY."""
+        if not outbox_dtos:
+            return
+
+        stmt = sa.insert(OutboxDb).values([
+            {
+                'topic': dto.topic,
+                'key': dto.key,
+                'payload': dto.payload,
+                'headers': dto.headers,
+            }
+            for dto in outbox_dtos
+        ])
+        await self._session.execute(stmt)
+        await self._session.execute(select(sa.func.pg_notify(OUTBOX_CHANNEL, '')))
 
     async def ready_for_publishing(self, limit: int | None = None) -> Sequence[OutboxDto]:
         stmt = select(OutboxDb).where(OutboxDb.status.in_(READY_FOR_PUBLISH_STATUSES))
@@ -32,3 +85,211 @@ class OutboxRepositoryDb:
         result: Sequence[OutboxDb] = (await self._session.execute(stmt)).scalars().all()
 
         return [outbox_db.to_dto() for outbox_db in result]
+
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxDto]:
+        """Один UPDATE ... FROM (SELECT ... FOR UPDATE SKIP LOCKED).
+
+        Подзапрос идёт по ix_partial_next_retry_at: строки, занятые другим relay,
+        пропускаются без ожидания. После коммита строки PUBLISHING выпадают
+        из индекса, и следующий claim их уже не видит - двойной публикации нет.
+
+        Строка с key берётся, только когда она первая неопубликованная в своём
+        key (проверка по ix_partial_pending_key): у key не больше одной строки
+        в полёте на все relay, разные key публикуются параллельно. Упавшая или
+        медленная строка держит только свой key.
+        """
+        now = sa.func.localtimestamp()
+        batch = (
+            select(OutboxDb.id)
+            .where(_is_claimable(), OutboxDb.next_retry_at <= now)
+            .order_by(OutboxDb.next_retry_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte('batch')
+        )
+        stmt = (
+            sa
+            .update(OutboxDb)
+            .where(OutboxDb.id == batch.c.id)
+            .values(
+                status=OutboxStatus.PUBLISHING,
+                attempts=OutboxDb.attempts + 1,
+                next_retry_at=now + lease,
+            )
+            .returning(OutboxDb)
+        )
+
+        rows = (await self._session.scalars(stmt)).all()
+        # RETURNING без ORDER BY: порядок очереди восстанавливаем сами
+        return [row.to_dto() for row in sorted(rows, key=lambda row: row.id)]
+
+    async def mark_published(self, deliveries: Sequence[OutboxDelivery]) -> None:
+        """Все подтверждения пачки - один UPDATE ... FROM unnest(...)."""
+        if not deliveries:
+            return
+
+        acks = (
+            sa.func
+            .unnest(
+                sa.cast([d.id for d in deliveries], ARRAY(sa.Integer)),
+                sa.cast([d.partition for d in deliveries], ARRAY(sa.Integer)),
+                sa.cast([d.offset for d in deliveries], ARRAY(sa.BigInteger)),
+            )
+            .table_valued('id', 'partition', 'offset')
+            .render_derived('acks')
+        )
+        stmt = (
+            sa
+            .update(OutboxDb)
+            .where(
+                OutboxDb.id == acks.c.id,
+                OutboxDb.status == OutboxStatus.PUBLISHING,
+            )
+            .values(
+                status=OutboxStatus.PUBLISHED,
+                published_at=sa.func.localtimestamp(),
+                next_retry_at=None,
+                error=None,
+                kafka_partition=acks.c.partition,
+                kafka_offset=acks.c.offset,
+            )
+        )
+
+        await self._session.execute(stmt)
+
+    async def mark_failed(self, failures: Sequence[OutboxFailure]) -> None:
+        """Свой retry_delay у каждой строки; без него строка уходит в DLQ.
+
+        У DLQ next_retry_at = NULL: строка выпадает из ix_partial_next_retry_at
+        и больше не держит очередь своего key.
+        """
+        if not failures:
+            return
+
+        errors = (
+            sa.func
+            .unnest(
+                sa.cast([f.id for f in failures], ARRAY(sa.Integer)),
+                sa.cast([f.error[:MAX_ERROR_LENGTH] for f in failures], ARRAY(sa.Text)),
+                sa.cast([f.retry_delay for f in failures], ARRAY(sa.Interval)),
+            )
+            .table_valued('id', 'error', 'retry_delay')
+            .render_derived('errors')
+        )
+        stmt = (
+            sa
+            .update(OutboxDb)
+            .where(
+                OutboxDb.id == errors.c.id,
+                OutboxDb.status == OutboxStatus.PUBLISHING,
+            )
+            .values(
+                status=sa.case(
+                    (errors.c.retry_delay.is_(None), _status(OutboxStatus.DLQ)),
+                    else_=_status(OutboxStatus.FAILED),
+                ),
+                # NULL + interval = NULL
+                next_retry_at=sa.func.localtimestamp() + errors.c.retry_delay,
+                error=errors.c.error,
+            )
+        )
+
+        await self._session.execute(stmt)
+
+    async def release_expired(self, max_attempts: int) -> int:
+        """По ix_partial_publishing_lease: просматриваются только строки PUBLISHING.
+
+        Строка, на которой relay падает раз за разом, тоже исчерпывает попытки.
+        """
+        exhausted = OutboxDb.attempts >= max_attempts
+        stmt = (
+            sa
+            .update(OutboxDb)
+            .where(
+                OutboxDb.status == OutboxStatus.PUBLISHING,
+                OutboxDb.next_retry_at < sa.func.localtimestamp(),
+            )
+            .values(
+                status=sa.case(
+                    (exhausted, _status(OutboxStatus.DLQ)),
+                    else_=_status(OutboxStatus.FAILED),
+                ),
+                next_retry_at=sa.case((exhausted, None), else_=OutboxDb.next_retry_at),
+                error='Relay lease expired',
+            )
+            .returning(OutboxDb.id)
+        )
+
+        return len((await self._session.scalars(stmt)).all())
+
+    async def seconds_until_due(self) -> float | None:
+        """min() по ix_partial_next_retry_at среди строк, которые возьмёт claim.
+
+        Строка за неопубликованной строкой своего key не в счёт: её срок мог
+        пройти, но claim её не возьмёт, и relay крутился бы без сна.
+        Разница считается в базе: часы relay и Postgres могут расходиться.
+        """
+        stmt = select(
+            sa.func.extract(
+                'epoch', sa.func.min(OutboxDb.next_retry_at) - sa.func.localtimestamp()
+            )
+        ).where(_is_claimable())
+
+        seconds = await self._session.scalar(stmt)
+        return float(seconds) if seconds is not None else None
+
+    async def dead_letters(
+        self, limit: int, after_id: int | None = None
+    ) -> list[OutboxDto]:
+        stmt = (
+            select(OutboxDb)
+            .where(OutboxDb.status == OutboxStatus.DLQ)
+            .order_by(OutboxDb.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(OutboxDb.id > after_id)
+
+        return [row.to_dto() for row in (await self._session.scalars(stmt)).all()]
+
+    async def replay(self, ids: Sequence[int] | None = None) -> int:
+        """По ix_partial_dlq: просматриваются только строки DLQ.
+
+        Порядок key для такой строки уже нарушен: пока она лежала в DLQ,
+        более поздние события того же key могли быть опубликованы.
+        """
+        stmt = (
+            sa
+            .update(OutboxDb)
+            .where(OutboxDb.status == OutboxStatus.DLQ)
+            .values(
+                status=OutboxStatus.NEW,
+                attempts=0,
+                next_retry_at=sa.func.localtimestamp(),
+                error=None,
+            )
+            .returning(OutboxDb.id)
+        )
+        if ids is not None:
+            stmt = stmt.where(OutboxDb.id.in_(ids))
+
+        return len((await self._session.scalars(stmt)).all())
+
+
+def _is_claimable() -> sa.ColumnElement[bool]:
+    """Строка в очереди и первая неопубликованная в своём key (если он есть)."""
+    older = aliased(OutboxDb)
+    is_key_head = ~sa.exists().where(
+        older.key == OutboxDb.key,
+        older.id < OutboxDb.id,
+        older.status.in_(PENDING_STATUSES),
+    )
+    return sa.and_(
+        OutboxDb.status.in_(READY_FOR_PUBLISH_STATUSES),
+        sa.or_(OutboxDb.key.is_(None), is_key_head),
+    )
+
+
+def _status(status: OutboxStatus) -> sa.ColumnElement[OutboxStatus]:
+    # Enum хранится по имени: литерал должен пройти через тип колонки
+    return sa.literal(status, OutboxDb.status.type)
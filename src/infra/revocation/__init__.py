@@ -0,0 +1,18 @@
+from .bloom import BloomFilter
+from .feed import (
+    LocalRevocationFeedImpl,
+    PgRevocationFeedImpl,
+    RedisRevocationFeedImpl,
+    RevocationFeed,
+)
+from .filtered import FilteredRevokeStoreImpl
+
+
+__all__ = [
+    'BloomFilter',
+    'FilteredRevokeStoreImpl',
+    'LocalRevocationFeedImpl',
+    'PgRevocationFeedImpl',
+    'RedisRevocationFeedImpl',
+    'RevocationFeed',
+]
@@ -0,0 +1,70 @@
+import hashlib
+import math
+from collections.abc import Iterable
+from typing import final
+
+
+@final
+class BloomFilter:
+    """Bloom filter над bytearray: нет ложноотрицательных ответов.
+
+    k позиций из одного blake2b (двойное хеширование Kirsch-Mitzenmacher):
+    один вызов хеша на ключ вместо k.
+
+    Args:
+        capacity: Ожидаемое число ключей
+        error_rate: Доля ложноположительных ответов при `capacity` ключей
+    """
+
+    __slots__ = ('_bits', '_count', '_hashes', '_size', 'capacity')
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError(f'Invalid bloom filter {capacity=}, {error_rate=}')
+
+        self.capacity = capacity
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[str], capacity: int, error_rate: float = 0.001
+    ) -> 'BloomFilter':
+        bloom = cls(capacity, error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self._size
+        return [(h1 + i * h2) % size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def __len__(self) -> int:
+        """Число добавлений (с повторами)."""
+        return self._count
+
+    @property
+    def saturated(self) -> bool:
+        """Ключей больше расчётного: доля ложных срабатываний выше error_rate."""
+        return self._count > self.capacity
@@ -0,0 +1,146 @@
+"""Лента отзывов: каждое сообщение - ключ фильтра (`s:<jti>` или `a:<account_id>`).
+
+Доставка at-most-once (pub/sub, NOTIFY): пропущенное за время обрыва
+сообщение восстанавливает пересинхронизация по снимку RevokeStore.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, Final, Protocol, final
+
+import sqlalchemy as sa
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infra.exceptions import RevocationFeedClosedError
+
+
+DEFAULT_CHANNEL: Final = 'auth_revocations'
+
+
+class RevocationSubscription(Protocol):
+    async def get(self, timeout: float) -> str | None:
+        """Следующий ключ или None, если за `timeout` секунд сообщений не было.
+
+        Raises:
+            RevocationFeedClosedError: Connection to the feed is lost
+        """
+
+
+class RevocationFeed(Protocol):
+    async def publish(self, key: str) -> None: ...
+    def subscribe(self) -> AbstractAsyncContextManager[RevocationSubscription]: ...
+
+
+@final
+class _QueueSubscription(RevocationSubscription):
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def get(self, timeout: float) -> str | None:
+        try:
+            key = await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+        if key is None:  # отметка обрыва соединения
+            raise RevocationFeedClosedError(ctx={})
+        return key
+
+
+@final
+class LocalRevocationFeedImpl(RevocationFeed):
+    """Лента внутри процесса: один воркер и тесты."""
+
+    def __init__(self) -> None:
+        self._subscriptions: set[_QueueSubscription] = set()
+
+    async def publish(self, key: str) -> None:
+        for subscription in self._subscriptions:
+            subscription.queue.put_nowait(key)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncGenerator[RevocationSubscription]:
+        subscription = _QueueSubscription()
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+
+@final
+class _RedisSubscription(RevocationSubscription):
+    def __init__(self, pubsub: Any) -> None:  # noqa: ANN401 PubSub is untyped
+        self._pubsub = pubsub
+
+    async def get(self, timeout: float) -> str | None:
+        message = await self._pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        return None if message is None else message['data']
+
+
+@final
+class RedisRevocationFeedImpl(RevocationFeed):
+    """Redis pub/sub. Клиент должен быть с `decode_responses=True`."""
+
+    def __init__(self, redis: Redis, channel: str = DEFAULT_CHANNEL) -> None:
+        self._redis = redis
+        self._channel = channel
+
+    async def publish(self, key: str) -> None:
+        await self._redis.publish(self._channel, key)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncGenerator[RevocationSubscription]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._channel)
+        try:
+            yield _RedisSubscription(pubsub)
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.unsubscribe(self._channel)
+            await pubsub.aclose()
+
+
+@final
+class PgRevocationFeedImpl(RevocationFeed):
+    """Postgres LISTEN/NOTIFY: отдельное соединение из пула на подписку."""
+
+    def __init__(self, engine: AsyncEngine, channel: str = DEFAULT_CHANNEL) -> None:
+        self._engine = engine
+        self._channel = channel
+
+    async def publish(self, key: str) -> None:
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                sa.select(sa.func.pg_notify(self._channel, key)),
+            )
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncGenerator[RevocationSubscription]:
+        subscription = _QueueSubscription()
+
+        def on_notify(_conn: object, _pid: int, _channel: str, payload: str) -> None:
+            subscription.queue.put_nowait(payload)
+
+        def on_close(_conn: object) -> None:
+            subscription.queue.put_nowait(None)
+
+        async with self._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if driver is None:
+                raise RevocationFeedClosedError(ctx={'channel': self._channel})
+
+            driver.add_termination_listener(on_close)
+            await driver.add_listener(self._channel, on_notify)
+            try:
+                yield subscription
+            finally:
+                driver.remove_termination_listener(on_close)
+                if not driver.is_closed():
+                    await driver.remove_listener(self._channel, on_notify)
@@ -0,0 +1,178 @@
+"""Локальный фильтр отзывов перед RevokeStore.
+
+Частый ответ "не отозван" даёт bloom-фильтр в памяти воркера, без похода
+в Redis/Postgres. Попадание в фильтр (отзыв или ложное срабатывание)
+подтверждается в store. Фильтр собирается из снимка store и дополняется
+лентой отзывов; пересобирается по снимку раз в `resync_interval` (отзывы
+с истёкшим сроком выпадают, потерянные сообщения ленты восстанавливаются).
+
+Пока фильтр не собран (старт, обрыв ленты), все вопросы идут в store:
+фильтр может только ускорять ответ, но не пропускать отзыв.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import final, override
+from uuid import UUID
+
+from src.domain.ports import RevokeStore
+from src.domain.value_objects import (
+    TTL,
+    RefreshFamilyId,
+    RefreshSessionId,
+    RevocationSnapshot,
+)
+
+from src.infra.revocation.bloom import BloomFilter
+from src.infra.revocation.feed import RevocationFeed, RevocationSubscription
+from src.infra.revocation.keys import account_key, session_key, snapshot_keys
+
+
+logger = logging.getLogger(__name__)
+
+
+@final
+class FilteredRevokeStoreImpl(RevokeStore):
+    """RevokeStore с локальным bloom-фильтром, синхронизируемым лентой.
+
+    Args:
+        store: Источник истины
+        feed: Лента отзывов между воркерами
+        capacity: Ожидаемое число действующих отзывов
+        error_rate: Доля ложных срабатываний (они идут в store)
+        resync_interval: Период пересборки фильтра по снимку store
+        retry_interval: Пауза перед переподключением к ленте
+    """
+
+    def __init__(  # noqa: PLR0913 настройки фильтра
+        self,
+        store: RevokeStore,
+        feed: RevocationFeed,
+        *,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        resync_interval: timedelta = timedelta(hours=1),
+        retry_interval: timedelta = timedelta(seconds=1),
+    ) -> None:
+        self._store = store
+        self._feed = feed
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._resync_interval = resync_interval.total_seconds()
+        self._retry_interval = retry_interval.total_seconds()
+        self._filter: BloomFilter | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._task = loop.create_task(self._run(), name='revocation-filter')
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        self._filter = None
+
+    @override
+    async def is_revoked(self, refresh_id: RefreshSessionId) -> bool:
+        bloom = self._filter
+        if bloom is not None and session_key(refresh_id) not in bloom:
+            return False
+        return await self._store.is_revoked(refresh_id)
+
+    @override
+    async def revoke(self, refresh_id: RefreshSessionId, ttl: TTL) -> None:
+        await self._store.revoke(refresh_id, ttl)
+        await self._publish(session_key(refresh_id))
+
+    @override
+    async def delete_family(self, family: RefreshFamilyId) -> None:
+        # Удалённая сессия не отозвана, а отсутствует: её отвергнет RefreshStore
+        await self._store.delete_family(family)
+
+    @override
+    async def delete_families(
+        self, account_id: UUID, families: Sequence[RefreshFamilyId] | None = None
+    ) -> int:
+        return await self._store.delete_families(account_id, families)
+
+    @override
+    async def revoke_account(
+        self, account_id: UUID, issued_before: int, ttl: TTL
+    ) -> None:
+        await self._store.revoke_account(account_id, issued_before, ttl)
+        await self._publish(account_key(account_id))
+
+    @override
+    async def account_watermark(self, account_id: UUID) -> int | None:
+        bloom = self._filter
+        if bloom is not None and account_key(account_id) not in bloom:
+            return None
+        return await self._store.account_watermark(account_id)
+
+    @override
+    async def snapshot(self) -> RevocationSnapshot:
+        return await self._store.snapshot()
+
+    @override
+    async def publish_revoked(self, refresh_ids: Sequence[RefreshSessionId]) -> None:
+        for refresh_id in refresh_ids:
+            await self._publish(session_key(refresh_id))
+
+    async def _publish(self, key: str) -> None:
+        if (bloom := self._filter) is not None:
+            bloom.add(key)
+
+        try:
+            await self._feed.publish(key)
+        except Exception:
+            # Отзыв уже в store: остальные воркеры увидят его при пересборке
+            logger.exception('Revocation feed publish failed, key %s', key)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self._feed.subscribe() as subscription:
+                    await self._resync()
+                    await self._listen(subscription)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._filter = None
+                logger.exception('Revocation feed is lost, checks go to the store')
+                await asyncio.sleep(self._retry_interval)
+
+    async def _listen(self, subscription: RevocationSubscription) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._resync_interval
+
+        while True:
+            key = await subscription.get(max(deadline - loop.time(), 0))
+
+            if key is not None and (bloom := self._filter) is not None:
+                bloom.add(key)
+                if bloom.saturated:
+                    deadline = loop.time()
+
+            if loop.time() >= deadline:
+                await self._resync()
+                deadline = loop.time() + self._resync_interval
+
+    async def _resync(self) -> None:
+        """Пересобрать фильтр по снимку: подписка уже открыта, окна без ленты нет."""
+        keys = snapshot_keys(await self._store.snapshot())
+        # Запас под новые отзывы до следующей пересборки
+        capacity = max(self._capacity, len(keys) * 2)
+
+        self._filter = BloomFilter.from_keys(keys, capacity, self._error_rate)
+        logger.info('Revocation filter rebuilt, %d keys', len(keys))
@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.domain.value_objects import RefreshSessionId, RevocationSnapshot
+
+
+SESSION_PREFIX = 's:'
+ACCOUNT_PREFIX = 'a:'
+
+
+def session_key(refresh_id: RefreshSessionId) -> str:
+    return f'{SESSION_PREFIX}{refresh_id.value}'
+
+
+def account_key(account_id: UUID) -> str:
+    return f'{ACCOUNT_PREFIX}{account_id.hex}'
+
+
+def snapshot_keys(snapshot: RevocationSnapshot) -> list[str]:
+    return [
+        *map(session_key, snapshot.sessions),
+        *map(account_key, snapshot.accounts),
+    ]
+
+
+def snapshot_from_keys(keys: Iterable[str]) -> RevocationSnapshot:
+    snapshot = RevocationSnapshot()
+
+    for key in keys:
+        if key.startswith(SESSION_PREFIX):
+            snapshot.sessions.append(RefreshSessionId(key.removeprefix(SESSION_PREFIX)))
+        elif key.startswith(ACCOUNT_PREFIX):
+            snapshot.accounts.append(UUID(key.removeprefix(ACCOUNT_PREFIX)))
+
+    return snapshot
@@ -0,0 +1,72 @@
+from typing import Annotated, Self
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain.value_objects.token import TokenIntrospection
+
+from src.infra.config import settings
+
+from src.presentation.dependencies import IntrospectionServiceDepend
+
+
+router = APIRouter(tags=['authorization'])
+
+
+class IntrospectIn(BaseModel):
+    """One token or a batch: gateway sends all in-flight tokens in one request."""
+
+    token: str | None = None
+    tokens: Annotated[
+        list[str] | None,
+        Field(min_length=1, max_length=settings.jwt.introspect_max_batch),
+    ] = None
+
+    @model_validator(mode='after')
+    def exactly_one(self) -> Self:
+        if (self.token is None) == (self.tokens is None):
+            raise ValueError('Either token or tokens should be provided')
+        return self
+
+
+class IntrospectOut(BaseModel):
+    is_active: bool
+    sub: str | None = None
+    scope: str | None = None
+    exp: int | None = None
+    token_type: str | None = None
+
+    @classmethod
+    def from_introspection(cls, introspection: TokenIntrospection) -> 'IntrospectOut':
+        claims = introspection.claims
+        if not introspection.active or claims is None:
+            return cls(is_active=False)
+
+        return cls(
+            is_active=True,
+            sub=claims.sub,
+            scope=claims.scope,
+            exp=claims.exp,
+            token_type=claims.typ,
+        )
+
+
+class IntrospectBatchOut(BaseModel):
+    tokens: list[IntrospectOut]
+
+
+@router.post('/introspect', response_model_exclude_none=True)
+@inject
+async def introspect(
+    body: IntrospectIn,
+    service: IntrospectionServiceDepend,
+) -> IntrospectOut | IntrospectBatchOut:
+    if body.token is not None:
+        [result] = await service.introspect([body.token])
+        return IntrospectOut.from_introspection(result)
+
+    results = await service.introspect(body.tokens or [])
+    return IntrospectBatchOut(
+        tokens=[IntrospectOut.from_introspection(result) for result in results]
+    )
@@ -0,0 +1,37 @@
+from http import HTTPStatus
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Header, Response
+
+from src.infra.config import settings
+
+from src.presentation.dependencies import KeyProviderDepend
+
+
+router = APIRouter(tags=['keys'])
+
+# Клиенты перечитывают JWKS не чаще раза в max-age, дальше - 304 по ETag.
+# Новый ключ публикуется за столько же до начала подписи им, см. keyring.py
+JWKS_MAX_AGE = int(settings.jwt.jwks_max_age.total_seconds())
+
+
+@router.get('/.well-known/jwks.json')
+@inject
+async def jwks(
+    key_provider: KeyProviderDepend,
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    document = key_provider.jwks()
+    headers = {
+        'ETag': document.etag,
+        'Cache-Control': f'public, max-age={JWKS_MAX_AGE}',
+    }
+
+    if if_none_match == document.etag:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED.value, headers=headers)
+
+    return Response(
+        content=document.body,
+        media_type='application/jwk-set+json',
+        headers=headers,
+    )
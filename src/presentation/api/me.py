@@ -1,8 +1,12 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from src.domain.exceptions import InvalidTokenError
+
+from src.presentation.utils import CurrentAccount
+
 
 router = APIRouter(tags=['authorization'])
 
@@ -14,5 +18,13 @@ class MeOut(BaseModel):
 
 
 @router.get('/me')
-async def handler() -> MeOut:
-    return MeOut(id=uuid4(), email='a@b.c', is_active=True)
+async def handler(account: CurrentAccount) -> MeOut:
+    # Аккаунт из базы всегда с identifier, None - только у ещё не сохранённого
+    if account.identifier is None:
+        raise InvalidTokenError('Account is not stored', ctx={'email': account.email})
+
+    return MeOut(
+        id=account.identifier,
+        email=account.email.value,
+        is_active=account.is_active,
+    )
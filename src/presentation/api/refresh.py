@@ -0,0 +1,33 @@
+from dependency_injector.wiring import inject
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from src.domain.value_objects import RefreshToken
+
+from src.presentation.dependencies import RefreshServiceDepend
+
+
+router = APIRouter(tags=['authorization'])
+
+
+class RefreshIn(BaseModel):
+    refresh_token: str
+
+
+class RefreshOut(BaseModel):
+    access_token: str
+    refresh_token: str
+
+
+@router.post('/refresh')
+@inject
+async def refresh(
+    body: RefreshIn,
+    service: RefreshServiceDepend,
+) -> RefreshOut:
+    result = await service.refresh(RefreshToken(body.refresh_token))
+
+    return RefreshOut(
+        access_token=str(result.access_token),
+        refresh_token=str(result.refresh_token),
+    )
@@ -0,0 +1,84 @@
+from datetime import UTC, datetime
+from typing import Annotated
+from uuid import UUID
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Query, status
+from pydantic import BaseModel
+
+from src.domain.value_objects import AccessToken, RefreshFamilyId, SessionInfo
+
+from src.presentation.dependencies import SessionServiceDepend
+from src.presentation.utils import BearerCredentials
+
+
+router = APIRouter(tags=['sessions'])
+
+MAX_PAGE_SIZE = 100
+
+
+class SessionOut(BaseModel):
+    family_id: str
+    created_at: datetime
+    last_used_at: datetime | None
+    expires_at: datetime
+
+    @classmethod
+    def from_info(cls, info: SessionInfo) -> 'SessionOut':
+        return cls(
+            family_id=info.family.value,
+            created_at=datetime.fromtimestamp(info.created_at, UTC),
+            last_used_at=datetime.fromtimestamp(info.last_used_at, UTC)
+            if info.last_used_at
+            else None,
+            expires_at=datetime.fromtimestamp(info.expires_at, UTC),
+        )
+
+
+class SessionsOut(BaseModel):
+    sessions: list[SessionOut]
+    next_cursor: str | None
+
+
+@router.get('/sessions')
+@inject
+async def list_sessions(
+    credentials: BearerCredentials,
+    service: SessionServiceDepend,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 20,
+    cursor: str | None = None,
+) -> SessionsOut:
+    page = await service.list_sessions(
+        AccessToken(credentials.credentials), limit, cursor
+    )
+
+    return SessionsOut(
+        sessions=[SessionOut.from_info(info) for info in page.sessions],
+        next_cursor=page.cursor,
+    )
+
+
+@router.post('/sessions/{family_id}/revoke', status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def revoke_session(
+    family_id: UUID,
+    credentials: BearerCredentials,
+    service: SessionServiceDepend,
+) -> None:
+    await service.revoke_session(
+        AccessToken(credentials.credentials), RefreshFamilyId(family_id.hex)
+    )
+
+
+@router.post('/logout', status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def logout(credentials: BearerCredentials, service: SessionServiceDepend) -> None:
+    await service.logout(AccessToken(credentials.credentials))
+
+
+@router.post('/logout/all', status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def logout_all(
+    credentials: BearerCredentials, service: SessionServiceDepend
+) -> None:
+    await service.logout_all(AccessToken(credentials.credentials))
@@ -3,7 +3,16 @@ from typing import Annotated
 from dependency_injector.wiring import Provide
 from fastapi import Depends
 
-from src.application import LoginService, RegisterService
+from src.infra.key_provider import KeyProvider
+
+from src.application import (
+    AccountService,
+    IntrospectionService,
+    LoginService,
+    RefreshService,
+    RegisterService,
+    SessionService,
+)
 
 from src.bootstrap.wiring import AuthContainer
 
@@ -12,7 +21,27 @@ LoginServiceDepend = Annotated[
     LoginService,
     Depends(Provide[AuthContainer.login_service]),
 ]
+RefreshServiceDepend = Annotated[
+    RefreshService,
+    Depends(Provide[AuthContainer.refresh_service]),
+]
 RegisterServiceDepend = Annotated[
     RegisterService,
     Depends(Provide[AuthContainer.register_service]),
 ]
+SessionServiceDepend = Annotated[
+    SessionService,
+    Depends(Provide[AuthContainer.session_service]),
+]
+AccountServiceDepend = Annotated[
+    AccountService,
+    Depends(Provide[AuthContainer.account_service]),
+]
+IntrospectionServiceDepend = Annotated[
+    IntrospectionService,
+    Depends(Provide[AuthContainer.introspection_service]),
+]
+KeyProviderDepend = Annotated[
+    KeyProvider,
+    Depends(Provide[AuthContainer.key_provider]),
+]
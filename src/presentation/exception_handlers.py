@@ -3,6 +3,14 @@ from __future__ import annotations
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
+from src.domain.exceptions import (
+    InvalidCursorError,
+    InvalidTokenError,
+    SessionNotFoundError,
+)
+
+from src.infra.exceptions import PasswordHasherOverloadedError
+
 from src.application.exceptions import InvalidCredentialsError
 
 
@@ -13,5 +21,39 @@ async def invalid_credentials(_: Request, exc: Exception) -> JSONResponse:
     )
 
 
+async def invalid_token(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={'detail': 'Invalid or expired token'},
+        headers={'WWW-Authenticate': 'Bearer'},
+    )
+
+
+async def invalid_cursor(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={'detail': 'Invalid pagination cursor'},
+    )
+
+
+async def session_not_found(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={'detail': 'Session not found'},
+    )
+
+
+async def service_overloaded(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'detail': 'Service is overloaded, try again later'},
+        headers={'Retry-After': '1'},
+    )
+
+
 def add_custom_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(InvalidCredentialsError, invalid_credentials)
+    app.add_exception_handler(InvalidTokenError, invalid_token)
+    app.add_exception_handler(InvalidCursorError, invalid_cursor)
+    app.add_exception_handler(SessionNotFoundError, session_not_found)
+    app.add_exception_handler(PasswordHasherOverloadedError, service_overloaded)
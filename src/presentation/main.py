@@ -4,24 +4,54 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from src.infra.config import settings
+from src.infra.key_provider import KeyringKeyProviderImpl
+from src.infra.key_rotation import KeyringWatcher
+from src.infra.messaging.outbox_publisher import event_publisher, event_serializers
 
 from src.bootstrap.wiring import AuthContainer
 
-from src.presentation import api as api_package
+from src.presentation import api as api_package, utils as utils_module
 from src.presentation.exception_handlers import add_custom_exception_handlers
 
+from .api.introspect import router as introspect_router
+from .api.jwks import router as jwks_router
 from .api.login import router as login_router
+from .api.me import router as me_router
+from .api.refresh import router as refresh_router
 from .api.register import router as register_router
+from .api.sessions import router as sessions_router
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: RUF029
-    yield
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    # Все публикаторы и события уже импортированы: диспетчеризация и
+    # сериализаторы собираются сразу
+    event_publisher.freeze()
+    event_serializers.compile()
+
+    key_provider = container.key_provider()
+    watcher = None
+
+    if isinstance(key_provider, KeyringKeyProviderImpl):
+        watcher = KeyringWatcher(key_provider, settings.jwt.keyring_poll_interval)
+        watcher.start()
+
+    revoke_store = container.revoke_store()
+    revoke_store.start()
+
+    try:
+        yield
+    finally:
+        await revoke_store.stop()
+        if watcher is not None:
+            await watcher.stop()
+        container.password_hasher().shutdown()
+        await container.redis().aclose()
 
 
 container = AuthContainer()
 container.config.from_pydantic(settings)
-container.wire(packages=[api_package])
+container.wire(packages=[api_package], modules=[utils_module])
 
 
 def create_app() -> FastAPI:
@@ -32,7 +62,12 @@ def create_app() -> FastAPI:
     )
 
     app.include_router(login_router)
+    app.include_router(refresh_router)
     app.include_router(register_router)
+    app.include_router(me_router)
+    app.include_router(sessions_router)
+    app.include_router(introspect_router)
+    app.include_router(jwks_router)
 
     add_custom_exception_handlers(app)
 
@@ -1,8 +1,26 @@
 import typing as tp
 
+from dependency_injector.wiring import inject
 from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.domain.entities import Account
+from src.domain.value_objects import AccessToken
 
+from src.presentation.dependencies import AccountServiceDepend
 
-def get_current_user(token: tp.Annotated[str, Depends()]) -> Account: ...
+
+bearer = HTTPBearer()
+
+BearerCredentials = tp.Annotated[HTTPAuthorizationCredentials, Depends(bearer)]
+
+
+@inject
+async def get_current_user(
+    credentials: BearerCredentials,
+    service: AccountServiceDepend,
+) -> Account:
+    return await service.get_account(AccessToken(credentials.credentials))
+
+
+CurrentAccount = tp.Annotated[Account, Depends(get_current_user)]
@@ -1,4 +1,5 @@
 from .cases import INVALID_EMAILS, INVALID_PASSWORDS
+from .factories import SESSION_TTL, make_session
 from .parsers import parse_unprocessable_entity_response
 from .urls import URLS
 from .utils import create_database, drop_database
@@ -7,8 +8,10 @@ from .utils import create_database, drop_database
 __all__ = [
     'INVALID_EMAILS',
     'INVALID_PASSWORDS',
+    'SESSION_TTL',
     'URLS',
     'create_database',
     'drop_database',
+    'make_session',
     'parse_unprocessable_entity_response',
 ]
@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator, AsyncIterator
 import pytest
 import pytest_asyncio
 from asgi_lifespan import LifespanManager
+import sqlalchemy as sa
 from faker import Faker
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import NullPool
@@ -13,8 +14,9 @@ from src.domain.entities import Account
 from src.domain.value_objects import Email, Password
 
 from src.infra.config import Settings, settings
+from src.infra.orm.models import Outbox
 from src.infra.orm.models.base import Base
-from src.infra.orm.session import make_engine
+from src.infra.orm.session import SessionFactory, async_session, make_engine
 
 from src.application import RegisterCommand, UnitOfWork
 
@@ -39,6 +41,8 @@ def conf(worker_id: str) -> Settings:
     """
     settings.database_url = f'{settings.database_url}_test_{worker_id}'
     settings.debug = True
+    # CI has Postgres only, refresh sessions go to its tables
+    settings.refresh_store.backend = 'db'
     return settings
 
 
@@ -136,6 +140,15 @@ async def uow(container: AuthContainer) -> AsyncGenerator[UnitOfWork]:
         yield uow
 
 
+@pytest_asyncio.fixture
+async def session_factory(container: AuthContainer) -> SessionFactory:
+    """Session factory over an empty outbox: outbox tests count its rows."""
+    session_factory = container.session_factory()
+    async with async_session(session_factory) as db:
+        await db.execute(sa.delete(Outbox))
+    return session_factory
+
+
 @pytest.fixture(scope='session')
 def faker() -> Faker:
     """Just a Faker as fixture."""
@@ -0,0 +1,26 @@
+import time
+from uuid import UUID, uuid4
+
+from src.domain.entities import RefreshSession
+from src.domain.value_objects import RefreshFamilyId, RefreshSessionId
+
+
+SESSION_TTL = 3600
+
+
+def make_session(
+    family: RefreshFamilyId,
+    parent: RefreshSession | None = None,
+    *,
+    account_id: UUID | None = None,
+    ttl: int = SESSION_TTL,
+) -> RefreshSession:
+    """Refresh-сессия; без account_id - случайный владелец (только без БД)."""
+    return RefreshSession(
+        identifier=RefreshSessionId(uuid4().hex),
+        family=family,
+        account_id=account_id or uuid4(),
+        token_hash=uuid4().hex,
+        expires_at=int(time.time()) + ttl,
+        parent=parent.identifier if parent else None,
+    )
@@ -0,0 +1,65 @@
+from http import HTTPStatus
+
+from httpx import AsyncClient
+
+from src.domain.entities import Account
+from src.domain.value_objects import TTL, AccessToken, RefreshSessionId
+
+from src.bootstrap import AuthContainer
+
+from tests import URLS
+
+
+async def test_introspect_should_accept_single_token(
+    client: AsyncClient, account: Account, password: str
+):
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+
+    r = await client.post(URLS.introspect, json={'token': r.json()['access_token']})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert r.json()['is_active'] is True
+    assert r.json()['sub'] == str(account.identifier)
+
+
+async def test_introspect_should_accept_batch(
+    client: AsyncClient, account: Account, password: str
+):
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    tokens = [r.json()['access_token'], 'a.b.c', r.json()['refresh_token']]
+
+    r = await client.post(URLS.introspect, json={'tokens': tokens})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert [t['is_active'] for t in r.json()['tokens']] == [True, False, True]
+    assert r.json()['tokens'][2]['token_type'] == 'refresh'
+
+
+async def test_introspect_should_report_revoked_token_inactive(
+    client: AsyncClient, container: AuthContainer, account: Account, password: str
+):
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    access_token = r.json()['access_token']
+    claims = await container.jwt_service().verify_access(AccessToken(access_token))
+    assert claims.sid is not None
+
+    await container.revoke_store().revoke(RefreshSessionId(claims.sid), TTL(60))
+    r = await client.post(URLS.introspect, json={'token': access_token})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert r.json()['is_active'] is False
+
+
+async def test_introspect_should_reject_empty_request(client: AsyncClient):
+    r = await client.post(URLS.introspect, json={})
+
+    assert r.status_code == HTTPStatus.UNPROCESSABLE_ENTITY.value
@@ -0,0 +1,16 @@
+from http import HTTPStatus
+
+from httpx import AsyncClient
+
+from tests import URLS
+
+
+async def test_jwks_should_support_etag(client: AsyncClient):
+    r = await client.get(URLS.jwks)
+
+    assert r.status_code == HTTPStatus.OK.value
+    assert 'keys' in r.json()
+
+    r = await client.get(URLS.jwks, headers={'If-None-Match': r.headers['ETag']})
+
+    assert r.status_code == HTTPStatus.NOT_MODIFIED.value
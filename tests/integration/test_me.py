@@ -0,0 +1,28 @@
+from http import HTTPStatus
+
+from httpx import AsyncClient
+
+from src.domain.entities import Account
+
+from tests import URLS
+
+
+async def test_me_should_return_token_owner(
+    client: AsyncClient, account: Account, password: str
+):
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    access_token = r.json()['access_token']
+
+    r = await client.get(URLS.me, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert r.json()['id'] == str(account.identifier)
+
+
+async def test_me_should_reject_invalid_token(client: AsyncClient):
+    r = await client.get(URLS.me, headers={'Authorization': 'Bearer a.b.c'})
+
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+import sqlalchemy as sa
+from sqlalchemy import event as sa_event
+
+from src.domain.events import AccountAuthorized, AccountRegistered, DomainEvent
+from src.domain.value_objects import Email
+
+from src.infra.messaging.outbox_publisher import OutboxEventPublisher
+from src.infra.orm.models import Outbox
+from src.infra.orm.models.outbox import OutboxStatus
+from src.infra.orm.session import SessionFactory, async_session
+from src.infra.repositories.outbox import OutboxRepositoryDb
+
+from src.bootstrap import AuthContainer
+
+
+EVENTS = 5
+
+
+async def test_publish_many_should_insert_rows_with_one_statement(
+    container: AuthContainer, session_factory: SessionFactory
+):
+    account_ids = [uuid4() for _ in range(EVENTS)]
+    events: list[DomainEvent] = [
+        AccountRegistered(email=Email(f'{i}@example.com'), account_id=account_id)
+        for i, account_id in enumerate(account_ids)
+    ]
+    # Без публикатора: строк в outbox не даёт
+    events.append(AccountAuthorized(email=Email('0@example.com')))
+    inserts: list[str] = []
+
+    def count_inserts(*args: object) -> None:
+        statement = str(args[2])
+        if statement.startswith('INSERT INTO outbox'):
+            inserts.append(statement)
+
+    engine = container.engine().sync_engine
+    sa_event.listen(engine, 'before_cursor_execute', count_inserts)
+    try:
+        async with async_session(session_factory) as db:
+            await OutboxEventPublisher(OutboxRepositoryDb(db)).publish_many(events)
+    finally:
+        sa_event.remove(engine, 'before_cursor_execute', count_inserts)
+
+    async with async_session(session_factory) as db:
+        rows = (await db.scalars(sa.select(Outbox).order_by(Outbox.id))).all()
+
+    assert len(inserts) == 1
+    assert len(rows) == EVENTS
+    assert {row.status for row in rows} == {OutboxStatus.NEW}
+    assert all(row.next_retry_at is not None for row in rows)
+    assert [row.payload['email'] for row in rows] == [
+        {'value': f'{i}@example.com'} for i in range(EVENTS)
+    ]
+    assert [row.key for row in rows] == [str(account_id) for account_id in account_ids]
+    assert rows[0].headers == {'type': 'AccountRegistered', 'v': '1'}
@@ -0,0 +1,313 @@
+import asyncio
+import contextlib
+import itertools
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from src.infra.dto import OutboxDelivery, OutboxDto
+from src.infra.messaging.broker import MemoryBrokerImpl
+from src.infra.messaging.producer import BatchingProducerImpl
+from src.infra.exceptions import InvalidOutboxLeaseError
+from src.infra.messaging.relay import LEASE_MARGIN, OutboxRelay, check_lease
+from src.infra.messaging.retry import RetryPolicy
+from src.infra.messaging.transport import ProducerTransportImpl
+from src.infra.messaging.wakeup import PgWakeupSourceImpl
+from src.infra.orm.models import Outbox
+from src.infra.orm.models.outbox import OutboxStatus
+from src.infra.orm.session import SessionFactory, async_session
+from src.infra.repositories.outbox import OUTBOX_CHANNEL, OutboxRepositoryDb
+
+from src.bootstrap import AuthContainer
+
+
+MESSAGES = 50
+BATCH_SIZE = 10
+BROKEN_TOPIC = 'broken'
+PARTITIONS = 3
+KEYS = ('account-1', 'account-2')
+MESSAGES_PER_KEY = 5
+# claim упавшего relay и повтор
+ATTEMPTS_AFTER_CRASH = 2
+# Опрос реже, чем тест готов ждать: успеть можно только по NOTIFY
+POLL_INTERVAL = timedelta(minutes=1)
+NOTIFY_TIMEOUT = 5
+SLOW_RETRY = RetryPolicy(base_delay=timedelta(minutes=1))
+MAX_ATTEMPTS = 3
+# Без пауз: все попытки подряд в одном тесте
+FAST_RETRY = RetryPolicy(base_delay=timedelta(), max_attempts=MAX_ATTEMPTS)
+# Опрос раз в секунду (poll_interval по умолчанию): за 2 с - пара claim
+BLOCKED_KEY_WATCH = timedelta(seconds=2)
+MAX_CLAIMS_WHILE_BLOCKED = 4
+# Аренда чуть длиннее запаса: на отправку остаётся доля секунды
+SHORT_LEASE = LEASE_MARGIN + timedelta(milliseconds=200)
+
+
+class RecordingTransport:
+    def __init__(self) -> None:
+        self.sent: list[int] = []
+        self._offsets = itertools.count()
+
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        await asyncio.sleep(0.001)
+        if message.topic == BROKEN_TOPIC:
+            raise ConnectionError('Broker is down')
+
+        self.sent.append(message.saved_id)
+        return OutboxDelivery(message.saved_id, partition=0, offset=next(self._offsets))
+
+
+class HangingTransport:
+    """Отправка, которая не заканчивается: брокер принял соединение и молчит."""
+
+    async def send(self, message: OutboxDto) -> OutboxDelivery:
+        await asyncio.Event().wait()
+        raise AssertionError(message.saved_id)
+
+
+async def add_messages(
+    session_factory: SessionFactory, topic: str, count: int, key: str | None = None
+) -> None:
+    async with async_session(session_factory) as db:
+        repository = OutboxRepositoryDb(db)
+        for i in range(count):
+            await repository.create(
+                OutboxDto(topic=topic, headers={}, payload={'i': i}, key=key)
+            )
+
+
+async def outbox_rows(session_factory: SessionFactory) -> list[Outbox]:
+    async with async_session(session_factory) as db:
+        return list((await db.scalars(sa.select(Outbox).order_by(Outbox.id))).all())
+
+
+async def test_relays_should_publish_each_message_once(session_factory: SessionFactory):
+    await add_messages(session_factory, 'account.registered', MESSAGES)
+    transport = RecordingTransport()
+    relays = [
+        OutboxRelay(session_factory, transport, batch_size=BATCH_SIZE, max_in_flight=4)
+        for _ in range(3)
+    ]
+
+    async def drain(relay: OutboxRelay) -> None:
+        while await relay.run_once():
+            pass
+
+    await asyncio.gather(*(drain(relay) for relay in relays))
+    rows = await outbox_rows(session_factory)
+
+    assert Counter(transport.sent) == Counter(row.id for row in rows)
+    assert {row.status for row in rows} == {OutboxStatus.PUBLISHED}
+    assert all(row.kafka_offset is not None for row in rows)
+
+
+async def test_producer_offsets_should_be_saved(session_factory: SessionFactory):
+    await add_messages(session_factory, 'account.registered', MESSAGES)
+    broker = MemoryBrokerImpl(partitions=PARTITIONS)
+    transport = ProducerTransportImpl(BatchingProducerImpl(broker))
+    relay = OutboxRelay(session_factory, transport, max_in_flight=MESSAGES)
+
+    assert await relay.run_once() == MESSAGES
+    rows = await outbox_rows(session_factory)
+
+    # Параллельные send() relay ушли в брокер пачками, а не поштучно
+    assert broker.requests <= PARTITIONS
+    offsets = {(row.kafka_partition, row.kafka_offset) for row in rows}
+    assert len(offsets) == MESSAGES
+    assert offsets == {
+        (partition, offset)
+        for partition in range(PARTITIONS)
+        for offset in range(len(broker.records('account.registered', partition)))
+    }
+
+
+async def test_relays_should_keep_order_within_key(session_factory: SessionFactory):
+    for key in KEYS:
+        await add_messages(session_factory, 'account.registered', MESSAGES_PER_KEY, key)
+    transport = RecordingTransport()
+    relays = [OutboxRelay(session_factory, transport) for _ in range(3)]
+
+    # За один claim - только первая строка каждого key
+    assert await relays[0].run_once() == len(KEYS)
+    while sum(await asyncio.gather(*(relay.run_once() for relay in relays))):
+        pass
+
+    rows = await outbox_rows(session_factory)
+    for key in KEYS:
+        ids = [row.id for row in rows if row.key == key]
+        assert [sent for sent in transport.sent if sent in ids] == ids
+
+
+async def test_failed_message_should_hold_only_its_key(session_factory: SessionFactory):
+    await add_messages(session_factory, BROKEN_TOPIC, 1, key=KEYS[0])
+    await add_messages(session_factory, 'account.registered', 1, key=KEYS[0])
+    await add_messages(session_factory, 'account.registered', 1, key=KEYS[1])
+    transport = RecordingTransport()
+    relay = OutboxRelay(session_factory, transport, retry=SLOW_RETRY)
+
+    assert await relay.run_once() == len(KEYS)
+    # Вторая строка KEYS[0] ждёт повтора первой
+    assert await relay.run_once() == 0
+
+    rows = await outbox_rows(session_factory)
+    assert [row.status for row in rows] == [
+        OutboxStatus.FAILED,
+        OutboxStatus.NEW,
+        OutboxStatus.PUBLISHED,
+    ]
+
+
+async def test_failed_message_should_wait_for_retry(session_factory: SessionFactory):
+    await add_messages(session_factory, BROKEN_TOPIC, 1)
+    relay = OutboxRelay(session_factory, RecordingTransport(), retry=SLOW_RETRY)
+
+    assert await relay.run_once() == 1
+    # Повтор только после паузы RetryPolicy
+    assert await relay.run_once() == 0
+
+    [row] = await outbox_rows(session_factory)
+    assert row.status == OutboxStatus.FAILED
+    assert row.attempts == 1
+    assert row.error is not None
+    assert 'Broker is down' in row.error
+
+
+async def test_expired_lease_should_return_message_to_queue(
+    session_factory: SessionFactory,
+):
+    await add_messages(session_factory, 'account.registered', 1)
+    async with async_session(session_factory) as db:
+        # relay забрал строку и упал: аренда кончилась, статусов никто не запишет
+        await OutboxRepositoryDb(db).claim(1, lease=timedelta(seconds=-1))
+    transport = RecordingTransport()
+    relay = OutboxRelay(session_factory, transport)
+
+    assert await relay.release_expired() == 1
+    assert await relay.run_once() == 1
+    [row] = await outbox_rows(session_factory)
+    assert row.status == OutboxStatus.PUBLISHED
+    assert row.attempts == ATTEMPTS_AFTER_CRASH
+
+
+async def test_relay_should_wake_up_on_notify(
+    container: AuthContainer, session_factory: SessionFactory
+):
+    transport = RecordingTransport()
+    relay = OutboxRelay(
+        session_factory,
+        transport,
+        wakeups=PgWakeupSourceImpl(container.engine(), OUTBOX_CHANNEL),
+        poll_interval=POLL_INTERVAL,
+    )
+    task = asyncio.create_task(relay.run())
+    try:
+        # Первая пустая пачка прочитана, relay уснул до NOTIFY
+        await asyncio.sleep(0.5)
+        await add_messages(session_factory, 'account.registered', 1)
+
+        async with asyncio.timeout(NOTIFY_TIMEOUT):
+            while not transport.sent:
+                await asyncio.sleep(0.05)
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    [row] = await outbox_rows(session_factory)
+    assert transport.sent == [row.id]
+
+
+async def test_poison_message_should_go_to_dlq_and_replay(
+    session_factory: SessionFactory,
+):
+    await add_messages(session_factory, BROKEN_TOPIC, 1)
+    relay = OutboxRelay(session_factory, RecordingTransport(), retry=FAST_RETRY)
+
+    for _ in range(MAX_ATTEMPTS):
+        assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+
+    [row] = await outbox_rows(session_factory)
+    assert row.status == OutboxStatus.DLQ
+    assert row.attempts == MAX_ATTEMPTS
+    assert row.next_retry_at is None
+
+    async with async_session(session_factory) as db:
+        repository = OutboxRepositoryDb(db)
+        [dead] = await repository.dead_letters(limit=10)
+        assert dead.id == row.id
+        assert await repository.replay([row.id]) == 1
+
+    [row] = await outbox_rows(session_factory)
+    assert row.status == OutboxStatus.NEW
+    assert row.attempts == 0
+    assert await relay.run_once() == 1
+
+
+async def test_relay_should_know_when_retry_is_due(session_factory: SessionFactory):
+    await add_messages(session_factory, BROKEN_TOPIC, 1)
+    relay = OutboxRelay(session_factory, RecordingTransport(), retry=SLOW_RETRY)
+    await relay.run_once()
+
+    async with async_session(session_factory) as db:
+        due = await OutboxRepositoryDb(db).seconds_until_due()
+
+    # Пауза после первой неудачи - от половины base_delay до base_delay
+    base_delay = SLOW_RETRY.base_delay.total_seconds()
+    assert due is not None
+    assert base_delay / 2 - 1 < due <= base_delay
+
+
+async def test_blocked_key_should_not_spin_relay(
+    session_factory: SessionFactory, monkeypatch: pytest.MonkeyPatch
+):
+    await add_messages(session_factory, BROKEN_TOPIC, 1, key=KEYS[0])
+    await add_messages(session_factory, 'account.registered', 1, key=KEYS[0])
+    relay = OutboxRelay(session_factory, RecordingTransport(), retry=SLOW_RETRY)
+    assert await relay.run_once() == 1
+
+    claims = 0
+    run_once = relay.run_once
+
+    async def counting_run_once() -> int:
+        nonlocal claims
+        claims += 1
+        return await run_once()
+
+    monkeypatch.setattr(relay, 'run_once', counting_run_once)
+    task = asyncio.create_task(relay.run())
+    try:
+        await asyncio.sleep(BLOCKED_KEY_WATCH.total_seconds())
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    # Вторая строка KEYS[0] ждёт повтора первой: relay спит до опроса
+    assert claims <= MAX_CLAIMS_WHILE_BLOCKED
+
+
+async def test_stalled_send_should_fail_before_lease_ends(
+    session_factory: SessionFactory,
+):
+    await add_messages(session_factory, 'account.registered', 1)
+    relay = OutboxRelay(
+        session_factory, HangingTransport(), lease=SHORT_LEASE, retry=SLOW_RETRY
+    )
+
+    async with asyncio.timeout(SHORT_LEASE.total_seconds()):
+        assert await relay.run_once() == 1
+
+    [row] = await outbox_rows(session_factory)
+    assert row.status == OutboxStatus.FAILED
+    assert row.error is not None
+    assert 'TimeoutError' in row.error
+
+
+def test_lease_should_outlast_producer_timeouts(container: AuthContainer):
+    with pytest.raises(InvalidOutboxLeaseError):
+        check_lease(timedelta(seconds=30), send_time=timedelta(seconds=40))
+    with pytest.raises(InvalidOutboxLeaseError):
+        OutboxRelay(container.session_factory(), HangingTransport(), lease=LEASE_MARGIN)
@@ -0,0 +1,150 @@
+import gzip
+import json
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest_asyncio
+import sqlalchemy as sa
+
+from src.infra.messaging.retention import OutboxRetention, partition_name
+from src.infra.orm.models import Outbox
+from src.infra.orm.models.outbox import OutboxStatus
+from src.infra.orm.session import SessionFactory, async_session
+
+
+# Дни далеко в прошлом: не пересекаются со строками других тестов
+TODAY = date(2000, 1, 10)
+RETENTION = timedelta(days=7)
+PREMAKE_DAYS = 2
+OLD_DAY = date(2000, 1, 1)
+HELD_DAY = date(2000, 1, 2)
+FRESH_DAY = date(2000, 1, 5)
+ROWS_PER_DAY = 3
+
+
+@pytest_asyncio.fixture
+async def session_factory(
+    session_factory: SessionFactory,
+) -> AsyncIterator[SessionFactory]:
+    """Общая фабрика из conftest и удаление созданных тестом секций."""
+    yield session_factory
+
+    async with async_session(session_factory) as db:
+        names = await db.scalars(
+            sa.text(
+                'SELECT relname FROM pg_class '
+                "WHERE relkind = 'r' AND relname LIKE 'outbox_p2000%'"
+            )
+        )
+        for name in names.all():
+            await db.execute(sa.text(f'DROP TABLE {name}'))
+
+
+async def add_day(
+    session_factory: SessionFactory, day: date, status: OutboxStatus
+) -> None:
+    created_at = datetime.combine(day, datetime.min.time())
+    async with async_session(session_factory) as db:
+        db.add_all(
+            Outbox(
+                topic='account.registered',
+                payload={'i': i},
+                headers={},
+                status=status,
+                attempts=0,
+                created_at=created_at + timedelta(hours=i),
+            )
+            for i in range(ROWS_PER_DAY)
+        )
+
+
+async def day_partitions(session_factory: SessionFactory) -> set[str]:
+    async with async_session(session_factory) as db:
+        names = await db.scalars(
+            sa.text(
+                'SELECT c.relname FROM pg_inherits i '
+                'JOIN pg_class c ON c.oid = i.inhrelid '
+                "WHERE i.inhparent = 'outbox'::regclass"
+            )
+        )
+        return set(names.all())
+
+
+async def test_retention_should_drop_published_days(
+    session_factory: SessionFactory, tmp_path: Path
+):
+    retention = OutboxRetention(
+        session_factory,
+        retention=RETENTION,
+        premake_days=PREMAKE_DAYS,
+        archive_dir=tmp_path,
+    )
+    for day in (OLD_DAY, HELD_DAY, FRESH_DAY):
+        await retention.create_partitions(day)
+    await add_day(session_factory, OLD_DAY, OutboxStatus.PUBLISHED)
+    await add_day(session_factory, HELD_DAY, OutboxStatus.DLQ)
+    await add_day(session_factory, FRESH_DAY, OutboxStatus.PUBLISHED)
+
+    report = await retention.run(TODAY)
+    partitions = await day_partitions(session_factory)
+
+    assert report.created == [
+        partition_name(TODAY + timedelta(days=i)) for i in range(PREMAKE_DAYS + 1)
+    ]
+    assert report.dropped == [partition_name(OLD_DAY)]
+    assert partition_name(OLD_DAY) not in partitions
+    # Строки в DLQ держат свой день
+    assert report.kept == [partition_name(HELD_DAY)]
+    assert {partition_name(HELD_DAY), partition_name(FRESH_DAY)} <= partitions
+
+    archive = tmp_path / f'{partition_name(OLD_DAY)}.ndjson.gz'
+    assert archive in report.archived
+    with gzip.open(archive, 'rt', encoding='utf-8') as lines:
+        rows = [json.loads(line) for line in lines]
+    assert [row['payload'] for row in rows] == [{'i': i} for i in range(ROWS_PER_DAY)]
+    assert {row['status'] for row in rows} == {OutboxStatus.PUBLISHED.name}
+
+    async with async_session(session_factory) as db:
+        left = await db.scalar(sa.select(sa.func.count()).select_from(Outbox))
+    assert left == 2 * ROWS_PER_DAY
+
+
+async def test_retention_should_finish_detached_partition(
+    session_factory: SessionFactory,
+):
+    retention = OutboxRetention(session_factory, retention=RETENTION, premake_days=0)
+    await retention.create_partitions(OLD_DAY)
+    await add_day(session_factory, OLD_DAY, OutboxStatus.PUBLISHED)
+    # Прошлый запуск упал между DETACH и DROP
+    async with async_session(session_factory) as db:
+        await db.execute(
+            sa.text(f'ALTER TABLE outbox DETACH PARTITION {partition_name(OLD_DAY)}')
+        )
+
+    report = await retention.run(TODAY)
+
+    assert report.dropped == [partition_name(OLD_DAY)]
+    assert report.archived == []
+
+
+async def test_retention_should_keep_foreign_and_fresh_detached_tables(
+    session_factory: SessionFactory,
+):
+    retention = OutboxRetention(session_factory, retention=RETENTION, premake_days=0)
+    await retention.create_partitions(FRESH_DAY)
+    # Не секции outbox, хотя похожи на них по LIKE
+    foreign = ['outbox_p2000_manual', 'outboxXp20000101']
+    async with async_session(session_factory) as db:
+        await db.execute(
+            sa.text(f'ALTER TABLE outbox DETACH PARTITION {partition_name(FRESH_DAY)}')
+        )
+        for name in foreign:
+            await db.execute(sa.text(f'CREATE TABLE {name} (id bigint)'))
+
+    report = await retention.run(TODAY)
+
+    assert report.dropped == []
+    async with async_session(session_factory) as db:
+        for name in [*foreign, partition_name(FRESH_DAY)]:
+            assert await db.scalar(sa.select(sa.func.to_regclass(name))) is not None
@@ -0,0 +1,87 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+from src.domain.entities import Account
+
+from src.bootstrap import AuthContainer
+
+from tests import URLS
+
+
+@pytest.fixture
+async def refresh_token(client: AsyncClient, account: Account, password: str) -> str:
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    return r.json()['refresh_token']
+
+
+async def test_refresh_should_return_new_pair(
+    client: AsyncClient, account: Account, refresh_token: str
+):
+    r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert r.json()['refresh_token'] != refresh_token
+
+    access_token = r.json()['access_token']
+    r = await client.get(URLS.me, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    assert r.json()['id'] == str(account.identifier)
+
+
+async def test_refresh_should_chain_rotations(client: AsyncClient, refresh_token: str):
+    for _ in range(3):
+        r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+        assert r.status_code == HTTPStatus.OK.value, r.json()
+        refresh_token = r.json()['refresh_token']
+
+
+async def test_reused_refresh_token_should_revoke_family(
+    client: AsyncClient, refresh_token: str
+):
+    r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+    rotated = r.json()['refresh_token']
+
+    r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+    # Семья отозвана: токен, выданный последним, тоже не работает
+    r = await client.post(URLS.refresh, json={'refresh_token': rotated})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+
+async def test_reused_refresh_token_should_revoke_sibling_access_token(
+    client: AsyncClient, container: AuthContainer, refresh_token: str
+):
+    revoke_store = container.revoke_store()
+    while not revoke_store.ready:
+        await asyncio.sleep(0.01)
+    r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+    access_token = r.json()['access_token']
+
+    r = await client.post(URLS.refresh, json={'refresh_token': refresh_token})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+    # Отзыв семьи сделан внутри RefreshStore: фильтр узнаёт о нём из ленты
+    r = await client.get(URLS.me, headers={'Authorization': f'Bearer {access_token}'})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+
+async def test_refresh_should_reject_access_token(
+    client: AsyncClient, account: Account, password: str
+):
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+
+    r = await client.post(URLS.refresh, json={'refresh_token': r.json()['access_token']})
+
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
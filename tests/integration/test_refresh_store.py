@@ -0,0 +1,129 @@
+import time
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.domain.entities import Account
+from src.domain.exceptions import InvalidTokenError, RefreshTokenReusedError
+from src.domain.value_objects import TTL, RefreshFamilyId, RefreshSessionId
+
+from src.infra.refresh_store.db import DbRefreshStoreImpl, DbRevokeStoreImpl
+
+from src.bootstrap import AuthContainer
+
+from tests import make_session
+
+
+@pytest.fixture
+def refresh_store(container: AuthContainer) -> DbRefreshStoreImpl:
+    return DbRefreshStoreImpl(container.session_factory())
+
+
+@pytest.fixture
+def revoke_store(container: AuthContainer) -> DbRevokeStoreImpl:
+    return DbRevokeStoreImpl(container.session_factory())
+
+
+@pytest.fixture
+def family() -> RefreshFamilyId:
+    return RefreshFamilyId(uuid4().hex)
+
+
+async def test_rotate_should_replace_session(
+    refresh_store: DbRefreshStoreImpl, account: Account, family: RefreshFamilyId
+):
+    old = make_session(family, account_id=account.identifier)
+    new = make_session(family, old, account_id=account.identifier)
+    await refresh_store.save(old)
+
+    await refresh_store.rotate(old.identifier, new)
+    stored_old, stored_new, missing = await refresh_store.get_many([
+        old.identifier,
+        new.identifier,
+        RefreshSessionId(uuid4().hex),
+    ])
+
+    assert stored_old is not None
+    assert stored_old.rotated_at is not None
+    assert stored_new == new
+    assert missing is None
+
+
+async def test_reused_token_should_revoke_family(
+    refresh_store: DbRefreshStoreImpl,
+    revoke_store: DbRevokeStoreImpl,
+    account: Account,
+    family: RefreshFamilyId,
+):
+    old = make_session(family, account_id=account.identifier)
+    new = make_session(family, old, account_id=account.identifier)
+    await refresh_store.save(old)
+    await refresh_store.rotate(old.identifier, new)
+
+    with pytest.raises(RefreshTokenReusedError) as reused:
+        await refresh_store.rotate(
+            old.identifier, make_session(family, old, account_id=account.identifier)
+        )
+
+    assert set(reused.value.revoked) == {old.identifier.value, new.identifier.value}
+    assert await revoke_store.is_revoked(new.identifier)
+    with pytest.raises(InvalidTokenError):
+        await refresh_store.rotate(
+            new.identifier, make_session(family, new, account_id=account.identifier)
+        )
+
+
+async def test_revoked_session_should_not_rotate(
+    refresh_store: DbRefreshStoreImpl,
+    revoke_store: DbRevokeStoreImpl,
+    account: Account,
+    family: RefreshFamilyId,
+):
+    session = make_session(family, account_id=account.identifier)
+    await refresh_store.save(session)
+
+    await revoke_store.revoke(session.identifier, TTL(60))
+
+    assert await revoke_store.is_revoked(session.identifier)
+    with pytest.raises(InvalidTokenError):
+        await refresh_store.rotate(
+            session.identifier,
+            make_session(family, session, account_id=account.identifier),
+        )
+
+
+async def test_delete_family_should_drop_all_sessions(
+    refresh_store: DbRefreshStoreImpl,
+    revoke_store: DbRevokeStoreImpl,
+    account: Account,
+    family: RefreshFamilyId,
+):
+    old = make_session(family, account_id=account.identifier)
+    new = make_session(family, old, account_id=account.identifier)
+    await refresh_store.save(old)
+    await refresh_store.rotate(old.identifier, new)
+
+    await revoke_store.delete_family(family)
+
+    assert await refresh_store.get_many([old.identifier, new.identifier]) == [None, None]
+
+
+async def test_snapshot_should_contain_active_revocations(
+    refresh_store: DbRefreshStoreImpl,
+    revoke_store: DbRevokeStoreImpl,
+    account: Account,
+    family: RefreshFamilyId,
+):
+    assert isinstance(account.identifier, UUID)
+    session = make_session(family, account_id=account.identifier)
+    await refresh_store.save(session)
+    watermark = int(time.time())
+
+    await revoke_store.revoke(session.identifier, TTL(60))
+    await revoke_store.revoke_account(account.identifier, watermark, TTL(60))
+    await revoke_store.revoke_account(account.identifier, watermark - 1, TTL(60))
+    snapshot = await revoke_store.snapshot()
+
+    assert session.identifier in snapshot.sessions
+    assert account.identifier in snapshot.accounts
+    assert await revoke_store.account_watermark(account.identifier) == watermark
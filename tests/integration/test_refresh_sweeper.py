@@ -0,0 +1,87 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import sqlalchemy as sa
+
+from src.domain.entities import Account
+from src.domain.value_objects import RefreshFamilyId
+
+from src.infra.orm.models import RefreshFamily
+from src.infra.orm.session import async_session
+from src.infra.refresh_store.db import DbRefreshStoreImpl
+from src.infra.refresh_store.sweep import RefreshSweeper
+
+from src.bootstrap import AuthContainer
+
+from tests import make_session
+
+
+EXPIRED_SESSIONS = 5
+LOCK_TIMEOUT = timedelta(milliseconds=50)
+SWEEP_TIMEOUT = 5
+
+
+async def test_sweep_should_delete_only_expired(
+    container: AuthContainer, account: Account
+):
+    session_factory = container.session_factory()
+    refresh_store = DbRefreshStoreImpl(session_factory)
+    expired_family = RefreshFamilyId(uuid4().hex)
+    live_family = RefreshFamilyId(uuid4().hex)
+    expired = [
+        make_session(expired_family, account_id=account.identifier, ttl=-60)
+        for _ in range(EXPIRED_SESSIONS)
+    ]
+    # Истёкший токен в живой семье: удаляется токен, но не семья
+    stale = make_session(live_family, account_id=account.identifier, ttl=-60)
+    live = make_session(live_family, account_id=account.identifier, ttl=3600)
+    for session in [*expired, stale, live]:
+        await refresh_store.save(session)
+
+    # batch_size меньше числа строк: проверяем переход курсора между пачками
+    sweeper = RefreshSweeper(session_factory, batch_size=2)
+    report = await sweeper.sweep(datetime.now(UTC))
+    stored = await refresh_store.get_many([
+        *(session.identifier for session in [*expired, stale]),
+        live.identifier,
+    ])
+    async with async_session(session_factory) as db:
+        families = set(
+            await db.scalars(
+                sa.select(RefreshFamily.fid).where(
+                    RefreshFamily.fid.in_([
+                        UUID(expired_family.value),
+                        UUID(live_family.value),
+                    ])
+                )
+            )
+        )
+
+    assert stored[:-1] == [None] * (EXPIRED_SESSIONS + 1)
+    assert stored[-1] == live
+    assert report.tokens >= EXPIRED_SESSIONS + 1
+    assert families == {UUID(live_family.value)}
+    assert report.families >= 1
+    assert (await sweeper.sweep(datetime.now(UTC))).rows == 0
+
+
+async def test_sweep_should_give_up_on_locked_table(container: AuthContainer):
+    sweeper = RefreshSweeper(
+        container.session_factory(),
+        lock_timeout=LOCK_TIMEOUT,
+        retry_interval=timedelta(0),
+        max_lock_retries=1,
+    )
+
+    # Долгая транзакция держит таблицы: каждая пачка упирается в lock_timeout
+    async with container.engine().begin() as conn:
+        await conn.execute(
+            sa.text(
+                'LOCK TABLE refresh_tokens, refresh_families IN ACCESS EXCLUSIVE MODE'
+            )
+        )
+        async with asyncio.timeout(SWEEP_TIMEOUT):
+            report = await sweeper.sweep(datetime.now(UTC))
+
+    assert report.rows == 0
@@ -3,6 +3,14 @@ from http import HTTPStatus
 import pytest
 from httpx import AsyncClient
 
+from src.domain.entities import Account
+from src.domain.value_objects import Password
+
+from src.application import RegisterCommand
+from src.application.exceptions import AccountAlreadyExistsError
+
+from src.bootstrap import AuthContainer
+
 from tests import (
     INVALID_EMAILS,
     URLS,
@@ -19,6 +27,16 @@ async def test_successful_registation(client: AsyncClient, email: str, password:
     assert r.status_code == HTTPStatus.OK.value, r.json()
 
 
+async def test_registration_should_reject_existing_email(
+    container: AuthContainer, account: Account, password: str
+):
+    service = container.register_service()
+    cmd = RegisterCommand(email=account.email, password=Password(password))
+
+    with pytest.raises(AccountAlreadyExistsError):
+        await service.register(cmd)
+
+
 @pytest.mark.parametrize(('invalid_email', 'reason'), INVALID_EMAILS)
 async def test_registration_should_reject_invalid_email(
     client: AsyncClient, invalid_email: str, reason: str, password: str
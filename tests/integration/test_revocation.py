@@ -0,0 +1,64 @@
+import asyncio
+from http import HTTPStatus
+
+from httpx import AsyncClient
+
+from src.domain.entities import Account
+from src.domain.value_objects import TTL, AccessToken, RefreshSessionId
+
+from src.infra.refresh_store.db import DbRevokeStoreImpl
+from src.infra.revocation import FilteredRevokeStoreImpl, PgRevocationFeedImpl
+
+from src.bootstrap import AuthContainer
+
+from tests import URLS
+
+
+async def login_session(
+    client: AsyncClient, container: AuthContainer, account: Account, password: str
+) -> tuple[str, RefreshSessionId]:
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    access_token = r.json()['access_token']
+    claims = await container.jwt_service().verify_access(AccessToken(access_token))
+
+    assert claims.sid is not None
+    return access_token, RefreshSessionId(claims.sid)
+
+
+async def test_revoked_session_should_reject_access_token(
+    client: AsyncClient, container: AuthContainer, account: Account, password: str
+):
+    access_token, session = await login_session(client, container, account, password)
+
+    await container.revoke_store().revoke(session, TTL(60))
+    r = await client.get(URLS.me, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+
+async def test_pg_feed_should_deliver_revocation(
+    client: AsyncClient, container: AuthContainer, account: Account, password: str
+):
+    _, session = await login_session(client, container, account, password)
+    store = DbRevokeStoreImpl(container.session_factory())
+    feed = PgRevocationFeedImpl(container.engine())
+    worker = FilteredRevokeStoreImpl(store, feed)
+    other = FilteredRevokeStoreImpl(store, feed)
+    for filtered in worker, other:
+        filtered.start()
+    while not (worker.ready and other.ready):
+        await asyncio.sleep(0.01)
+
+    await worker.revoke(session, TTL(60))
+    # Фильтр второго воркера собран до отзыва: узнать о нём он может только из NOTIFY
+    for _ in range(100):
+        if await other.is_revoked(session):
+            break
+        await asyncio.sleep(0.01)
+
+    assert await other.is_revoked(session)
+    await worker.stop()
+    await other.stop()
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from http import HTTPStatus
+from uuid import uuid4
+
+from httpx import AsyncClient
+
+from src.domain.entities import Account
+from src.domain.value_objects import RefreshToken
+
+from src.bootstrap import AuthContainer
+
+from tests import URLS
+
+
+LOGINS = 3
+
+
+async def login(client: AsyncClient, account: Account, password: str) -> dict[str, str]:
+    r = await client.post(
+        URLS.login,
+        json={'email': account.email.value, 'password': password},
+    )
+    assert r.status_code == HTTPStatus.OK.value, r.json()
+    return r.json()
+
+
+def bearer(tokens: dict[str, str]) -> dict[str, str]:
+    return {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+
+async def test_sessions_should_paginate_newest_first(
+    client: AsyncClient, container: AuthContainer, account: Account, password: str
+):
+    logins = [await login(client, account, password) for _ in range(LOGINS)]
+
+    families: list[str] = []
+    cursor = None
+    while True:
+        params = {'limit': 2} | ({'cursor': cursor} if cursor else {})
+        r = await client.get(URLS.sessions, params=params, headers=bearer(logins[-1]))
+        assert r.status_code == HTTPStatus.OK.value, r.json()
+
+        families += [session['family_id'] for session in r.json()['sessions']]
+        if not (cursor := r.json()['next_cursor']):
+            break
+
+    jwt_service = container.jwt_service()
+    expected = [
+        (await jwt_service.verify_refresh(RefreshToken(tokens['refresh_token']))).fid
+        for tokens in reversed(logins)
+    ]
+    assert families == expected
+
+
+async def test_sessions_should_reject_invalid_cursor(
+    client: AsyncClient, account: Account, password: str
+):
+    tokens = await login(client, account, password)
+
+    r = await client.get(URLS.sessions, params={'cursor': 'x'}, headers=bearer(tokens))
+
+    assert r.status_code == HTTPStatus.BAD_REQUEST.value
+
+
+async def test_revoke_session_should_disable_its_refresh_token(
+    client: AsyncClient, account: Account, password: str
+):
+    current, other = (
+        await login(client, account, password),
+        await login(client, account, password),
+    )
+    r = await client.get(URLS.sessions, headers=bearer(current))
+    family_ids = [session['family_id'] for session in r.json()['sessions']]
+
+    # Последний логин - первый в списке
+    r = await client.post(
+        URLS.revoke_session.path(family_id=family_ids[0]), headers=bearer(current)
+    )
+    assert r.status_code == HTTPStatus.NO_CONTENT.value
+
+    r = await client.post(URLS.refresh, json={'refresh_token': other['refresh_token']})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+    r = await client.post(URLS.refresh, json={'refresh_token': current['refresh_token']})
+    assert r.status_code == HTTPStatus.OK.value
+
+
+async def test_revoke_unknown_session_should_return_not_found(
+    client: AsyncClient, account: Account, password: str
+):
+    tokens = await login(client, account, password)
+
+    r = await client.post(
+        URLS.revoke_session.path(family_id=uuid4()), headers=bearer(tokens)
+    )
+
+    assert r.status_code == HTTPStatus.NOT_FOUND.value
+
+
+async def test_logout_should_delete_current_session(
+    client: AsyncClient, account: Account, password: str
+):
+    current, other = (
+        await login(client, account, password),
+        await login(client, account, password),
+    )
+
+    r = await client.post(URLS.logout, headers=bearer(current))
+    assert r.status_code == HTTPStatus.NO_CONTENT.value
+
+    r = await client.post(URLS.refresh, json={'refresh_token': current['refresh_token']})
+    assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+    r = await client.get(URLS.sessions, headers=bearer(other))
+    assert len(r.json()['sessions']) == 1
+
+
+async def test_logout_all_should_revoke_every_token(
+    client: AsyncClient, account: Account, password: str
+):
+    logins = [await login(client, account, password) for _ in range(LOGINS)]
+    # Watermark в секундах: выход в следующую секунду после входов
+    await asyncio.sleep(1 - time.time() % 1)
+
+    r = await client.post(URLS.logout_all, headers=bearer(logins[0]))
+    assert r.status_code == HTTPStatus.NO_CONTENT.value
+
+    for tokens in logins:
+        r = await client.get(URLS.me, headers=bearer(tokens))
+        assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+        r = await client.post(
+            URLS.refresh, json={'refresh_token': tokens['refresh_token']}
+        )
+        assert r.status_code == HTTPStatus.UNAUTHORIZED.value
+
+
+async def test_login_after_logout_all_should_work_in_same_second(
+    client: AsyncClient, account: Account, password: str
+):
+    tokens = await login(client, account, password)
+    r = await client.post(URLS.logout_all, headers=bearer(tokens))
+    assert r.status_code == HTTPStatus.NO_CONTENT.value
+
+    tokens = await login(client, account, password)
+    r = await client.get(URLS.me, headers=bearer(tokens))
+
+    assert r.status_code == HTTPStatus.OK.value, r.json()
@@ -1,4 +1,11 @@
-from src.domain.policies.password import PasswordNotInBlacklistPolicy
+from src.domain.policies.password import (
+    PasswordContainDigitPolicy,
+    PasswordContainLowercasePolicy,
+    PasswordContainUppercasePolicy,
+    PasswordMinLengthPolicy,
+    PasswordNotInBlacklistPolicy,
+    PasswordPolicySuite,
+)
 from src.domain.value_objects.account import Password
 
 
@@ -10,3 +17,25 @@ def test_blacklist_policy_rejects_blacklisted_password_and_accepts_allowed_passw
 
     assert not rejected
     assert accepted
+
+
+def test_suite_should_report_errors_in_policies_order():
+    policies = [
+        PasswordContainLowercasePolicy(),
+        PasswordContainUppercasePolicy(),
+        PasswordContainDigitPolicy(),
+        PasswordMinLengthPolicy(4),
+        PasswordNotInBlacklistPolicy({'ABC'}),
+    ]
+    suite = PasswordPolicySuite(policies)
+
+    ok, errors = suite.validate(Password('ABC'))
+
+    assert not ok
+    assert errors == [
+        policy.error_message()
+        for policy in policies
+        if not policy.validate(Password('ABC'))
+    ]
+    assert suite.validate(Password('ABC'), fail_fast=True) == (False, errors[:1])
+    assert suite.validate(Password('abcD1')) == (True, [])
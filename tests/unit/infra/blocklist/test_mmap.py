@@ -0,0 +1,86 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from src.domain.policies.password import PasswordNotInBlacklistPolicy
+from src.domain.value_objects import Password
+
+from src.infra.blocklist import MmapPasswordBlocklist
+from src.infra.blocklist.build import DumpFormat, build
+from src.infra.blocklist.mmap import (
+    DEFAULT_DIGEST_SIZE,
+    HEADER,
+    MAGIC,
+    MAX_DIGEST_SIZE,
+    VERSION,
+    raw_digest,
+)
+from src.infra.exceptions import InvalidBlocklistFileError
+
+
+def test_plain_dump_should_be_searchable(tmp_path: Path) -> None:
+    passwords = ['password', '123456', 'qwerty', '123456']
+    source = tmp_path / 'passwords.txt'
+    source.write_text('\n'.join(passwords), encoding='utf-8')
+    target = tmp_path / 'blocklist.bin'
+
+    count = build(source, target, fmt=DumpFormat.PLAIN, chunk_size=2)
+    blocklist = MmapPasswordBlocklist(target)
+
+    assert count == len(blocklist) == len(set(passwords))
+    assert 'qwerty' in blocklist
+    assert 'strong_pass' not in blocklist
+
+
+def test_hibp_dump_should_work_with_password_policy(tmp_path: Path) -> None:
+    sha1 = hashlib.sha1(b'password', usedforsecurity=False).hexdigest().upper()
+    source = tmp_path / 'pwned.txt'
+    source.write_text(f'{sha1}:9545824\n', encoding='utf-8')
+    target = tmp_path / 'blocklist.bin'
+
+    build(source, target, fmt=DumpFormat.HIBP)
+    policy = PasswordNotInBlacklistPolicy(MmapPasswordBlocklist(target))
+
+    assert not policy.validate(Password('password'))
+    assert policy.validate(Password('strong_pass'))
+
+
+def test_plain_dump_should_accept_non_utf8_lines(tmp_path: Path) -> None:
+    source = tmp_path / 'passwords.txt'
+    latin1 = b'pass\xe9word'
+    source.write_bytes(latin1 + b'\npassword\n')
+    target = tmp_path / 'blocklist.bin'
+
+    build(source, target, fmt=DumpFormat.PLAIN)
+    blocklist = MmapPasswordBlocklist(target)
+
+    assert 'password' in blocklist
+    assert blocklist.contains_digest(raw_digest(latin1))
+
+
+@pytest.mark.parametrize(
+    'content',
+    [b'', HEADER.pack(MAGIC, VERSION, 0) + bytes(DEFAULT_DIGEST_SIZE)],
+    ids=['empty', 'zero digest size'],
+)
+def test_broken_file_should_be_rejected(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / 'blocklist.bin'
+    path.write_bytes(content)
+
+    with pytest.raises(InvalidBlocklistFileError):
+        MmapPasswordBlocklist(path)
+
+
+@pytest.mark.parametrize('digest_size', [0, MAX_DIGEST_SIZE + 1])
+def test_build_should_reject_invalid_digest_size(
+    tmp_path: Path, digest_size: int
+) -> None:
+    source = tmp_path / 'passwords.txt'
+    source.write_text('qwerty\n')
+    target = tmp_path / 'blocklist.bin'
+
+    with pytest.raises(ValueError, match='digest_size'):
+        build(source, target, fmt=DumpFormat.PLAIN, digest_size=digest_size)
+
+    assert not target.exists()
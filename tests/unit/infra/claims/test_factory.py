@@ -68,3 +68,29 @@ def test_nbf_should_affect_exp(ts: int, sub: str, container: AuthContainer) -> N
     rt = claims_factory.refresh_claims(sub, nbf=nbf)
     assert rt.nbf == nbf
     assert rt.exp == nbf + spec.lifetime.refresh_ttl_seconds
+
+
+def test_pair_claims_should_share_iat(
+    ts: int, sub: str, claims_factory: ClaimsFactory
+) -> None:
+    with time_machine.travel(ts, tick=False):
+        pairs = claims_factory.many_pair_claims([sub, f'{sub}-2'])
+
+    jtis = {claims.jti for pair in pairs for claims in pair}
+
+    assert {claims.iat for pair in pairs for claims in pair} == {ts}
+    assert len(jtis) == len(pairs) * 2
+    assert [access.sub for access, _ in pairs] == [sub, f'{sub}-2']
+
+
+def test_refresh_claims_should_keep_family(
+    claims_factory: ClaimsFactory, sub: str
+) -> None:
+    access, login = claims_factory.pair_claims(sub)
+    _, rotated = claims_factory.pair_claims(sub, fid=login.fid)
+
+    assert access.fid is None
+    assert access.sid == login.jti
+    assert login.fid is not None
+    assert rotated.fid == login.fid
+    assert rotated.jti != login.jti
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from src.domain.value_objects import Password
+
+from src.infra.crypto.executor import ExecutorPasswordHasherImpl
+from src.infra.exceptions import PasswordHasherOverloadedError
+
+
+async def test_hash_should_be_verifiable(password: str) -> None:
+    hasher = ExecutorPasswordHasherImpl(max_workers=1)
+
+    password_hash = await hasher.hash(Password(password))
+
+    assert await hasher.verify(Password(password), password_hash)
+    assert not await hasher.verify(Password(f'{password}!'), password_hash)
+    hasher.shutdown()
+
+
+async def test_should_reject_when_queue_is_full(password: str) -> None:
+    hasher = ExecutorPasswordHasherImpl(max_workers=1, max_pending=1)
+
+    first = asyncio.create_task(hasher.hash(Password(password)))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHasherOverloadedError):
+        await hasher.hash(Password(password))
+
+    assert await first
+    hasher.shutdown()
+
+
+async def test_cancelled_hash_should_hold_slot_until_done(password: str) -> None:
+    hasher = ExecutorPasswordHasherImpl(max_workers=1, max_pending=1)
+
+    first = asyncio.create_task(hasher.hash(Password(password)))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    # Хэш ещё считается в пуле: клиент ушёл, нагрузка осталась
+    with pytest.raises(PasswordHasherOverloadedError):
+        await hasher.hash(Password(password))
+    hasher.shutdown()
@@ -0,0 +1,94 @@
+import time
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import Account
+from src.domain.exceptions import InvalidTokenError
+from src.domain.value_objects import AccessToken, Email, PasswordHash
+
+from src.infra.jwt_service.signers import encode_payload
+
+from src.bootstrap import AuthContainer
+
+
+# Час вперёд: дальше любого clock_skew
+FUTURE = 3600
+
+
+@pytest.fixture
+def fake_account() -> Account:
+    return Account(uuid4(), Email('a@b.c'), PasswordHash(''))
+
+
+async def test_verify_access_should_return_claims(
+    container: AuthContainer, fake_account: Account
+):
+    jwt_service = container.jwt_service()
+    pair = await jwt_service.issue_pair(fake_account, scopes=[])
+
+    claims = await jwt_service.verify_access(pair.access_token)
+
+    assert claims.sub == str(fake_account.identifier)
+    assert claims.typ == 'access'
+    assert claims == await jwt_service.verify_access(pair.access_token)  # cache
+
+
+async def test_verify_access_should_reject_refresh_token(
+    container: AuthContainer, fake_account: Account
+):
+    jwt_service = container.jwt_service()
+    pair = await jwt_service.issue_pair(fake_account, scopes=[])
+    await jwt_service.verify_refresh(pair.refresh_token)
+
+    with pytest.raises(InvalidTokenError):
+        await jwt_service.verify_access(AccessToken(pair.refresh_token.value))
+
+
+async def test_verify_access_should_reject_bad_signature(
+    container: AuthContainer, fake_account: Account
+):
+    jwt_service = container.jwt_service()
+    pair = await jwt_service.issue_pair(fake_account, scopes=[])
+    header, payload, _ = pair.access_token.value.split('.')
+
+    with pytest.raises(InvalidTokenError):
+        await jwt_service.verify_access(AccessToken(f'{header}.{payload}.c2lnbg'))
+
+
+async def test_introspect_should_keep_order_and_report_invalid(
+    container: AuthContainer, fake_account: Account
+):
+    jwt_service = container.jwt_service()
+    pair = await jwt_service.issue_pair(fake_account, scopes=[])
+    tokens = [pair.access_token.value, 'a.b.c', pair.refresh_token.value]
+
+    results = await jwt_service.introspect([*tokens, pair.access_token.value])
+
+    assert [result.active for result in results] == [True, False, True, True]
+    assert results[0] == results[3]
+    assert results[2].claims is not None
+    assert results[2].claims.typ == 'refresh'
+
+
+@pytest.mark.parametrize(
+    'changes',
+    [
+        {'aud': ['another-service']},
+        {'iss': 'another-issuer'},
+        {'nbf': int(time.time()) + FUTURE},
+    ],
+    ids=['aud', 'iss', 'nbf'],
+)
+async def test_verify_access_should_reject_foreign_claims(
+    container: AuthContainer, changes: dict[str, Any]
+):
+    claims = container.claims_factory().access_claims('1').as_dict(exclude_none=True)
+    # Подписан нашим ключом, но выпущен не для нас или ещё не действует
+    token = container.key_provider().signer().sign(encode_payload(claims | changes))
+    jwt_service = container.jwt_service()
+
+    with pytest.raises(InvalidTokenError):
+        await jwt_service.verify_access(AccessToken(token))
+    assert not (await jwt_service.introspect([token]))[0].active
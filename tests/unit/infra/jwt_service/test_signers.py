@@ -0,0 +1,21 @@
+from jose import jwt
+
+from src.domain.factories.claims import ClaimsFactory
+
+from src.infra.jwt_service.signers import HS256Signer, encode_payload
+
+
+def test_hs256_signer_should_match_jose(claims_factory: ClaimsFactory, sub: str):
+    secret = 'secret'
+    claims = claims_factory.access_claims(sub).as_dict()
+
+    token = HS256Signer(secret).sign(encode_payload(claims))
+
+    assert token == jwt.encode(claims, secret, algorithm='HS256')
+    assert jwt.decode(token, secret, audience=claims['aud'][0])['sub'] == sub
+
+
+def test_hs256_signer_should_put_kid_into_header(sub: str):
+    token = HS256Signer('secret', kid='k1').sign(encode_payload({'sub': sub}))
+
+    assert jwt.get_unverified_header(token)['kid'] == 'k1'
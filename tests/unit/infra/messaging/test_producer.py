@@ -0,0 +1,100 @@
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from src.infra.messaging.broker import FileBrokerImpl, MemoryBrokerImpl
+from src.infra.messaging.producer import BatchingProducerImpl
+
+
+TOPIC = 'account.registered'
+RECORDS = 20
+PARTITIONS = 3
+# Linger дольше теста: пачку отправляет только размер или flush
+LONG_LINGER = timedelta(minutes=1)
+
+
+class BrokenBroker:
+    def partitions(self, topic: str) -> int:
+        return 1
+
+    async def append(self, topic: str, partition: int, batch: bytes, count: int) -> int:
+        raise ConnectionError('Broker is down')
+
+
+async def test_linger_should_merge_records_into_one_request():
+    broker = MemoryBrokerImpl()
+    producer = BatchingProducerImpl(broker, linger=timedelta(milliseconds=10))
+
+    metadata = await asyncio.gather(
+        *(producer.send_and_wait(TOPIC, f'{i}'.encode()) for i in range(RECORDS))
+    )
+
+    assert broker.requests == 1
+    assert [m.offset for m in metadata] == list(range(RECORDS))
+    assert [r.value for r in broker.records(TOPIC, 0)] == [
+        f'{i}'.encode() for i in range(RECORDS)
+    ]
+
+
+async def test_full_batch_should_not_wait_for_linger():
+    broker = MemoryBrokerImpl()
+    producer = BatchingProducerImpl(broker, linger=LONG_LINGER, max_batch_size=1)
+
+    metadata = await producer.send_and_wait(TOPIC, b'value')
+
+    assert metadata.offset == 0
+    assert broker.requests == 1
+
+
+async def test_same_key_should_land_in_same_partition():
+    broker = MemoryBrokerImpl(partitions=PARTITIONS)
+    producer = BatchingProducerImpl(broker, linger=timedelta())
+
+    metadata = [
+        await producer.send_and_wait(TOPIC, f'{i}'.encode(), key='account-1')
+        for i in range(RECORDS)
+    ]
+
+    assert len({m.partition for m in metadata}) == 1
+    assert [m.offset for m in metadata] == list(range(RECORDS))
+
+
+async def test_compressed_batch_should_keep_records():
+    broker = MemoryBrokerImpl()
+    producer = BatchingProducerImpl(broker, linger=LONG_LINGER, compression='gzip')
+
+    futures = [
+        producer.send(TOPIC, b'{"i": 1}', key='k', headers={'type': 'AccountRegistered'})
+        for _ in range(RECORDS)
+    ]
+    await producer.flush()
+
+    assert all(future.done() for future in futures)
+    [record, *_] = broker.records(TOPIC, 0)
+    assert record.value == b'{"i": 1}'
+    assert record.key == 'k'
+    assert record.headers == {'type': 'AccountRegistered'}
+
+
+async def test_broker_error_should_fail_whole_batch():
+    producer = BatchingProducerImpl(BrokenBroker(), linger=LONG_LINGER)
+
+    futures = [producer.send(TOPIC, b'value') for _ in range(RECORDS)]
+    await producer.flush()
+
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result()
+
+
+async def test_file_broker_should_continue_offsets_after_restart(tmp_path: Path):
+    first = BatchingProducerImpl(FileBrokerImpl(tmp_path), linger=timedelta())
+    await first.send_and_wait(TOPIC, b'before')
+
+    broker = FileBrokerImpl(tmp_path)
+    metadata = await BatchingProducerImpl(broker).send_and_wait(TOPIC, b'after')
+
+    assert metadata.offset == 1
+    assert [r.value for r in broker.records(TOPIC, 0)] == [b'before', b'after']
@@ -0,0 +1,57 @@
+import pytest
+
+from src.infra.messaging.outbox_publisher import ClassRegistry
+
+
+class Event:
+    pass
+
+
+class Registered(Event):
+    pass
+
+
+class Confirmed(Registered):
+    pass
+
+
+def test_value_of_base_class_should_match_subclasses():
+    registry = ClassRegistry[Event, str]()
+    registry.add(Event, 'audit')
+    registry.add(Registered, 'registered')
+
+    assert registry.resolve(Confirmed) == ('registered', 'audit')
+    assert registry.resolve(Event) == ('audit',)
+
+
+def test_registration_should_rebuild_resolved_types():
+    registry = ClassRegistry[Event, str]()
+    registry.add(Event, 'audit')
+    assert registry.resolve(Registered) == ('audit',)
+
+    registry.add(Registered, 'registered')
+
+    assert registry.resolve(Registered) == ('registered', 'audit')
+
+
+def test_frozen_registry_should_reject_registration():
+    registry = ClassRegistry[Event, str]()
+    registry.add(Registered, 'registered')
+    registry.freeze()
+
+    assert registry.resolve(Confirmed) == ('registered',)
+    with pytest.raises(RuntimeError):
+        registry.add(Event, 'audit')
+
+
+def test_register_should_reuse_single_instance():
+    registry = ClassRegistry[Event, object]()
+
+    @registry.register(Event)
+    class Publisher:
+        pass
+
+    [first] = registry.resolve(Registered)
+    [second] = registry.resolve(Confirmed)
+    assert first is second
+    assert isinstance(first, Publisher)
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from src.infra.messaging.retry import RetryPolicy
+
+
+BASE_DELAY = timedelta(seconds=1)
+MAX_DELAY = timedelta(seconds=30)
+MAX_ATTEMPTS = 10
+SAMPLES = 200
+
+
+def test_delay_should_double_with_jitter():
+    policy = RetryPolicy(BASE_DELAY, MAX_DELAY, MAX_ATTEMPTS)
+
+    for attempts in range(1, 5):
+        cap = BASE_DELAY * 2 ** (attempts - 1)
+        delays = {policy.delay(attempts) for _ in range(SAMPLES)}
+
+        assert all(d is not None and cap / 2 <= d <= cap for d in delays)
+        # Разброс есть: повторы строк одной аварии не совпадают
+        assert len(delays) > 1
+
+
+def test_delay_should_not_exceed_max_delay():
+    policy = RetryPolicy(BASE_DELAY, MAX_DELAY, max_attempts=1_000)
+
+    delay = policy.delay(500)
+
+    assert delay is not None
+    assert delay <= MAX_DELAY
+
+
+def test_exhausted_attempts_should_have_no_delay():
+    policy = RetryPolicy(BASE_DELAY, MAX_DELAY, MAX_ATTEMPTS)
+
+    assert policy.delay(MAX_ATTEMPTS - 1) is not None
+    assert policy.delay(MAX_ATTEMPTS) is None
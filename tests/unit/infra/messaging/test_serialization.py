@@ -0,0 +1,77 @@
+from uuid import uuid4
+
+import pytest
+
+from src.domain.events import AccountRegistered, DomainEvent
+from src.domain.value_objects import Email
+
+from src.infra.exceptions import UnknownEventError
+from src.infra.messaging import serialization
+from src.infra.messaging.outbox_publisher import UserRegisteredPublisher, event_decoders
+from src.infra.messaging.serialization import (
+    MSGPACK,
+    EventSerializers,
+    JsonCodecImpl,
+    MsgpackCodecImpl,
+    codec_for,
+)
+from src.infra.messaging.transport import encode_headers
+
+
+@pytest.fixture
+def event() -> AccountRegistered:
+    return AccountRegistered(email=Email('user@example.com'), account_id=uuid4())
+
+
+def test_payload_should_match_as_dict(event: AccountRegistered):
+    serializer = EventSerializers().get(AccountRegistered)
+
+    assert serializer.payload(event) == event.as_dict()
+
+
+def test_compile_should_cover_subclasses():
+    serializers = EventSerializers()
+    serializers.compile()
+
+    assert serializers.get(AccountRegistered).event_type is AccountRegistered
+    assert serializers.get(DomainEvent).event_type is DomainEvent
+
+
+def test_decoder_should_restore_event_by_headers(event: AccountRegistered):
+    codec = JsonCodecImpl()
+    value = codec.encode(EventSerializers().get(AccountRegistered).payload(event))
+    headers = encode_headers(UserRegisteredPublisher().headers, codec)
+
+    assert event_decoders.decode(headers, value) == event
+
+
+def test_decoder_should_reject_unknown_version(event: AccountRegistered):
+    codec = JsonCodecImpl()
+    value = codec.encode(EventSerializers().get(AccountRegistered).payload(event))
+    headers = {'type': UserRegisteredPublisher.event_type, 'v': '999'}
+
+    with pytest.raises(UnknownEventError):
+        event_decoders.decode(headers, value)
+
+
+def test_msgpack_should_round_trip(event: AccountRegistered):
+    pytest.importorskip('msgpack')
+    codec = MsgpackCodecImpl()
+    value = codec.encode(EventSerializers().get(AccountRegistered).payload(event))
+    headers = {
+        name: header.encode()
+        for name, header in encode_headers(
+            UserRegisteredPublisher().headers, codec
+        ).items()
+    }
+
+    assert event_decoders.decode(headers, value) == event
+
+
+def test_msgpack_content_should_be_unknown_without_msgpack(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(serialization, 'msgpack', None)
+
+    with pytest.raises(UnknownEventError):
+        codec_for(MSGPACK)
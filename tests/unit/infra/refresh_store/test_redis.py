@@ -0,0 +1,164 @@
+import time
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.domain.exceptions import InvalidTokenError, RefreshTokenReusedError
+from src.domain.value_objects import (
+    TTL,
+    RefreshFamilyId,
+    RefreshSessionId,
+    SessionInfo,
+)
+
+from src.infra.refresh_store.redis import RedisRefreshStoreImpl, RedisRevokeStoreImpl
+
+from tests import SESSION_TTL, make_session
+
+
+FAMILIES = 5
+
+
+@pytest.fixture
+def redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def refresh_store(redis: FakeAsyncRedis) -> RedisRefreshStoreImpl:
+    return RedisRefreshStoreImpl(redis)
+
+
+@pytest.fixture
+def revoke_store(redis: FakeAsyncRedis) -> RedisRevokeStoreImpl:
+    return RedisRevokeStoreImpl(redis)
+
+
+async def test_rotate_should_replace_session(
+    refresh_store: RedisRefreshStoreImpl, redis: FakeAsyncRedis
+):
+    family = RefreshFamilyId(uuid4().hex)
+    old = make_session(family)
+    new = make_session(family, parent=old)
+    await refresh_store.save(old)
+
+    await refresh_store.rotate(old.identifier, new)
+    stored_old, stored_new = await refresh_store.get_many([
+        old.identifier,
+        new.identifier,
+    ])
+
+    assert stored_old is not None
+    assert stored_old.rotated_at is not None
+    assert stored_old.version == 1
+    assert stored_new == new
+    assert 0 < await redis.ttl(f'auth:rt:{new.identifier.value}') <= SESSION_TTL
+
+
+async def test_reused_token_should_revoke_family(
+    refresh_store: RedisRefreshStoreImpl, revoke_store: RedisRevokeStoreImpl
+):
+    family = RefreshFamilyId(uuid4().hex)
+    old = make_session(family)
+    new = make_session(family, parent=old)
+    await refresh_store.save(old)
+    await refresh_store.rotate(old.identifier, new)
+
+    with pytest.raises(RefreshTokenReusedError) as reused:
+        await refresh_store.rotate(old.identifier, make_session(family, parent=old))
+
+    assert set(reused.value.revoked) == {old.identifier.value, new.identifier.value}
+    assert await revoke_store.is_revoked(new.identifier)
+    with pytest.raises(InvalidTokenError):
+        await refresh_store.rotate(new.identifier, make_session(family, parent=new))
+
+
+async def test_revoked_session_should_not_rotate(
+    refresh_store: RedisRefreshStoreImpl, revoke_store: RedisRevokeStoreImpl
+):
+    family = RefreshFamilyId(uuid4().hex)
+    session = make_session(family)
+    await refresh_store.save(session)
+
+    await revoke_store.revoke(session.identifier, TTL(60))
+
+    assert await revoke_store.is_revoked(session.identifier)
+    with pytest.raises(InvalidTokenError):
+        await refresh_store.rotate(session.identifier, make_session(family, session))
+
+
+async def test_delete_family_should_drop_all_sessions(
+    refresh_store: RedisRefreshStoreImpl, revoke_store: RedisRevokeStoreImpl
+):
+    family = RefreshFamilyId(uuid4().hex)
+    old = make_session(family)
+    new = make_session(family, parent=old)
+    await refresh_store.save(old)
+    await refresh_store.rotate(old.identifier, new)
+
+    await revoke_store.delete_family(family)
+
+    assert await refresh_store.get_many([old.identifier, new.identifier]) == [None, None]
+
+
+async def test_snapshot_should_contain_active_revocations(
+    refresh_store: RedisRefreshStoreImpl, revoke_store: RedisRevokeStoreImpl
+):
+    family = RefreshFamilyId(uuid4().hex)
+    old = make_session(family)
+    new = make_session(family, parent=old)
+    revoked = RefreshSessionId(uuid4().hex)
+    account_id = uuid4()
+    await refresh_store.save(old)
+    await refresh_store.rotate(old.identifier, new)
+    with pytest.raises(RefreshTokenReusedError):
+        await refresh_store.rotate(old.identifier, make_session(family, parent=old))
+
+    await revoke_store.revoke(revoked, TTL(60))
+    await revoke_store.revoke_account(account_id, int(time.time()), TTL(60))
+    snapshot = await revoke_store.snapshot()
+
+    assert set(snapshot.sessions) == {old.identifier, new.identifier, revoked}
+    assert snapshot.accounts == [account_id]
+    assert await revoke_store.account_watermark(account_id) is not None
+
+
+async def test_list_families_should_paginate_newest_first(
+    refresh_store: RedisRefreshStoreImpl,
+):
+    account_id = uuid4()
+    families = [RefreshFamilyId(uuid4().hex) for _ in range(FAMILIES)]
+    sessions = [make_session(family, account_id=account_id) for family in families]
+    for session in sessions:
+        await refresh_store.save(session)
+    await refresh_store.rotate(
+        sessions[0].identifier,
+        make_session(families[0], parent=sessions[0], account_id=account_id),
+    )
+
+    listed: list[SessionInfo] = []
+    after = None
+    while page := await refresh_store.list_families(account_id, 2, after=after):
+        listed += page
+        after = page[-1].cursor
+
+    assert [info.family for info in listed] == families[::-1]
+    assert listed[-1].last_used_at is not None
+    assert listed[0].last_used_at is None
+
+
+async def test_delete_families_should_skip_other_accounts(
+    refresh_store: RedisRefreshStoreImpl, revoke_store: RedisRevokeStoreImpl
+):
+    account_id, other_id = uuid4(), uuid4()
+    own = [make_session(RefreshFamilyId(uuid4().hex), account_id=account_id)]
+    own.append(make_session(RefreshFamilyId(uuid4().hex), account_id=account_id))
+    other = make_session(RefreshFamilyId(uuid4().hex), account_id=other_id)
+    for session in [*own, other]:
+        await refresh_store.save(session)
+
+    assert await revoke_store.delete_families(account_id, [other.family]) == 0
+    assert await revoke_store.delete_families(account_id) == len(own)
+    assert await refresh_store.list_families(account_id, FAMILIES) == []
+    assert await refresh_store.get(other.identifier) == other
@@ -0,0 +1,26 @@
+from uuid import uuid4
+
+from src.infra.revocation import BloomFilter
+
+
+CAPACITY = 10_000
+ERROR_RATE = 0.01
+
+
+def test_bloom_should_not_have_false_negatives():
+    keys = [uuid4().hex for _ in range(CAPACITY)]
+
+    bloom = BloomFilter.from_keys(keys, CAPACITY, ERROR_RATE)
+
+    assert all(key in bloom for key in keys)
+    assert not bloom.saturated
+
+
+def test_bloom_false_positive_rate_should_match_capacity():
+    bloom = BloomFilter.from_keys(
+        (uuid4().hex for _ in range(CAPACITY)), CAPACITY, ERROR_RATE
+    )
+
+    false_positives = sum(uuid4().hex in bloom for _ in range(CAPACITY))
+
+    assert false_positives < CAPACITY * ERROR_RATE * 2
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.domain.ports import RevokeStore
+from src.domain.value_objects import (
+    TTL,
+    RefreshFamilyId,
+    RefreshSessionId,
+    RevocationSnapshot,
+)
+
+from src.infra.refresh_store.redis import RedisRevokeStoreImpl
+from src.infra.revocation import FilteredRevokeStoreImpl, LocalRevocationFeedImpl
+
+
+CHECKS = 100
+# Ложные срабатывания фильтра на CHECKS * 2 проверках при error_rate=0.001
+MAX_STORE_CALLS = 5
+
+
+class CountingRevokeStore(RevokeStore):
+    """Считает обращения к store: всё, что фильтр не ответил сам."""
+
+    def __init__(self, store: RevokeStore) -> None:
+        self.store = store
+        self.calls = 0
+
+    async def is_revoked(self, refresh_id: RefreshSessionId) -> bool:
+        self.calls += 1
+        return await self.store.is_revoked(refresh_id)
+
+    async def revoke(self, refresh_id: RefreshSessionId, ttl: TTL) -> None:
+        await self.store.revoke(refresh_id, ttl)
+
+    async def delete_family(self, family: RefreshFamilyId) -> None:
+        await self.store.delete_family(family)
+
+    async def delete_families(
+        self, account_id: UUID, families: Sequence[RefreshFamilyId] | None = None
+    ) -> int:
+        return await self.store.delete_families(account_id, families)
+
+    async def revoke_account(
+        self, account_id: UUID, issued_before: int, ttl: TTL
+    ) -> None:
+        await self.store.revoke_account(account_id, issued_before, ttl)
+
+    async def account_watermark(self, account_id: UUID) -> int | None:
+        self.calls += 1
+        return await self.store.account_watermark(account_id)
+
+    async def snapshot(self) -> RevocationSnapshot:
+        return await self.store.snapshot()
+
+    async def publish_revoked(self, refresh_ids: Sequence[RefreshSessionId]) -> None:
+        await self.store.publish_revoked(refresh_ids)
+
+
+@pytest.fixture
+def store() -> CountingRevokeStore:
+    return CountingRevokeStore(
+        RedisRevokeStoreImpl(FakeAsyncRedis(decode_responses=True))
+    )
+
+
+@pytest.fixture
+def feed() -> LocalRevocationFeedImpl:
+    return LocalRevocationFeedImpl()
+
+
+async def started(
+    store: RevokeStore, feed: LocalRevocationFeedImpl
+) -> FilteredRevokeStoreImpl:
+    filtered = FilteredRevokeStoreImpl(store, feed, capacity=1000)
+    filtered.start()
+    while not filtered.ready:
+        await asyncio.sleep(0)
+    return filtered
+
+
+async def test_not_revoked_should_be_answered_locally(
+    store: CountingRevokeStore, feed: LocalRevocationFeedImpl
+):
+    filtered = await started(store, feed)
+
+    for _ in range(CHECKS):
+        assert not await filtered.is_revoked(RefreshSessionId(uuid4().hex))
+        assert await filtered.account_watermark(uuid4()) is None
+
+    await filtered.stop()
+    assert store.calls < MAX_STORE_CALLS
+
+
+async def test_revocation_should_reach_other_worker(
+    store: CountingRevokeStore, feed: LocalRevocationFeedImpl
+):
+    worker, other = await started(store, feed), await started(store, feed)
+    session = RefreshSessionId(uuid4().hex)
+    account_id = uuid4()
+    watermark = int(time.time())
+
+    await worker.revoke(session, TTL(60))
+    await worker.revoke_account(account_id, watermark, TTL(60))
+    await asyncio.sleep(0)
+
+    assert await other.is_revoked(session)
+    assert await other.account_watermark(account_id) == watermark
+    await worker.stop()
+    await other.stop()
+
+
+async def test_filter_should_warm_up_from_snapshot(
+    store: CountingRevokeStore, feed: LocalRevocationFeedImpl
+):
+    session = RefreshSessionId(uuid4().hex)
+    await store.revoke(session, TTL(60))
+
+    filtered = await started(store, feed)
+
+    assert await filtered.is_revoked(session)
+    await filtered.stop()
+
+
+async def test_not_started_filter_should_ask_store(
+    store: CountingRevokeStore, feed: LocalRevocationFeedImpl
+):
+    filtered = FilteredRevokeStoreImpl(store, feed, resync_interval=timedelta(seconds=1))
+
+    assert not await filtered.is_revoked(RefreshSessionId(uuid4().hex))
+    assert store.calls == 1
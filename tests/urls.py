@@ -36,5 +36,12 @@ class URLS:
     """
 
     login: URL = API / 'login'
+    refresh: URL = API / 'refresh'
     register: str = API / 'register'
     me: URL = API / 'me'
+    sessions: URL = API / 'sessions'
+    revoke_session: URL = API / 'sessions/{family_id}/revoke'
+    logout: URL = API / 'logout'
+    logout_all: URL = API / 'logout/all'
+    introspect: URL = API / 'introspect'
+    jwks: URL = API / '.well-known/jwks.json'